@@ -33,6 +33,10 @@ class BaseLayout:
                         font=("SF Pro Display", 18, "bold"),
                         background="#A0A0A0",
                         foreground="#000000")
+        style.configure("ConnectionStatus.TLabel",
+                        font=("SF Pro Text", 12, "bold"),
+                        background="#A0A0A0",
+                        foreground="#B00020")
         style.configure("Footer.TLabel",
                         font=("SF Pro Text", 12),
                         background="#A0A0A0",
@@ -47,6 +51,35 @@ class BaseLayout:
         )
         self.header_title.pack(side=tk.LEFT, pady=16, padx=6)
 
+        self.connection_label = ttk.Label(self.header_frame, text="", style="ConnectionStatus.TLabel")
+        self.pending_writes_label = ttk.Label(self.header_frame, text="", style="ConnectionStatus.TLabel")
+
+    def set_connection_state(self, state, retry_in=0, read_only=False):
+        if state == "closed":
+            self.connection_label.pack_forget()
+            return
+
+        if state == "open":
+            text = f"Backend offline - retrying in {retry_in:.0f}s" if retry_in else "Backend offline"
+            if read_only:
+                text += " (showing saved data, read-only)"
+        else:
+            text = "Reconnecting to backend..."
+        self.connection_label.config(text=text)
+        self.connection_label.pack(side=tk.RIGHT, pady=16, padx=12)
+
+    def set_pending_writes(self, pending, conflicts=0):
+        parts = []
+        if pending:
+            parts.append(f"{pending} change{'s' if pending != 1 else ''} waiting to sync")
+        if conflicts:
+            parts.append(f"{conflicts} could not be applied")
+        if not parts:
+            self.pending_writes_label.pack_forget()
+            return
+        self.pending_writes_label.config(text=", ".join(parts))
+        self.pending_writes_label.pack(side=tk.RIGHT, pady=16, padx=12)
+
     def _setup_footer(self):
         footer_container = tk.Frame(self.footer_frame, bg="#A0A0A0")
         footer_container.pack(expand=True, fill=tk.BOTH, padx=20, pady=10)
@@ -0,0 +1,121 @@
+import itertools
+import tkinter as tk
+from tkinter import ttk
+
+from components.id_dropdown_component import IdDropdownComponent
+
+
+class BulkEntryGridComponent(tk.Frame):
+    # Spreadsheet-like grid of input rows built from the same fields_config as DetailFormComponent
+    # ('entry', 'dropdown' and 'id_dropdown'). Each row gets a status cell for per-row errors.
+    def __init__(self, parent, fields_config: list, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        self.fields_config = fields_config
+        self._rows = {}
+        self._row_ids = itertools.count(1)
+        self._setup_ui()
+
+    def _setup_ui(self):
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(self, bg=self.cget('bg'), highlightthickness=0)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+
+        self.rows_frame = tk.Frame(self.canvas, bg=self.cget('bg'))
+        self.canvas.create_window((0, 0), window=self.rows_frame, anchor="nw")
+        self.rows_frame.bind("<Configure>",
+                             lambda event: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+
+        for column, field in enumerate(self.fields_config):
+            ttk.Label(self.rows_frame, text=field['label'], font=("Arial", 10, "bold")).grid(
+                row=0, column=column, padx=2, pady=(0, 4), sticky="w")
+        ttk.Label(self.rows_frame, text="Status", font=("Arial", 10, "bold")).grid(
+            row=0, column=len(self.fields_config), padx=2, pady=(0, 4), sticky="w")
+
+    def _create_cell(self, field):
+        field_type = field.get('type', 'entry')
+        if field_type == 'id_dropdown':
+            widget = IdDropdownComponent(self.rows_frame, width=field.get('width', 16))
+            widget.set_options(field.get('options', {}))
+            return widget
+        if field_type == 'dropdown':
+            return ttk.Combobox(self.rows_frame, values=field.get('options', []), state="readonly",
+                                width=field.get('width', 10))
+        return ttk.Entry(self.rows_frame, width=field.get('width', 16))
+
+    @staticmethod
+    def _get_cell(widget):
+        if isinstance(widget, IdDropdownComponent):
+            return widget.get_selected_id() or ''
+        return widget.get().strip()
+
+    @staticmethod
+    def _set_cell(widget, value):
+        if isinstance(widget, IdDropdownComponent):
+            widget.set_selected_id(value)
+        elif isinstance(widget, ttk.Combobox):
+            widget.set(value)
+        else:
+            widget.delete(0, tk.END)
+            widget.insert(0, value)
+
+    def add_row(self, values: dict = None):
+        row_id = next(self._row_ids)
+        cells = {}
+        for column, field in enumerate(self.fields_config):
+            widget = self._create_cell(field)
+            widget.grid(row=row_id, column=column, padx=2, pady=1, sticky="ew")
+            if values and values.get(field['key']) is not None:
+                self._set_cell(widget, str(values[field['key']]))
+            cells[field['key']] = widget
+
+        status = ttk.Label(self.rows_frame, text="", foreground="#D32F2F")
+        status.grid(row=row_id, column=len(self.fields_config), padx=2, pady=1, sticky="w")
+        self._rows[row_id] = {"cells": cells, "status": status}
+        return row_id
+
+    def get_row(self, row_id):
+        cells = self._rows[row_id]["cells"]
+        return {key: self._get_cell(widget) for key, widget in cells.items()}
+
+    def get_rows(self):
+        return [(row_id, self.get_row(row_id)) for row_id in self._rows]
+
+    def row_ids(self):
+        return list(self._rows)
+
+    def set_options(self, key, options):
+        for field in self.fields_config:
+            if field['key'] == key:
+                field['options'] = options
+        for row in self._rows.values():
+            widget = row["cells"].get(key)
+            if isinstance(widget, IdDropdownComponent):
+                selected = widget.get_selected_id()
+                widget.set_options(options)
+                if selected:
+                    widget.set_selected_id(selected)
+            elif isinstance(widget, ttk.Combobox):
+                widget["values"] = options
+
+    def set_row_status(self, row_id, text, error=True):
+        row = self._rows.get(row_id)
+        if row is not None:
+            row["status"].config(text=text, foreground="#D32F2F" if error else "#2E7D32")
+
+    def remove_rows(self, row_ids):
+        for row_id in row_ids:
+            row = self._rows.pop(row_id, None)
+            if row is None:
+                continue
+            for widget in row["cells"].values():
+                widget.destroy()
+            row["status"].destroy()
+
+    def clear(self):
+        self.remove_rows(list(self._rows))
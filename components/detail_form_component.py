@@ -126,29 +126,23 @@ class DetailFormComponent(tk.Frame):
         button_frame.grid_columnconfigure(2, weight=0)
         button_column_start = 1
 
-        if self.on_save_callback:
-            ttk.Button(button_frame, text="Save", command=self.on_save_callback, style="Save.TButton").grid(row=0,
-                                                                                                            column=button_column_start,
-                                                                                                            padx=5,
-                                                                                                            pady=5)
-            button_column_start += 1
-        if self.on_update_callback:
-            ttk.Button(button_frame, text="Update", command=self.on_update_callback, style="Update.TButton").grid(row=0,
-                                                                                                                  column=button_column_start,
-                                                                                                                  padx=5,
-                                                                                                                  pady=5)
-            button_column_start += 1
-        if self.on_delete_callback:
-            ttk.Button(button_frame, text="Delete", command=self.on_delete_callback, style="Delete.TButton").grid(row=0,
-                                                                                                                  column=button_column_start,
-                                                                                                                  padx=5,
-                                                                                                                  pady=5)
-            button_column_start += 1
+        # Save / Update / Delete, disabled by set_busy() while their request is in flight.
+        self._action_buttons = []
+        for text, callback, style in (("Save", self.on_save_callback, "Save.TButton"),
+                                      ("Update", self.on_update_callback, "Update.TButton"),
+                                      ("Delete", self.on_delete_callback, "Delete.TButton")):
+            if callback:
+                button = ttk.Button(button_frame, text=text, command=callback, style=style)
+                button.grid(row=0, column=button_column_start, padx=5, pady=5)
+                self._action_buttons.append(button)
+                button_column_start += 1
         if self.on_cancel_callback:
-            ttk.Button(button_frame, text="Cancel", command=self.on_cancel_callback, style="Cancel.TButton").grid(row=0,
-                                                                                                                  column=button_column_start,
-                                                                                                                  padx=5,
-                                                                                                                  pady=5)
+            ttk.Button(button_frame, text="Cancel", command=self.on_cancel_callback, style="Cancel.TButton").grid(
+                row=0, column=button_column_start, padx=5, pady=5)
+
+    def set_busy(self, busy: bool):
+        for button in self._action_buttons:
+            button.config(state="disabled" if busy else "normal")
 
     def set_data(self, data: dict):
         for field in self.fields_config:
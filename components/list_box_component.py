@@ -3,11 +3,39 @@ from tkinter import ttk
 
 
 class ListBoxComponent(tk.Frame):
-    def __init__(self, parent, columns: list, display_headings: dict, *args, **kwargs):
+    def __init__(self, parent, columns: list, display_headings: dict, *args, virtual: bool = False,
+                 buffer_rows: int = 20, multi_select: bool = False, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.columns = columns
         self.display_headings = display_headings
 
+        # In virtual mode only a fixed pool of Treeview items (visible rows + buffer) exists;
+        # their values are rewritten from self._rows as the user scrolls.
+        self.virtual = virtual
+        self.buffer_rows = buffer_rows
+        self._rows = []
+        # id -> position in self._rows, so rows can be found by id without a scan. Appends extend it;
+        # a middle insert or remove shifts only the positions after it (see _shift_virtual_index).
+        self._row_index = {}
+        self._offset = 0
+        self._visible_rows = 1
+        self._pool = []
+        self._pool_positions = {}
+        self._attached = []
+        self._selected_index = None
+        self._select_callback = None
+
+        # With multi_select, rows are also selectable with Ctrl/Shift-click and Ctrl+A. In virtual
+        # mode the selection is kept as row ids, since pool items are reused while scrolling.
+        self.multi_select = multi_select
+        self._selected_keys = set()
+
+        # Outside virtual mode rows are keyed by their id (first column), which is also used
+        # as the Treeview iid, so set_items() only touches rows that actually changed.
+        self._row_order = []
+        self._row_values = {}
+        self._unkeyed_rows = False
+
         style = ttk.Style()
         style.theme_use('clam')
 
@@ -54,31 +82,444 @@ class ListBoxComponent(tk.Frame):
             self.tree.heading(col, text=self.display_headings.get(col, col))
             self.tree.column(col, anchor="center")
 
-        scrollbar_y = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview, style="Vertical.TScrollbar")
+        self.scrollbar_y = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview,
+                                         style="Vertical.TScrollbar")
         scrollbar_x = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview, style="Horizontal.TScrollbar")
-        self.tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+
+        if self.virtual:
+            self.tree.configure(selectmode="extended" if self.multi_select else "browse",
+                                xscrollcommand=scrollbar_x.set)
+            if self.multi_select:
+                self.tree.bind("<Button-1>", lambda event: self._on_virtual_click(event, "single"))
+                self.tree.bind("<Control-Button-1>", lambda event: self._on_virtual_click(event, "toggle"))
+                self.tree.bind("<Shift-Button-1>", lambda event: self._on_virtual_click(event, "range"))
+            self.scrollbar_y.configure(command=self._on_virtual_scroll)
+            self.tree.bind("<Configure>", self._on_virtual_resize)
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.tree.bind(sequence, self._on_virtual_mousewheel)
+            self.tree.bind("<Up>", lambda event: self._move_virtual_selection(-1))
+            self.tree.bind("<Down>", lambda event: self._move_virtual_selection(1))
+            self.tree.bind("<Prior>", lambda event: self._move_virtual_selection(-self._visible_rows))
+            self.tree.bind("<Next>", lambda event: self._move_virtual_selection(self._visible_rows))
+        else:
+            self.tree.configure(yscrollcommand=self.scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        if self.multi_select:
+            self.tree.bind("<Control-a>", lambda event: self.select_all())
 
         self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar_y.grid(row=0, column=1, sticky="ns")
+        self.scrollbar_y.grid(row=0, column=1, sticky="ns")
         scrollbar_x.grid(row=1, column=0, sticky="ew")
 
     def clear_list(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        if self.virtual:
+            self._rows = []
+            self._row_index = {}
+            self._selected_index = None
+            self._selected_keys = set()
+            self._render_virtual()
+            return
+
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._row_order = []
+        self._row_values = {}
+        self._unkeyed_rows = False
+
+    @staticmethod
+    def _row_key(item_values):
+        return str(item_values[0]) if item_values else ""
 
     def add_item(self, item_values: tuple):
-        self.tree.insert("", "end", values=item_values)
+        if self.virtual:
+            self._append_virtual_rows([item_values])
+            self._render_virtual()
+            return
+
+        key = self._row_key(item_values)
+        if key and key not in self._row_values:
+            self.tree.insert("", "end", iid=key, values=item_values)
+            self._row_order.append(key)
+            self._row_values[key] = tuple(item_values)
+        else:
+            self.tree.insert("", "end", values=item_values)
+            self._unkeyed_rows = True
+
+    def append_items(self, items_data: list[tuple]):
+        if self.virtual:
+            self._append_virtual_rows(items_data)
+            self._render_virtual()
+            return
+
+        for item_values in items_data:
+            self.add_item(item_values)
 
     def set_items(self, items_data: list[tuple]):
-        self.clear_list()
+        if self.virtual:
+            self._set_virtual_items(items_data)
+            return
+
+        new_order = []
+        new_values = {}
         for item_values in items_data:
+            key = self._row_key(item_values)
+            if not key or key in new_values:
+                # Rows without a unique id cannot be diffed; fall back to a full rebuild.
+                self.clear_list()
+                for values in items_data:
+                    self.tree.insert("", "end", values=values)
+                self._unkeyed_rows = True
+                return
+            new_order.append(key)
+            new_values[key] = tuple(item_values)
+
+        if self._unkeyed_rows:
+            self.clear_list()
+
+        removed = [key for key in self._row_order if key not in new_values]
+        if removed:
+            self.tree.delete(*removed)
+
+        surviving_order = [key for key in self._row_order if key in new_values]
+        reorder = surviving_order != [key for key in new_order if key in self._row_values]
+
+        for index, key in enumerate(new_order):
+            values = new_values[key]
+            current = self._row_values.get(key)
+            if current is None:
+                self.tree.insert("", index, iid=key, values=values)
+                continue
+            if current != values:
+                self.tree.item(key, values=values)
+            if reorder:
+                self.tree.move(key, "", index)
+
+        self._row_order = new_order
+        self._row_values = new_values
+
+    def index_of(self, key):
+        key = str(key)
+        if self.virtual:
+            return self._virtual_index().get(key)
+        if self._unkeyed_rows or key not in self._row_values:
+            return None
+        return self._row_order.index(key)
+
+    def update_item(self, item_values: tuple):
+        # Replaces the row with the same id in place; returns False if there is none.
+        index = self.index_of(self._row_key(item_values))
+        if index is None:
+            return False
+        if self.virtual:
+            self._rows[index] = tuple(item_values)
+            self._render_virtual()
+        else:
+            key = self._row_order[index]
+            self.tree.item(key, values=item_values)
+            self._row_values[key] = tuple(item_values)
+        return True
+
+    def remove_item(self, key):
+        # Returns (index, values) of the removed row so it can be put back with insert_item().
+        index = self.index_of(key)
+        if index is None:
+            return None
+        if self.virtual:
+            values = self._rows.pop(index)
+            self._shift_virtual_index(index, values, -1)
+            self._selected_keys.discard(self._row_key(values))
+            if self._selected_index is not None:
+                if self._selected_index == index:
+                    self._selected_index = None
+                elif self._selected_index > index:
+                    self._selected_index -= 1
+            self._render_virtual()
+            return index, values
+
+        key = self._row_order.pop(index)
+        values = self._row_values.pop(key)
+        self.tree.delete(key)
+        return index, values
+
+    def insert_item(self, item_values: tuple, index: int = None):
+        if index is None:
             self.add_item(item_values)
+            return
+        if self.virtual:
+            if index >= len(self._rows):
+                self._append_virtual_rows([item_values])
+            else:
+                self._rows.insert(index, tuple(item_values))
+                self._shift_virtual_index(index, item_values, 1)
+            if self._selected_index is not None and self._selected_index >= index:
+                self._selected_index += 1
+            self._render_virtual()
+            return
+
+        key = self._row_key(item_values)
+        if not key or key in self._row_values or self._unkeyed_rows:
+            self.add_item(item_values)
+            return
+        self.tree.insert("", index, iid=key, values=item_values)
+        self._row_order.insert(index, key)
+        self._row_values[key] = tuple(item_values)
+
+    def remove_items(self, keys):
+        # Drops many rows in one pass, e.g. after a bulk action.
+        keys = {str(key) for key in keys}
+        if not keys:
+            return
+        if self.virtual:
+            selected_key = None
+            if self._selected_index is not None and self._selected_index < len(self._rows):
+                selected_key = self._row_key(self._rows[self._selected_index])
+            self._rows = [item_values for item_values in self._rows if self._row_key(item_values) not in keys]
+            self._row_index = None
+            self._selected_keys -= keys
+            self._selected_index = None
+            if selected_key and selected_key not in keys:
+                self._selected_index = self.index_of(selected_key)
+            self._render_virtual()
+            return
+
+        present = [key for key in self._row_order if key in keys]
+        if present:
+            self.tree.delete(*present)
+            self._row_order = [key for key in self._row_order if key not in keys]
+            for key in present:
+                del self._row_values[key]
+
+    def restore_item(self, removed):
+        # Puts back a row returned by remove_item().
+        if removed is not None:
+            self.insert_item(removed[1], removed[0])
+
+    def _virtual_index(self):
+        if self._row_index is None:
+            self._row_index = {}
+            for index, item_values in enumerate(self._rows):
+                self._row_index.setdefault(self._row_key(item_values), index)
+        return self._row_index
+
+    def _shift_virtual_index(self, index, item_values, step):
+        # Keeps the id index in step with a row inserted (step 1) or removed (step -1) at index.
+        if self._row_index is None:
+            return
+        key = self._row_key(item_values)
+        if step < 0 and self._row_index.get(key) == index:
+            # A later row with the same id, if any, takes its place in the loop below.
+            del self._row_index[key]
+        # Walked against the shift so an entry that was just moved is never matched again.
+        positions = reversed(range(index + 1, len(self._rows))) if step > 0 else range(index, len(self._rows))
+        for position in positions:
+            row_key = self._row_key(self._rows[position])
+            indexed = self._row_index.get(row_key)
+            if indexed is None or indexed == position - step:
+                self._row_index[row_key] = position
+        if step > 0 and self._row_index.get(key, index) >= index:
+            self._row_index[key] = index
+
+    def _append_virtual_rows(self, items_data):
+        for item_values in items_data:
+            self._rows.append(tuple(item_values))
+            if self._row_index is not None:
+                self._row_index.setdefault(self._row_key(item_values), len(self._rows) - 1)
+
+    def _set_virtual_items(self, items_data):
+        selected_key = None
+        if self._selected_index is not None and self._selected_index < len(self._rows):
+            selected_key = self._row_key(self._rows[self._selected_index])
+
+        self._rows = list(items_data)
+        self._row_index = None
+        self._selected_index = None
+        if self._selected_keys:
+            self._selected_keys = {key for key in self._selected_keys if key in self._virtual_index()}
+        if selected_key:
+            self._selected_index = self._virtual_index().get(selected_key)
+        self._render_virtual()
 
     def on_select(self, callback):
+        if self.virtual:
+            self._select_callback = callback
+            if not self.multi_select:
+                self.tree.bind("<<TreeviewSelect>>", self._on_virtual_tree_select)
+            return
+
         self.tree.bind("<<TreeviewSelect>>", lambda event: callback(self.get_selected_item()))
 
     def get_selected_item(self):
+        if self.virtual:
+            if self._selected_index is not None and self._selected_index < len(self._rows):
+                if not self.multi_select or self._row_key(self._rows[self._selected_index]) in self._selected_keys:
+                    return self._rows[self._selected_index]
+            if self.multi_select and self._selected_keys:
+                return next(iter(self.get_selected_items()), None)
+            return None
+
         selected_item = self.tree.selection()
         if selected_item:
             return self.tree.item(selected_item[0], "values")
         return None
+
+    def get_selected_items(self):
+        if self.virtual:
+            if not self.multi_select:
+                selected = self.get_selected_item()
+                return [selected] if selected is not None else []
+            return [item_values for item_values in self._rows if self._row_key(item_values) in self._selected_keys]
+
+        return [self.tree.item(iid, "values") for iid in self.tree.selection()]
+
+    def select_all(self):
+        if not self.multi_select:
+            return "break"
+        if self.virtual:
+            self._selected_keys = {self._row_key(item_values) for item_values in self._rows}
+            if self._rows and self._selected_index is None:
+                self._selected_index = self._offset
+            self._render_virtual()
+            self._notify_virtual_selection()
+        else:
+            self.tree.selection_set(self.tree.get_children())
+        return "break"
+
+    def _notify_virtual_selection(self):
+        if self._select_callback:
+            self._select_callback(self.get_selected_item())
+
+    def _on_virtual_click(self, event, mode):
+        iid = self.tree.identify_row(event.y)
+        position = self._pool_positions.get(iid)
+        if position is None or position >= self._rendered_count():
+            # Headings and empty space keep their default bindings.
+            return None
+        index = self._offset + position
+        key = self._row_key(self._rows[index])
+
+        if mode == "toggle":
+            if key in self._selected_keys:
+                self._selected_keys.discard(key)
+            else:
+                self._selected_keys.add(key)
+        elif mode == "range" and self._selected_index is not None:
+            start, end = sorted((self._selected_index, index))
+            self._selected_keys |= {self._row_key(item_values) for item_values in self._rows[start:end + 1]}
+        else:
+            self._selected_keys = {key}
+        self._selected_index = index if key in self._selected_keys else None
+
+        self._render_virtual()
+        self._notify_virtual_selection()
+        return "break"
+
+    def _row_height(self):
+        try:
+            return int(ttk.Style().lookup("Treeview", "rowheight")) or 28
+        except (ValueError, tk.TclError):
+            return 28
+
+    def _rendered_count(self):
+        return max(0, min(self._visible_rows + self.buffer_rows, len(self._rows) - self._offset))
+
+    def _render_virtual(self):
+        total = len(self._rows)
+        self._offset = max(0, min(self._offset, total - self._visible_rows))
+
+        pool_size = self._visible_rows + self.buffer_rows
+        while len(self._pool) < pool_size:
+            iid = self.tree.insert("", "end", values=())
+            self._pool_positions[iid] = len(self._pool)
+            self._pool.append(iid)
+            self._attached.append(True)
+
+        rendered = self._rendered_count()
+        for position, iid in enumerate(self._pool):
+            if position < rendered:
+                if not self._attached[position]:
+                    self.tree.move(iid, "", position)
+                    self._attached[position] = True
+                self.tree.item(iid, values=self._rows[self._offset + position])
+            elif self._attached[position]:
+                self.tree.detach(iid)
+                self._attached[position] = False
+
+        self.tree.yview_moveto(0)
+
+        selected = self._selected_index
+        if self.multi_select:
+            target = tuple(self._pool[position] for position in range(rendered)
+                           if self._row_key(self._rows[self._offset + position]) in self._selected_keys)
+        elif selected is not None and self._offset <= selected < self._offset + rendered:
+            target = (self._pool[selected - self._offset],)
+        else:
+            target = ()
+        if tuple(self.tree.selection()) != target:
+            self.tree.selection_set(target)
+
+        if total:
+            self.scrollbar_y.set(self._offset / total, min(1.0, (self._offset + self._visible_rows) / total))
+        else:
+            self.scrollbar_y.set(0.0, 1.0)
+
+    def _on_virtual_resize(self, event):
+        visible_rows = max(1, event.height // self._row_height() - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render_virtual()
+
+    def _on_virtual_scroll(self, *args):
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            step = self._visible_rows if args[2] == "pages" else 1
+            self._offset += int(args[1]) * step
+        self._render_virtual()
+
+    def _on_virtual_mousewheel(self, event):
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self._offset += direction * 3
+        self._render_virtual()
+        return "break"
+
+    def _move_virtual_selection(self, step):
+        if not self._rows:
+            return "break"
+
+        if self._selected_index is None:
+            index = self._offset
+        else:
+            index = max(0, min(len(self._rows) - 1, self._selected_index + step))
+
+        if index < self._offset:
+            self._offset = index
+        elif index >= self._offset + self._visible_rows:
+            self._offset = index - self._visible_rows + 1
+
+        changed = index != self._selected_index
+        self._selected_index = index
+        if self.multi_select:
+            self._selected_keys = {self._row_key(self._rows[index])}
+        self._render_virtual()
+        if changed and self._select_callback:
+            self._select_callback(self.get_selected_item())
+        return "break"
+
+    def _on_virtual_tree_select(self, event=None):
+        selection = self.tree.selection()
+        if selection:
+            position = self._pool_positions.get(selection[0])
+            if position is None or position >= self._rendered_count():
+                return
+            index = self._offset + position
+            if index == self._selected_index:
+                return
+            self._selected_index = index
+        else:
+            selected = self._selected_index
+            if selected is None or not (self._offset <= selected < self._offset + self._rendered_count()):
+                return
+            self._selected_index = None
+
+        if self._select_callback:
+            self._select_callback(self.get_selected_item())
@@ -0,0 +1,56 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class ProgressComponent(tk.Frame):
+    def __init__(self, parent, on_cancel_callback=None, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        self.on_cancel_callback = on_cancel_callback
+        self._text = ""
+        self._setup_ui()
+
+    def _setup_ui(self):
+        self.label = ttk.Label(self, text="")
+        self.label.pack(side="left", padx=(0, 10))
+
+        self.progress_bar = ttk.Progressbar(self, orient="horizontal", length=240, mode="determinate")
+        self.progress_bar.pack(side="left")
+
+        self.cancel_button = None
+        if self.on_cancel_callback:
+            self.cancel_button = ttk.Button(self, text="Cancel", command=self.on_cancel_callback)
+            self.cancel_button.pack(side="left", padx=(10, 0))
+
+    def start(self, total, text):
+        # With total=None the bar just shows activity and set_status reports what was done.
+        self._text = text
+        self.progress_bar.stop()
+        if self.cancel_button is not None:
+            self.cancel_button.config(state="normal")
+        if total is None:
+            self.progress_bar.config(mode="indeterminate", value=0)
+            self.progress_bar.start(20)
+            self.label.config(text=text)
+            return
+        self.progress_bar.config(mode="determinate", maximum=max(total, 1), value=0)
+        self.label.config(text=f"{text} 0/{total}")
+
+    def stop(self):
+        self.progress_bar.stop()
+
+    def set_stopping(self):
+        # Cancel was pressed; the work in flight still has to finish before the summary.
+        self._text = "Stopping..."
+        self.label.config(text=self._text)
+        if self.cancel_button is not None:
+            self.cancel_button.config(state="disabled")
+
+    def set_status(self, text):
+        self.label.config(text=f"{self._text} {text}")
+
+    def set_progress(self, done, total, failed=0):
+        self.progress_bar.config(value=done)
+        text = f"{self._text} {done}/{total}"
+        if failed:
+            text += f" ({failed} failed)"
+        self.label.config(text=text)
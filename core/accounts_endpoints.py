@@ -1,30 +1,42 @@
 from uuid import UUID
 
 from core.api_client import APIClient
+from core.models import AccountRecord
 
 
 class AccountAPIClient(APIClient):
+    record_type = AccountRecord
 
     def get_all_accounts(self):
-        return self._make_request("GET", "/accounts/all")
+        return self._make_request("GET", "/accounts/all", bulk=True)
+
+    def iter_accounts(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/accounts/all", page_size, as_records=as_records)
+
+    def iter_account_pages(self, page_size: int = None, as_records: bool = False):
+        return self.iter_pages("/accounts/all", page_size, as_records=as_records)
 
     def get_deleted_accounts(self):
-        return self._make_request("GET", "/accounts/deleted")
+        return self._make_request("GET", "/accounts/deleted", bulk=True)
+
+    def iter_deleted_accounts(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/accounts/deleted", page_size, as_records=as_records)
 
     def get_account_by_id(self, account_id: UUID):
         return self._make_request("GET", f"/accounts/{account_id}")
 
-    def create_account(self, account_data: dict):
-        return self._make_request("POST", "/accounts/create", data=account_data)
+    def create_account(self, account_data: dict, idempotency_key: str = None):
+        return self._make_request("POST", "/accounts/create", data=account_data, idempotency_key=idempotency_key)
 
-    def update_account(self, account_id: UUID, account_data: dict):
-        return self._make_request("PATCH", f"/accounts/{account_id}/update", data=account_data)
+    def update_account(self, account_id: UUID, account_data: dict, idempotency_key: str = None):
+        return self._make_request("PATCH", f"/accounts/{account_id}/update", data=account_data,
+                                  idempotency_key=idempotency_key)
 
     def delete_account(self, account_id: UUID):
         return self._make_request("DELETE", f"/accounts/{account_id}/delete")
 
-    def restore_account(self, account_id: UUID):
-        return self._make_request("POST", f"/accounts/{account_id}/restore")
+    def restore_account(self, account_id: UUID, idempotency_key: str = None):
+        return self._make_request("POST", f"/accounts/{account_id}/restore", idempotency_key=idempotency_key)
 
     def force_delete_account(self, account_id: UUID):
         return self._make_request("DELETE", f"/accounts/{account_id}/force-delete")
@@ -1,50 +1,548 @@
 import json
 import os
+import random
+import threading
+import time
+import uuid
+from email.utils import parsedate_to_datetime
 
 import requests
 from dotenv import load_dotenv
 from requests import RequestException
+from requests.exceptions import ConnectionError as RequestsConnectionError, ConnectTimeout, Timeout
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from core.json_stream import JSON_STREAM_CHUNK_SIZE, iter_json_array
+from core.local_store import local_store
+from core.models import to_records
+from core.response_cache import ResponseCache
+from core.write_queue import LOCAL_ID_PREFIX, write_queue
 
 load_dotenv()
 
 BASE_API_URL = os.getenv("BASE_API_URL")
 
+API_POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", "4"))
+API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "10"))
+API_POOL_BLOCK = os.getenv("API_POOL_BLOCK", "false").lower() == "true"
+API_KEEP_ALIVE = os.getenv("API_KEEP_ALIVE", "true").lower() == "true"
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "500"))
+API_RESPONSE_CACHE_SIZE = int(os.getenv("API_RESPONSE_CACHE_SIZE", "128"))
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+API_BACKOFF_BASE = float(os.getenv("API_BACKOFF_BASE", "0.5"))
+API_BACKOFF_MAX = float(os.getenv("API_BACKOFF_MAX", "10"))
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "3.05"))
+API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", "15"))
+API_BULK_READ_TIMEOUT = float(os.getenv("API_BULK_READ_TIMEOUT", "60"))
+API_OPERATION_DEADLINE = float(os.getenv("API_OPERATION_DEADLINE", "30"))
+API_BULK_OPERATION_DEADLINE = float(os.getenv("API_BULK_OPERATION_DEADLINE", "180"))
+API_RETRY_STATUSES = {int(code) for code in os.getenv("API_RETRY_STATUSES", "429,502,503,504").split(",") if code}
+
+
+def new_idempotency_key():
+    return str(uuid.uuid4())
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
 
 class APIClient:
+    # One pooled session is shared by every endpoint client, so all of them reuse
+    # the same keep-alive connections to BASE_API_URL.
+    _session = None
+    _session_lock = threading.Lock()
+    _mutation_listeners = []
+    _response_cache = ResponseCache(API_RESPONSE_CACHE_SIZE)
+    _in_flight = {}
+    _in_flight_lock = threading.Lock()
+    _circuit_breaker = CircuitBreaker()
+
+    pool_connections = API_POOL_CONNECTIONS
+    pool_maxsize = API_POOL_MAXSIZE
+    pool_block = API_POOL_BLOCK
+    keep_alive = API_KEEP_ALIVE
+
+    max_retries = API_MAX_RETRIES
+    backoff_base = API_BACKOFF_BASE
+    backoff_max = API_BACKOFF_MAX
+    retry_statuses = API_RETRY_STATUSES
+
+    # (connect, read) timeouts per attempt and an overall deadline per operation that spans retries.
+    # Endpoint methods returning whole collections pass the bulk budget instead.
+    timeout = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+    bulk_timeout = (API_CONNECT_TIMEOUT, API_BULK_READ_TIMEOUT)
+    operation_deadline = API_OPERATION_DEADLINE
+    bulk_operation_deadline = API_BULK_OPERATION_DEADLINE
+
+    # Compact model (see core/models.py) returned by the list/detail calls when as_records=True.
+    record_type = None
+
     def __init__(self):
         self.base_url = BASE_API_URL
 
-    def _make_request(self, method, endpoint, data=None, params=None):
+    @staticmethod
+    def configure_pool(pool_connections=None, pool_maxsize=None, pool_block=None, keep_alive=None):
+        with APIClient._session_lock:
+            if pool_connections is not None:
+                APIClient.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                APIClient.pool_maxsize = pool_maxsize
+            if pool_block is not None:
+                APIClient.pool_block = pool_block
+            if keep_alive is not None:
+                APIClient.keep_alive = keep_alive
+
+            if APIClient._session is not None:
+                APIClient._session.close()
+                APIClient._session = None
+
+    @staticmethod
+    def configure_retries(max_retries=None, backoff_base=None, backoff_max=None, retry_statuses=None):
+        if max_retries is not None:
+            APIClient.max_retries = max_retries
+        if backoff_base is not None:
+            APIClient.backoff_base = backoff_base
+        if backoff_max is not None:
+            APIClient.backoff_max = backoff_max
+        if retry_statuses is not None:
+            APIClient.retry_statuses = set(retry_statuses)
+
+    @staticmethod
+    def configure_timeouts(connect=None, read=None, bulk_read=None, operation_deadline=None,
+                           bulk_operation_deadline=None):
+        connect = connect if connect is not None else APIClient.timeout[0]
+        APIClient.timeout = (connect, read if read is not None else APIClient.timeout[1])
+        APIClient.bulk_timeout = (connect, bulk_read if bulk_read is not None else APIClient.bulk_timeout[1])
+        if operation_deadline is not None:
+            APIClient.operation_deadline = operation_deadline
+        if bulk_operation_deadline is not None:
+            APIClient.bulk_operation_deadline = bulk_operation_deadline
+
+    @staticmethod
+    def circuit_state():
+        return APIClient._circuit_breaker.state
+
+    @staticmethod
+    def circuit_retry_in():
+        return APIClient._circuit_breaker.seconds_until_retry()
+
+    @staticmethod
+    def add_circuit_listener(listener):
+        APIClient._circuit_breaker.add_listener(listener)
+
+    @staticmethod
+    def remove_circuit_listener(listener):
+        APIClient._circuit_breaker.remove_listener(listener)
+
+    @staticmethod
+    def replay_write_queue():
+        write_queue.start_replay(api_client._send_queued, APIClient._can_replay_later)
+
+    @staticmethod
+    def close_session():
+        with APIClient._session_lock:
+            if APIClient._session is not None:
+                APIClient._session.close()
+                APIClient._session = None
+
+    @staticmethod
+    def configure_response_cache(max_entries):
+        APIClient._response_cache.resize(max_entries)
+
+    @staticmethod
+    def clear_response_cache():
+        APIClient._response_cache.clear()
+
+    @staticmethod
+    def add_mutation_listener(listener):
+        if listener not in APIClient._mutation_listeners:
+            APIClient._mutation_listeners.append(listener)
+
+    @staticmethod
+    def remove_mutation_listener(listener):
+        if listener in APIClient._mutation_listeners:
+            APIClient._mutation_listeners.remove(listener)
+
+    def _notify_mutation(self, method, endpoint):
+        for listener in list(APIClient._mutation_listeners):
+            try:
+                listener(self, method, endpoint)
+            except Exception as e:
+                print(f"Mutation listener failed for {method} {endpoint}: {e}")
+
+    @staticmethod
+    def _create_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=APIClient.pool_connections,
+            pool_maxsize=APIClient.pool_maxsize,
+            pool_block=APIClient.pool_block
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive" if APIClient.keep_alive else "close"
+        })
+        return session
+
+    @property
+    def session(self):
+        session = APIClient._session
+        if session is None:
+            with APIClient._session_lock:
+                if APIClient._session is None:
+                    APIClient._session = APIClient._create_session()
+                session = APIClient._session
+        return session
+
+    def _single_flight(self, key, func):
+        # Identical GETs issued while one is already in flight wait for it and share its
+        # decoded result (or its exception) instead of opening another round-trip.
+        with APIClient._in_flight_lock:
+            flight = APIClient._in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                APIClient._in_flight[key] = flight
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with APIClient._in_flight_lock:
+                APIClient._in_flight.pop(key, None)
+            flight.done.set()
+
+    def _make_request(self, method, endpoint, data=None, params=None, stream=False, idempotency_key=None,
+                      bulk=False, timeout=None, deadline=None, if_match=None):
+        if method == "GET" and not stream:
+            key = ResponseCache.make_key(method, f"{self.base_url}{endpoint}", params)
+            try:
+                result = self._single_flight(key, lambda: self._send_request(method, endpoint, data, params,
+                                                                             bulk=bulk, timeout=timeout,
+                                                                             deadline=deadline))
+            except Exception as e:
+                offline_result = self._offline_result(endpoint, params, e)
+                if offline_result is None:
+                    raise
+                return offline_result
+            local_store.offline = False
+            return result
+        if self._is_queueable(method, endpoint):
+            return self._send_or_queue(method, endpoint, data, idempotency_key, timeout, deadline, if_match)
+        return self._send_request(method, endpoint, data, params, stream, idempotency_key, bulk, timeout, deadline,
+                                  if_match)
+
+    @staticmethod
+    def _is_queueable(method, endpoint):
+        return (write_queue.enabled and method in ("POST", "PATCH", "DELETE")
+                and endpoint.rstrip("/").rsplit("/", 1)[-1] in ("create", "update", "delete", "restore"))
+
+    def _send_or_queue(self, method, endpoint, data, idempotency_key, timeout, deadline, if_match=None):
+        # Mutations that cannot reach the backend go to the write queue instead of failing, and so
+        # does everything made while older ones are still waiting, to keep them in order. A POST or
+        # PATCH without a caller-supplied Idempotency-Key is only queued when it provably never
+        # reached the server, since sending it again could apply it twice.
+        if not write_queue.has_pending():
+            try:
+                return self._send_request(method, endpoint, data, idempotency_key=idempotency_key,
+                                          timeout=timeout, deadline=deadline, if_match=if_match)
+            except Exception as e:
+                if not self._can_replay_later(e, {"method": method, "endpoint": endpoint,
+                                                  "idempotency_key": idempotency_key}):
+                    raise
+                print(f"Backend unreachable; queueing {method} {endpoint}: {e}")
+        return self._queue_mutation(method, endpoint, data, idempotency_key, if_match)
+
+    def _queue_mutation(self, method, endpoint, data, idempotency_key, if_match=None):
+        # Applied optimistically: the local mirror and listeners see the change right away.
+        parsed = local_store.parse_endpoint(endpoint)
+        action = endpoint.rstrip("/").rsplit("/", 1)[-1]
+        local_id = None
+        body = {}
+        if action == "create":
+            local_id = f"{LOCAL_ID_PREFIX}{new_idempotency_key()}"
+            body = dict(data or {}, id=local_id)
+        elif action == "update" and parsed is not None and len(parsed) == 3:
+            current = local_store.get(parsed[0], parsed[1]) if local_store.enabled else None
+            body = dict(current or {}, **(data or {}), id=parsed[1])
+
+        write_queue.enqueue(method, endpoint, data, idempotency_key, local_id, if_match)
+        self._mirror_response(method, endpoint, None, body)
+        self._notify_mutation(method, endpoint)
+        APIClient.replay_write_queue()
+        return body
+
+    def _send_queued(self, operation):
+        return self._send_request(operation["method"], operation["endpoint"], operation["data"],
+                                  idempotency_key=operation["idempotency_key"], if_match=operation["if_match"])
+
+    def etag_for(self, endpoint, params=None):
+        # Validator of the last GET of endpoint, to send back as an If-Match precondition on a write.
+        cached = APIClient._response_cache.get(ResponseCache.make_key("GET", f"{self.base_url}{endpoint}", params))
+        return cached.etag if cached is not None else None
+
+    @staticmethod
+    def _is_transient_error(error):
+        # Unreachable backend, or one still answering with a retryable status once retries ran out.
+        while error is not None:
+            if isinstance(error, (CircuitOpenError, RequestsConnectionError, Timeout)):
+                return True
+            response = getattr(error, "response", None)
+            if response is not None and response.status_code in APIClient.retry_statuses:
+                return True
+            error = error.__cause__
+        return False
+
+    @staticmethod
+    def _was_not_sent(error):
+        # The request never reached the server: the circuit was open, the connection could not be
+        # opened, or the server turned it away with 429 before handling it.
+        while error is not None:
+            if isinstance(error, (CircuitOpenError, ConnectTimeout)):
+                return True
+            if isinstance(error, RequestsConnectionError) and error.args:
+                if isinstance(getattr(error.args[0], "reason", None), NewConnectionError):
+                    return True
+            response = getattr(error, "response", None)
+            if response is not None and response.status_code == 429:
+                return True
+            error = error.__cause__
+        return False
+
+    @staticmethod
+    def may_have_been_applied(error):
+        # False only when a failed write surely did not happen: it was never sent, or the server
+        # refused it with a client error. Anything else (timeouts, dropped connections, 5xx) is unknown.
+        if APIClient._was_not_sent(error):
+            return False
+        while error is not None:
+            response = getattr(error, "response", None)
+            if response is not None and 400 <= response.status_code < 500 and response.status_code != 408:
+                return False
+            error = error.__cause__
+        return True
+
+    @staticmethod
+    def _can_replay_later(error, operation):
+        # Whether a mutation that failed with error may be (re)sent from the write queue.
+        if not APIClient._is_transient_error(error):
+            return False
+        if APIClient._is_retryable(operation["method"], operation["endpoint"], operation["idempotency_key"]):
+            return True
+        return APIClient._was_not_sent(error)
+
+    @staticmethod
+    def _is_offline_error(error):
+        while error is not None:
+            if isinstance(error, (CircuitOpenError, RequestsConnectionError, Timeout)):
+                return True
+            error = error.__cause__
+        return False
+
+    def _offline_result(self, endpoint, params, error):
+        # Read-only fallback: when the backend is unreachable, answer GETs from the local mirror.
+        if not local_store.enabled or not self._is_offline_error(error):
+            return None
+        try:
+            result = local_store.offline_response(endpoint, params)
+        except Exception as e:
+            print(f"Local store lookup failed for {endpoint}: {e}")
+            return None
+        if result is not None:
+            local_store.offline = True
+            print(f"Backend unreachable; serving {endpoint} from the local store")
+        return result
+
+    def _mirror_response(self, method, endpoint, params, body):
+        if not local_store.enabled:
+            return
+        try:
+            local_store.apply_response(method, endpoint, params, body)
+        except Exception as e:
+            print(f"Failed to update the local store for {method} {endpoint}: {e}")
+
+    @staticmethod
+    def _is_retryable(method, endpoint, idempotency_key):
+        # GET and soft-delete DELETEs are safe to repeat; POST/PATCH only when the caller
+        # supplied an Idempotency-Key so the server can deduplicate the replay.
+        if method == "GET":
+            return True
+        if method == "DELETE":
+            return not endpoint.endswith("/force-delete")
+        return idempotency_key is not None
+
+    def _retry_delay(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                # The server's value is honoured as-is; backoff_max only bounds our own backoff.
+                return max(delay, 0.0)
+        # Exponential backoff with full jitter.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _send_with_retries(self, send, method, url, retryable, timeout, deadline):
+        # send(timeout) performs one attempt. Each attempt's timeouts are clipped to what is left
+        # of the operation deadline, and no retry is started that could not finish before it.
+        # On the Tk thread a backoff sleep would freeze the UI, so calls made there get one attempt.
+        if threading.current_thread() is threading.main_thread():
+            retryable = False
+        breaker = APIClient._circuit_breaker
+        deadline_at = time.monotonic() + deadline if deadline else None
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if deadline_at is not None:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    raise Timeout(f"Deadline of {deadline:.0f}s exceeded for {method} {url}")
+                attempt_timeout = (min(timeout[0], remaining), min(timeout[1], remaining))
+
+            # Fails fast with CircuitOpenError while the backend is considered down.
+            breaker.before_request()
+            try:
+                response = send(attempt_timeout)
+            except (RequestsConnectionError, Timeout) as e:
+                breaker.record_failure()
+                delay = self._retry_delay(attempt)
+                if not retryable or attempt >= self.max_retries or self._past_deadline(deadline_at, delay):
+                    raise
+                print(f"Retrying {method} {url} in {delay:.2f}s after error: {e}")
+            except Exception:
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if not retryable or response.status_code not in self.retry_statuses or attempt >= self.max_retries:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                delay = self._retry_delay(attempt, retry_after)
+                if self._past_deadline(deadline_at, delay):
+                    if retry_after:
+                        raise requests.HTTPError(
+                            f"HTTP {response.status_code}: server asked to retry {method} {url} in {delay:.0f}s, "
+                            f"past the operation deadline", response=response)
+                    return response
+                print(f"Retrying {method} {url} in {delay:.2f}s after HTTP {response.status_code}")
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    @staticmethod
+    def _past_deadline(deadline_at, delay):
+        return deadline_at is not None and time.monotonic() + delay >= deadline_at
+
+    def _send_request(self, method, endpoint, data=None, params=None, stream=False, idempotency_key=None,
+                      bulk=False, timeout=None, deadline=None, if_match=None):
         url = f"{self.base_url}{endpoint}"
+        if timeout is None:
+            timeout = self.bulk_timeout if bulk else self.timeout
+        elif not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        if deadline is None:
+            deadline = self.bulk_operation_deadline if bulk else self.operation_deadline
         headers = {"Content-Type": "application/json"}
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+        if if_match is not None:
+            headers["If-Match"] = if_match
+        session = self.session
+        retryable = self._is_retryable(method, endpoint, idempotency_key)
 
         try:
-            if method == "GET":
-                response = requests.get(url, params=params, headers=headers)
+            if method == "GET" and stream:
+                response = self._send_with_retries(
+                    lambda t: session.get(url, params=params, headers=headers, stream=True, timeout=t),
+                    method, url, retryable, timeout, deadline
+                )
+                response.raise_for_status()
+                return self._iter_streamed_records(response, method, url)
+            elif method == "GET":
+                cache_key = ResponseCache.make_key(method, url, params)
+                headers.update(APIClient._response_cache.conditional_headers(cache_key))
+                response = self._send_with_retries(
+                    lambda t: session.get(url, params=params, headers=headers, timeout=t),
+                    method, url, retryable, timeout, deadline
+                )
+
+                if response.status_code == 304:
+                    cached = APIClient._response_cache.get(cache_key)
+                    if cached is not None:
+                        return cached.body
+                    # Evicted between the lookup and the reply: fetch the full body again.
+                    response = self._send_with_retries(
+                        lambda t: session.get(url, params=params, headers={"Content-Type": "application/json"},
+                                              timeout=t),
+                        method, url, retryable, timeout, deadline
+                    )
             elif method == "POST":
-                response = requests.post(url, json=data, headers=headers)
+                response = self._send_with_retries(
+                    lambda t: session.post(url, json=data, headers=headers, timeout=t),
+                    method, url, retryable, timeout, deadline
+                )
             elif method == "PATCH":
-                response = requests.patch(url, json=data, headers=headers)
+                response = self._send_with_retries(
+                    lambda t: session.patch(url, json=data, headers=headers, timeout=t),
+                    method, url, retryable, timeout, deadline
+                )
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers)
+                response = self._send_with_retries(
+                    lambda t: session.delete(url, headers=headers, timeout=t),
+                    method, url, retryable, timeout, deadline
+                )
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             response.raise_for_status()
 
+            if method != "GET":
+                self._notify_mutation(method, endpoint)
+
             if response.status_code == 204:
+                self._mirror_response(method, endpoint, params, {})
                 return {}
 
-            if response.text:
-                return response.json()
-            else:
-                return {}
+            body = response.json() if response.text else {}
+            if method == "GET":
+                APIClient._response_cache.store(cache_key, response, body)
+            self._mirror_response(method, endpoint, params, body)
+            return body
 
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse API response as JSON: {e}. Response: {response.text}") from e
         except RequestException as e:
             print(f"Network or API Request Error for {method} {url}: {e}")
             if hasattr(e, 'response') and e.response is not None:
+                if e.response.status_code == 412:
+                    raise Exception("This record was changed by someone else since it was loaded. "
+                                    "Reload it and try again.") from e
                 try:
                     error_data = e.response.json()
                     if 'message' in error_data:
@@ -56,5 +554,75 @@ class APIClient:
             print(f"An unexpected error occurred during API request: {e}")
             raise
 
+    def _iter_streamed_records(self, response, method, url):
+        # With stream=True the body is decoded element by element while it is read from the
+        # socket; the connection goes back to the pool once the generator is exhausted or closed.
+        try:
+            yield from iter_json_array(response.iter_content(chunk_size=JSON_STREAM_CHUNK_SIZE),
+                                       response.encoding or "utf-8")
+        except json.JSONDecodeError as e:
+            raise Exception(f"Failed to parse streamed API response as JSON: {e}") from e
+        except RequestException as e:
+            print(f"Network or API Request Error for {method} {url}: {e}")
+            raise Exception(f"API request failed: {e}") from e
+        finally:
+            response.close()
+
+    def _as_records(self, data, as_records):
+        if not as_records or self.record_type is None:
+            return data
+        return to_records(self.record_type, data)
+
+    def iter_pages(self, endpoint, page_size=None, params=None, as_records=False):
+        # Walks a list endpoint with skip/limit, yielding one page (list of records) per request.
+        page_size = page_size or API_PAGE_SIZE
+        skip = 0
+        previous_first_id = None
+        yielded_ids = set()
+        seen_ids = set() if local_store.enabled and not params else None
+
+        while True:
+            page_params = dict(params or {})
+            page_params.update({"skip": skip, "limit": page_size})
+            page = self._make_request("GET", endpoint, params=page_params, bulk=True) or []
+            if not page:
+                break
+
+            # A server that ignores skip keeps answering with the same first page; fall back to one
+            # unpaginated GET and yield whatever the earlier pages did not already cover.
+            first_id = page[0].get("id") if isinstance(page[0], dict) else None
+            if first_id is not None and first_id == previous_first_id:
+                print(f"{endpoint} ignores skip; fetching the full list instead")
+                page = self._make_request("GET", endpoint, params=params, bulk=True) or []
+                page = [record for record in page
+                        if not isinstance(record, dict) or str(record.get("id")) not in yielded_ids]
+                if seen_ids is not None:
+                    seen_ids.update(str(record.get("id")) for record in page if isinstance(record, dict))
+                if page:
+                    yield self._as_records(page, as_records)
+                break
+            previous_first_id = first_id
+            yielded_ids.update(str(record.get("id")) for record in page if isinstance(record, dict))
+            if seen_ids is not None:
+                seen_ids.update(str(record.get("id")) for record in page if isinstance(record, dict))
+
+            yield self._as_records(page, as_records)
+
+            # A short page is the last one; a page longer than the limit means the server
+            # ignored pagination and already sent everything.
+            if len(page) != page_size:
+                break
+            skip += page_size
+
+        if seen_ids is not None and not local_store.offline:
+            try:
+                local_store.finish_full_sync(endpoint, seen_ids)
+            except Exception as e:
+                print(f"Failed to update the local store for {endpoint}: {e}")
+
+    def iter_records(self, endpoint, page_size=None, params=None, as_records=False):
+        for page in self.iter_pages(endpoint, page_size, params, as_records):
+            yield from page
+
 
 api_client = APIClient()
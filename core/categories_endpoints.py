@@ -1,30 +1,46 @@
 from uuid import UUID
 
 from core.api_client import APIClient
+from core.models import CategoryRecord
 
 
 class CategoryAPIClient(APIClient):
+    record_type = CategoryRecord
 
     def get_all_categories(self):
-        return self._make_request("GET", "/categories/all")
+        return self._make_request("GET", "/categories/all", bulk=True)
+
+    def iter_categories(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/categories/all", page_size, as_records=as_records)
+
+    def iter_category_pages(self, page_size: int = None, as_records: bool = False):
+        return self.iter_pages("/categories/all", page_size, as_records=as_records)
 
     def get_deleted_categories(self):
-        return self._make_request("GET", "/categories/deleted")
+        return self._make_request("GET", "/categories/deleted", bulk=True)
+
+    def iter_deleted_categories(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/categories/deleted", page_size, as_records=as_records)
 
     def get_category_by_id(self, category_id: UUID):
         return self._make_request("GET", f"/categories/{category_id}")
 
-    def create_category(self, category_data: dict):
-        return self._make_request("POST", "/categories/create", data=category_data)
+    def create_category(self, category_data: dict, idempotency_key: str = None):
+        return self._make_request("POST", "/categories/create", data=category_data, idempotency_key=idempotency_key)
+
+    def get_category_etag(self, category_id: UUID):
+        return self.etag_for(f"/categories/{category_id}")
 
-    def update_category(self, category_id: UUID, category_data: dict):
-        return self._make_request("PATCH", f"/categories/{category_id}/update", data=category_data)
+    def update_category(self, category_id: UUID, category_data: dict, idempotency_key: str = None,
+                        if_match: str = None):
+        return self._make_request("PATCH", f"/categories/{category_id}/update", data=category_data,
+                                  idempotency_key=idempotency_key, if_match=if_match)
 
     def delete_category(self, category_id: UUID):
         return self._make_request("DELETE", f"/categories/{category_id}/delete")
 
-    def restore_category(self, category_id: UUID):
-        return self._make_request("POST", f"/categories/{category_id}/restore")
+    def restore_category(self, category_id: UUID, idempotency_key: str = None):
+        return self._make_request("POST", f"/categories/{category_id}/restore", idempotency_key=idempotency_key)
 
     def force_delete_category(self, category_id: UUID):
         return self._make_request("DELETE", f"/categories/{category_id}/force-delete")
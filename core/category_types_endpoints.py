@@ -1,21 +1,28 @@
 from uuid import UUID
 
 from core.api_client import APIClient
+from core.models import CategoryTypeRecord
 
 
 class CategoryTypesAPIClient(APIClient):
+    record_type = CategoryTypeRecord
 
     def get_all_category_types(self):
-        return self._make_request("GET", "/category_types/all")
+        return self._make_request("GET", "/category_types/all", bulk=True)
+
+    def iter_category_types(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/category_types/all", page_size, as_records=as_records)
 
     def get_category_type_by_id(self, category_type_id: UUID):
         return self._make_request("GET", f"/category_types/{category_type_id}")
 
-    def create_category_type(self, category_type_data: dict):
-        return self._make_request("POST", "/category_types/create", data=category_type_data)
+    def create_category_type(self, category_type_data: dict, idempotency_key: str = None):
+        return self._make_request("POST", "/category_types/create", data=category_type_data,
+                                  idempotency_key=idempotency_key)
 
-    def update_category_type(self, category_type_id: UUID, category_type_data: dict):
-        return self._make_request("PATCH", f"/category_types/{category_type_id}/update", data=category_type_data)
+    def update_category_type(self, category_type_id: UUID, category_type_data: dict, idempotency_key: str = None):
+        return self._make_request("PATCH", f"/category_types/{category_type_id}/update", data=category_type_data,
+                                  idempotency_key=idempotency_key)
 
     def delete_category_type(self, category_type_id: UUID):
         return self._make_request("DELETE", f"/category_types/{category_type_id}/delete")
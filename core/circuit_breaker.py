@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+
+API_BREAKER_FAILURE_THRESHOLD = int(os.getenv("API_BREAKER_FAILURE_THRESHOLD", "5"))
+API_BREAKER_RESET_SECONDS = float(os.getenv("API_BREAKER_RESET_SECONDS", "15"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    # Trips to OPEN after failure_threshold consecutive failures and fails fast until
+    # reset_seconds have passed; then a single HALF_OPEN probe decides whether to close again.
+    def __init__(self, failure_threshold=API_BREAKER_FAILURE_THRESHOLD, reset_seconds=API_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _set_state(self, state):
+        # Called with the lock held; listeners are notified after it is released.
+        if state == self.state:
+            return False
+        self.state = state
+        return True
+
+    def _notify(self, state):
+        for listener in list(self._listeners):
+            try:
+                listener(state)
+            except Exception as e:
+                print(f"Circuit breaker listener failed: {e}")
+
+    def seconds_until_retry(self):
+        if self.state != OPEN or self._opened_at is None:
+            return 0
+        return max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+
+    def before_request(self):
+        changed = False
+        with self._lock:
+            if self.state == OPEN:
+                if self.seconds_until_retry() > 0:
+                    raise CircuitOpenError(
+                        f"Backend unavailable; retrying in {self.seconds_until_retry():.0f}s")
+                changed = self._set_state(HALF_OPEN)
+
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError("Backend unavailable; reconnecting")
+                self._probe_in_flight = True
+        if changed:
+            self._notify(HALF_OPEN)
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            changed = self._set_state(CLOSED)
+        if changed:
+            self._notify(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            was_probe = self._probe_in_flight
+            self._probe_in_flight = False
+            changed = False
+            if was_probe or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                changed = self._set_state(OPEN)
+        if changed:
+            self._notify(OPEN)
+
+    def reset(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+            changed = self._set_state(CLOSED)
+        if changed:
+            self._notify(CLOSED)
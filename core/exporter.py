@@ -0,0 +1,117 @@
+import csv
+import importlib.util
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+
+def parquet_available():
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def export_filetypes():
+    filetypes = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl")]
+    if parquet_available():
+        filetypes.append(("Parquet", "*.parquet"))
+    return filetypes
+
+
+def _to_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, (date, UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _to_json(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bool, int, float)) or value is None:
+        return value
+    return str(_to_text(value))
+
+
+class _CsvWriter:
+    def __init__(self, path, columns, headings):
+        # utf-8-sig so spreadsheet programs pick up the encoding.
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(headings)
+
+    def write_rows(self, rows):
+        self._writer.writerows([_to_text(value) for value in row] for row in rows)
+
+    def close(self):
+        self._file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path, columns, headings):
+        self._file = open(path, "w", encoding="utf-8")
+        self._columns = columns
+
+    def write_rows(self, rows):
+        self._file.writelines(
+            json.dumps({column: _to_json(value) for column, value in zip(self._columns, row)}, ensure_ascii=False)
+            + "\n" for row in rows
+        )
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    # Each page becomes one row group; every column is written as text, as in the CSV export.
+    def __init__(self, path, columns, headings):
+        import pyarrow
+        import pyarrow.parquet
+
+        self._pyarrow = pyarrow
+        self._columns = columns
+        self._schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write_rows(self, rows):
+        if not rows:
+            return
+        data = {column: [None if row[index] is None else str(_to_text(row[index])) for row in rows]
+                for index, column in enumerate(self._columns)}
+        self._writer.write_table(self._pyarrow.Table.from_pydict(data, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+WRITERS = {".csv": _CsvWriter, ".jsonl": _JsonlWriter, ".parquet": _ParquetWriter}
+
+
+def export_pages(path, pages, build_row, columns, headings):
+    # Writes each page of records through build_row as it arrives, yielding the number of rows
+    # written so far; only one page is held in memory. The file is written next to path and only
+    # moved into place once complete, so a cancelled or failed export leaves nothing behind.
+    writer_type = WRITERS.get(os.path.splitext(path)[1].lower())
+    if writer_type is None:
+        raise ValueError(f"Unsupported export format: {os.path.basename(path)}")
+
+    partial_path = f"{path}.part"
+    writer = writer_type(partial_path, columns, headings)
+    completed = False
+    written = 0
+    try:
+        for page in pages:
+            rows = [build_row(record) for record in page]
+            writer.write_rows(rows)
+            written += len(rows)
+            yield written
+        completed = True
+    finally:
+        writer.close()
+        if completed:
+            os.replace(partial_path, path)
+        elif os.path.exists(partial_path):
+            os.remove(partial_path)
@@ -0,0 +1,74 @@
+import itertools
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+API_FAN_OUT_WORKERS = int(os.getenv("API_FAN_OUT_WORKERS", "8"))
+API_BULK_IN_FLIGHT = int(os.getenv("API_BULK_IN_FLIGHT", "4"))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=API_FAN_OUT_WORKERS, thread_name_prefix="mwu-fan-out")
+    return _executor
+
+
+def fan_out(calls: dict, return_exceptions=False):
+    # Runs independent endpoint calls concurrently and joins them: {name: callable} -> {name: result}.
+    # With return_exceptions=True a failing call puts its exception in the result instead of raising.
+    if len(calls) <= 1:
+        futures = None
+    else:
+        executor = _get_executor()
+        futures = {name: executor.submit(func) for name, func in calls.items()}
+
+    results = {}
+    for name, func in calls.items():
+        try:
+            results[name] = futures[name].result() if futures else func()
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results[name] = e
+    return results
+
+
+def fan_out_iter(calls: dict, max_in_flight=None, stop=None):
+    # Pipelines many calls over the shared pool, yielding (name, result or exception) as each one
+    # finishes. At most max_in_flight run at once so page loads still get workers. Once the stop
+    # event is set nothing new is started but the calls in flight are still waited for, so every
+    # call is either reported or never sent; closing the generator cancels whatever has not started.
+    max_in_flight = max(1, max_in_flight or API_BULK_IN_FLIGHT)
+    executor = _get_executor()
+    pending = iter(calls.items())
+    running = {executor.submit(func): name for name, func in itertools.islice(pending, max_in_flight)}
+    try:
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                if stop is None or not stop.is_set():
+                    for next_name, func in itertools.islice(pending, 1):
+                        running[executor.submit(func)] = next_name
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                yield name, result
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def shutdown_fan_out():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
@@ -1,21 +1,28 @@
 from uuid import UUID
 
 from core.api_client import APIClient
+from core.models import FinancialGoalRecord
 
 
 class FinancialGoalsAPIClient(APIClient):
+    record_type = FinancialGoalRecord
 
     def get_all_financial_goals(self):
-        return self._make_request("GET", "/financial_goals/all")
+        return self._make_request("GET", "/financial_goals/all", bulk=True)
+
+    def iter_financial_goals(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/financial_goals/all", page_size, as_records=as_records)
 
     def get_financial_goals_by_id(self, financial_goals_id: UUID):
         return self._make_request("GET", f"/financial_goals/{financial_goals_id}")
 
-    def create_financial_goals(self, financial_goals_data: dict):
-        return self._make_request("POST", "/financial_goals/create", data=financial_goals_data)
+    def create_financial_goals(self, financial_goals_data: dict, idempotency_key: str = None):
+        return self._make_request("POST", "/financial_goals/create", data=financial_goals_data,
+                                  idempotency_key=idempotency_key)
 
-    def update_financial_goals(self, financial_goals_id: UUID, financial_goals_data: dict):
-        return self._make_request("PATCH", f"/financial_goals/{financial_goals_id}/update", data=financial_goals_data)
+    def update_financial_goals(self, financial_goals_id: UUID, financial_goals_data: dict, idempotency_key: str = None):
+        return self._make_request("PATCH", f"/financial_goals/{financial_goals_id}/update", data=financial_goals_data,
+                                  idempotency_key=idempotency_key)
 
     def delete_financial_goals(self, financial_goals_id: UUID):
         return self._make_request("DELETE", f"/financial_goals/{financial_goals_id}/delete")
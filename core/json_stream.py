@@ -0,0 +1,85 @@
+import codecs
+import json
+from json.decoder import WHITESPACE
+
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_array(byte_chunks, encoding="utf-8"):
+    # Decodes a top-level JSON array one element at a time, so only the current element
+    # (plus one network chunk) is held in memory instead of the whole payload.
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    chunks = iter(byte_chunks)
+    buffer = ""
+    position = 0
+    eof = False
+
+    def read_more():
+        nonlocal buffer, position, eof
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            eof = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+            position = 0
+            return False
+        buffer = buffer[position:] + (text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        position = 0
+        return True
+
+    def skip_whitespace():
+        nonlocal position
+        while True:
+            position = WHITESPACE.match(buffer, position).end()
+            if position < len(buffer) or eof or not read_more():
+                return
+
+    skip_whitespace()
+    if position >= len(buffer):
+        return
+
+    if buffer[position] != "[":
+        # Not an array: fall back to decoding the whole body at once.
+        while read_more():
+            pass
+        value = json.loads(buffer[position:])
+        if isinstance(value, list):
+            yield from value
+        else:
+            yield value
+        return
+    position += 1
+
+    expect_element = True
+    while True:
+        skip_whitespace()
+        if position >= len(buffer):
+            raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+
+        if buffer[position] == "]":
+            return
+        if not expect_element:
+            if buffer[position] != ",":
+                raise json.JSONDecodeError("Expected ',' or ']'", buffer, position)
+            position += 1
+            expect_element = True
+            continue
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof or not read_more():
+                    raise
+                continue
+            # A number cut by a chunk boundary ("12" of "123", "1.5" of "1.5e3") still decodes, so
+            # only accept a value once the following delimiter has arrived.
+            following = WHITESPACE.match(buffer, end).end()
+            if not eof and (following == len(buffer) or buffer[following] not in ",]") and read_more():
+                continue
+            break
+
+        position = end
+        expect_element = False
+        yield value
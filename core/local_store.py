@@ -0,0 +1,221 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+LOCAL_STORE_PATH = os.getenv("LOCAL_STORE_PATH", "")
+
+ENTITIES = ("users", "accounts", "categories", "category_types", "transactions", "financial_goals",
+            "users_accounts")
+
+SCOPE_ACTIVE = "all"
+SCOPE_DELETED = "deleted"
+
+# Query params a mirrored list can answer; anything else (e.g. updated_since) filters server-side.
+PAGING_PARAMS = ("skip", "limit")
+
+
+class LocalStore:
+    # Optional SQLite mirror of the API collections. APIClient writes every successful response
+    # through to it, and serves it back (read-only) when the backend cannot be reached.
+    # Disabled unless LOCAL_STORE_PATH is set.
+    def __init__(self, path=LOCAL_STORE_PATH):
+        self.path = path
+        self.offline = False
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def open(self, path=None):
+        if path is not None:
+            self.close()
+            self.path = path
+        return self._connect()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS records (
+                    entity TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    deleted INTEGER NOT NULL DEFAULT 0,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (entity, id)
+                );
+                -- Lists are read per scope in rowid order; this serves them without a sort.
+                CREATE INDEX IF NOT EXISTS records_scope ON records (entity, deleted);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    entity TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    PRIMARY KEY (entity, key)
+                );
+            """)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def parse_endpoint(endpoint):
+        # "/transactions/all" -> ("transactions", "all")
+        # "/transactions/<id>/update" -> ("transactions", "<id>", "update")
+        parts = [part for part in endpoint.split("?")[0].split("/") if part]
+        if not parts or parts[0] not in ENTITIES:
+            return None
+        return tuple(parts)
+
+    def _upsert(self, connection, entity, records, deleted):
+        rows = [(entity, str(record["id"]), 1 if deleted else 0, json.dumps(record, default=str))
+                for record in records if isinstance(record, dict) and record.get("id") is not None]
+        connection.executemany(
+            "INSERT INTO records (entity, id, deleted, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(entity, id) DO UPDATE SET deleted = excluded.deleted, data = excluded.data",
+            rows
+        )
+        return [row[1] for row in rows]
+
+    def _prune(self, connection, entity, deleted, keep_ids):
+        keep = set(keep_ids)
+        existing = connection.execute(
+            "SELECT id FROM records WHERE entity = ? AND deleted = ?", (entity, 1 if deleted else 0)
+        ).fetchall()
+        stale = [(entity, row[0]) for row in existing if row[0] not in keep]
+        connection.executemany("DELETE FROM records WHERE entity = ? AND id = ?", stale)
+
+    def _write_state(self, connection, entity, key, value):
+        connection.execute(
+            "INSERT INTO sync_state (entity, key, value) VALUES (?, ?, ?) "
+            "ON CONFLICT(entity, key) DO UPDATE SET value = excluded.value",
+            (entity, key, value)
+        )
+
+    def _mark_synced(self, connection, entity, scope):
+        self._write_state(connection, entity, f"synced:{scope}", str(time.time()))
+
+    def apply_response(self, method, endpoint, params, body):
+        parsed = self.parse_endpoint(endpoint)
+        if parsed is None:
+            return
+        entity, rest = parsed[0], parsed[1:]
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if method == "GET" and len(rest) == 1 and rest[0] in (SCOPE_ACTIVE, SCOPE_DELETED):
+                    deleted = rest[0] == SCOPE_DELETED
+                    ids = self._upsert(connection, entity, body or [], deleted)
+                    # Only an unfiltered, unpaginated list is known to be the complete collection.
+                    if not params:
+                        self._prune(connection, entity, deleted, ids)
+                        self._mark_synced(connection, entity, rest[0])
+                elif method == "GET" and len(rest) == 1:
+                    if isinstance(body, dict) and body:
+                        deleted = body.get("deleted_at") is not None
+                        self._upsert(connection, entity, [body], deleted)
+                elif method in ("POST", "PATCH") and rest and rest[-1] in ("create", "update"):
+                    if isinstance(body, dict) and body.get("id") is not None:
+                        self._upsert(connection, entity, [body], False)
+                elif len(rest) == 2 and rest[1] in ("delete", "restore"):
+                    connection.execute(
+                        "UPDATE records SET deleted = ? WHERE entity = ? AND id = ?",
+                        (1 if rest[1] == "delete" else 0, entity, rest[0])
+                    )
+                elif len(rest) == 2 and rest[1] == "force-delete":
+                    connection.execute("DELETE FROM records WHERE entity = ? AND id = ?", (entity, rest[0]))
+                elif len(rest) == 4 and rest[0] == "users" and rest[2] == "accounts":
+                    # "/users_accounts/users/<user id>/accounts/<account id>" links or unlinks a pair.
+                    if method == "POST" and isinstance(body, dict) and body.get("id") is not None:
+                        self._upsert(connection, entity, [body], False)
+                    elif method == "DELETE":
+                        connection.execute(
+                            "DELETE FROM records WHERE entity = ? AND json_extract(data, '$.user_id') = ? "
+                            "AND json_extract(data, '$.account_id') = ?",
+                            (entity, rest[1], rest[3])
+                        )
+
+    def finish_full_sync(self, endpoint, seen_ids):
+        # Called once a paginated walk over a whole collection completed.
+        parsed = self.parse_endpoint(endpoint)
+        if parsed is None or len(parsed) != 2 or parsed[1] not in (SCOPE_ACTIVE, SCOPE_DELETED):
+            return
+        entity, scope = parsed
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._prune(connection, entity, scope == SCOPE_DELETED, seen_ids)
+                self._mark_synced(connection, entity, scope)
+
+    def get_state(self, entity, key, default=None):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM sync_state WHERE entity = ? AND key = ?", (entity, key)
+            ).fetchone()
+        return row[0] if row is not None else default
+
+    def set_state(self, entity, key, value):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._write_state(connection, entity, key, value)
+
+    def has_synced(self, entity, scope=SCOPE_ACTIVE):
+        return self.get_state(entity, f"synced:{scope}") is not None
+
+    def remove(self, entity, record_id):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM records WHERE entity = ? AND id = ?", (entity, str(record_id)))
+
+    def get_all(self, entity, deleted=False):
+        return self.get_page(entity, deleted)
+
+    def get_page(self, entity, deleted=False, skip=0, limit=None):
+        # limit=None returns every row from skip on; the paging runs in SQLite, so only the page is decoded.
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT data FROM records WHERE entity = ? AND deleted = ? ORDER BY rowid LIMIT ? OFFSET ?",
+                (entity, 1 if deleted else 0, -1 if limit is None else limit, skip)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_index(self, entity):
+        return {str(record["id"]): record for record in self.get_all(entity)}
+
+    def get(self, entity, record_id):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT data FROM records WHERE entity = ? AND id = ?", (entity, str(record_id))
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def offline_response(self, endpoint, params=None):
+        # Rebuilds what a GET would have returned from the mirror, or None if it was never synced.
+        parsed = self.parse_endpoint(endpoint)
+        if parsed is None or len(parsed) != 2:
+            return None
+        entity, target = parsed
+
+        if target in (SCOPE_ACTIVE, SCOPE_DELETED):
+            params = params or {}
+            if any(key not in PAGING_PARAMS for key in params) or not self.has_synced(entity, target):
+                # A filtered query (a delta sync, say) cannot be answered from the mirror.
+                return None
+            limit = int(params["limit"]) if "limit" in params else None
+            return self.get_page(entity, target == SCOPE_DELETED, int(params.get("skip", 0)), limit)
+        return self.get(entity, target)
+
+
+local_store = LocalStore()
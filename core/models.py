@@ -0,0 +1,153 @@
+import sys
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+
+def _intern(value):
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+
+def _to_decimal(value):
+    if value is None or value == "":
+        return value
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return value
+
+
+def _to_date(value):
+    if isinstance(value, str) and value:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _to_datetime(value):
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+class Record:
+    # Compact, slot-based replacement for the JSON dicts returned by the API. Ids and other
+    # low-cardinality strings are interned, amounts become Decimal and dates are parsed.
+    # get()/[]/in keep the dict-style access used by the pages and DetailFormComponent.
+    __slots__ = ("_extra",)
+    _converters = {}
+    _field_set = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.__slots__)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        # Fields missing from the payload stay unset, so get() behaves exactly like dict.get().
+        record = cls.__new__(cls)
+        extra = None
+        for key, value in data.items():
+            if key in cls._field_set:
+                converter = cls._converters.get(key)
+                setattr(record, key, converter(value) if converter else value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        record._extra = extra
+        return record
+
+    def get(self, key, default=None):
+        if key in self._field_set:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def keys(self):
+        return [field for field in self.__slots__ if hasattr(self, field)] + list(self._extra or ())
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.__slots__ if hasattr(self, field)}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.get('id')!r})"
+
+
+_TIMESTAMPS = {"created_at": _to_datetime, "updated_at": _to_datetime, "deleted_at": _to_datetime}
+
+
+class TransactionRecord(Record):
+    __slots__ = ("id", "user_id", "category_id", "name", "description", "amount", "date", "is_recurring",
+                 "recurrence_interval", "next_due_date", "created_at", "updated_at", "deleted_at")
+    _converters = {"id": _intern, "user_id": _intern, "category_id": _intern, "amount": _to_decimal,
+                   "date": _to_date, "recurrence_interval": _intern, "next_due_date": _to_date, **_TIMESTAMPS}
+
+
+class UserRecord(Record):
+    __slots__ = ("id", "first_name", "last_name", "cpf", "email", "manual_balance", "created_at", "updated_at",
+                 "deleted_at")
+    _converters = {"id": _intern, "manual_balance": _to_decimal, **_TIMESTAMPS}
+
+
+class AccountRecord(Record):
+    __slots__ = ("id", "name", "type", "account_number", "balance", "created_at", "updated_at", "deleted_at")
+    _converters = {"id": _intern, "type": _intern, "balance": _to_decimal, **_TIMESTAMPS}
+
+
+class CategoryRecord(Record):
+    __slots__ = ("id", "user_id", "category_type_id", "name", "description", "created_at", "updated_at",
+                 "deleted_at")
+    _converters = {"id": _intern, "user_id": _intern, "category_type_id": _intern, **_TIMESTAMPS}
+
+
+class CategoryTypeRecord(Record):
+    __slots__ = ("id", "name", "is_positive", "created_at", "updated_at", "deleted_at")
+    _converters = {"id": _intern, "name": _intern, **_TIMESTAMPS}
+
+
+class FinancialGoalRecord(Record):
+    __slots__ = ("id", "user_id", "name", "description", "target_amount", "deadline", "created_at", "updated_at",
+                 "deleted_at")
+    _converters = {"id": _intern, "user_id": _intern, "target_amount": _to_decimal, "deadline": _to_date,
+                   **_TIMESTAMPS}
+
+
+class UserAccountRecord(Record):
+    __slots__ = ("id", "user_id", "account_id", "created_at", "updated_at", "deleted_at")
+    _converters = {"id": _intern, "user_id": _intern, "account_id": _intern, **_TIMESTAMPS}
+
+
+def to_records(record_type, data):
+    if data is None:
+        return data
+    if isinstance(data, dict):
+        return record_type.from_dict(data) if data else data
+    if isinstance(data, list):
+        return [record_type.from_dict(item) if isinstance(item, dict) else item for item in data]
+    return (record_type.from_dict(item) if isinstance(item, dict) else item for item in data)
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from core.accounts_endpoints import account_api_client
+from core.api_client import APIClient
+from core.categories_endpoints import category_api_client
+from core.category_types_endpoints import category_type_api_client
+from core.local_store import local_store
+from core.users_endpoints import user_api_client
+
+DEFAULT_TTLS = {
+    "users": 300,
+    "categories": 300,
+    "accounts": 300,
+    "category_types": 3600,
+}
+
+
+class _ReferenceEntry:
+    def __init__(self, client, loader_name, ttl):
+        self.client = client
+        self.loader_name = loader_name
+        self.ttl = ttl
+        self.records = []
+        self.index = {}
+        self.loaded_at = None
+        self.lock = threading.Lock()
+
+    def is_fresh(self):
+        return self.loaded_at is not None and (time.monotonic() - self.loaded_at) < self.ttl
+
+
+class ReferenceDataStore:
+    def __init__(self):
+        self._entries = {
+            "users": _ReferenceEntry(user_api_client, "get_all_users", DEFAULT_TTLS["users"]),
+            "categories": _ReferenceEntry(category_api_client, "get_all_categories", DEFAULT_TTLS["categories"]),
+            "accounts": _ReferenceEntry(account_api_client, "get_all_accounts", DEFAULT_TTLS["accounts"]),
+            "category_types": _ReferenceEntry(category_type_api_client, "get_all_category_types",
+                                              DEFAULT_TTLS["category_types"]),
+        }
+        APIClient.add_mutation_listener(self._on_mutation)
+
+    def _entry(self, entity):
+        entry = self._entries.get(entity)
+        if entry is None:
+            raise ValueError(f"Unknown reference entity: {entity}")
+        return entry
+
+    def _ensure_loaded(self, entity, force=False):
+        entry = self._entry(entity)
+        if not force and entry.is_fresh():
+            return entry
+
+        with entry.lock:
+            if force or not entry.is_fresh():
+                records = getattr(entry.client, entry.loader_name)() or []
+                entry.records = records
+                entry.index = {str(record["id"]): record for record in records if record and "id" in record}
+                entry.loaded_at = time.monotonic()
+        return entry
+
+    def get_all(self, entity, force=False):
+        return self._ensure_loaded(entity, force).records
+
+    def get_index(self, entity, force=False):
+        return self._ensure_loaded(entity, force).index
+
+    def get(self, entity, record_id, default=None):
+        return self.get_index(entity).get(str(record_id), default)
+
+    def set_ttl(self, entity, seconds):
+        self._entry(entity).ttl = seconds
+
+    def invalidate(self, entity=None):
+        entities = [entity] if entity else list(self._entries)
+        for name in entities:
+            self._entry(name).loaded_at = None
+
+    def _on_mutation(self, client, method, endpoint):
+        # Matched by endpoint too: queued writes are replayed through the base api_client.
+        parsed = local_store.parse_endpoint(endpoint)
+        entity = parsed[0] if parsed else None
+        for name, entry in self._entries.items():
+            if entry.client is client or name == entity:
+                entry.loaded_at = None
+
+
+reference_store = ReferenceDataStore()
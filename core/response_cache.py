@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+
+class _CachedResponse:
+    __slots__ = ("etag", "last_modified", "body")
+
+    def __init__(self, etag, last_modified, body):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+
+
+class ResponseCache:
+    # LRU of decoded GET bodies keyed by method + URL (including query params), together with
+    # the validators needed to revalidate them with If-None-Match / If-Modified-Since. A body is
+    # kept once and handed to every caller that gets a 304 for it, so GET results are read-only:
+    # code that needs to edit one works on its own copy (or on the as_records objects).
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method, url, params=None):
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+        return f"{method} {url}"
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, key):
+        entry = self.get(key)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key, response, body):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.max_entries <= 0:
+            return
+        if not etag and not last_modified:
+            self.discard(key)
+            return
+
+        with self._lock:
+            self._entries[key] = _CachedResponse(etag, last_modified, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def resize(self, max_entries):
+        with self._lock:
+            self.max_entries = max_entries
+            while len(self._entries) > max(max_entries, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,271 @@
+import csv
+import hashlib
+from collections import Counter
+import html
+import os
+import re
+from datetime import datetime
+
+from core.api_client import APIClient
+from core.reference_store import reference_store
+from core.transactions_endpoints import transaction_api_client
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "200"))
+IMPORT_DATE_FORMATS = [fmt.strip() for fmt in os.getenv("IMPORT_DATE_FORMATS",
+                                                        "%Y-%m-%d,%d/%m/%Y,%m/%d/%Y,%Y%m%d").split(",")
+                       if fmt.strip()]
+IMPORT_MAX_REPORTED_ERRORS = int(os.getenv("IMPORT_MAX_REPORTED_ERRORS", "100"))
+
+# Transaction fields a statement column can be mapped to, as on TransactionCreatePage.
+IMPORT_FIELDS = ('user_id', 'category_id', 'name', 'description', 'amount', 'date', 'is_recurring')
+
+OFX_CHUNK_SIZE = 65536
+OFX_FIELDS = {"FITID": "fitid", "NAME": "name", "MEMO": "description", "TRNAMT": "amount", "DTPOSTED": "date"}
+
+TRUE_VALUES = ("true", "yes", "y", "1", "sim")
+
+
+def _sniff_dialect(file):
+    sample = file.read(4096)
+    file.seek(0)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|")
+    except csv.Error:
+        return csv.excel
+
+
+def read_csv_header(path, encoding="utf-8-sig"):
+    with open(path, newline="", encoding=encoding) as file:
+        return next(csv.reader(file, _sniff_dialect(file)), [])
+
+
+def iter_csv_rows(path, column_map, encoding="utf-8-sig"):
+    # Yields (line number, {field: raw value}) one row at a time; column_map is {field: column header}.
+    with open(path, newline="", encoding=encoding) as file:
+        reader = csv.DictReader(file, dialect=_sniff_dialect(file))
+        for row in reader:
+            yield reader.line_num, {field: (row.get(column) or "").strip()
+                                    for field, column in column_map.items() if column}
+
+
+def _iter_ofx_tags(file):
+    # OFX 1.x is SGML whose leaf tags are never closed and 2.x is XML, often all on one line,
+    # so the file is split on "<" a chunk at a time instead of line by line.
+    pending = ""
+    for chunk in iter(lambda: file.read(OFX_CHUNK_SIZE), ""):
+        pieces = (pending + chunk).split("<")
+        pending = pieces.pop()
+        for piece in pieces:
+            tag, separator, value = piece.partition(">")
+            if separator:
+                yield tag.strip().upper(), value.strip()
+    tag, separator, value = pending.partition(">")
+    if separator:
+        yield tag.strip().upper(), value.strip()
+
+
+def iter_ofx_rows(path, encoding="latin-1"):
+    # Yields (transaction number, {field: raw value}) for every <STMTTRN> in the statement.
+    with open(path, encoding=encoding, errors="replace") as file:
+        current = None
+        number = 0
+        for tag, value in _iter_ofx_tags(file):
+            if tag == "STMTTRN":
+                current = {}
+            elif tag == "/STMTTRN" and current is not None:
+                number += 1
+                yield number, current
+                current = None
+            elif current is not None and tag in OFX_FIELDS and value:
+                current.setdefault(OFX_FIELDS[tag], html.unescape(value))
+
+
+def parse_amount(value):
+    text = (value or "").strip()
+    negative = text.startswith("(") and text.endswith(")")
+    text = re.sub(r"[^0-9,.+-]", "", text)
+    if "," in text and "." in text:
+        # Whichever separator comes last is the decimal one.
+        if text.rfind(".") > text.rfind(","):
+            text = text.replace(",", "")
+        else:
+            text = text.replace(".", "").replace(",", ".")
+    elif "," in text:
+        text = text.replace(",", ".")
+    try:
+        amount = float(text)
+    except ValueError:
+        raise ValueError(f"Invalid amount: {value}")
+    return -abs(amount) if negative else amount
+
+
+def parse_date(value):
+    text = (value or "").strip()
+    for fmt in IMPORT_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date().isoformat()
+        except ValueError:
+            continue
+    # OFX dates look like 20240131120000[-3:BRT].
+    if re.match(r"\d{8}", text):
+        try:
+            return datetime.strptime(text[:8], "%Y%m%d").date().isoformat()
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid date: {value}")
+
+
+def _fingerprint(user_id, date, amount, name):
+    key = f"{user_id}|{str(date)[:10]}|{float(amount):.2f}|{(name or '').strip().casefold()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+class StatementImporter:
+    # Turns statement rows into transactions. User and category names are resolved to ids through
+    # in-memory indexes, and the rows are created IMPORT_BATCH_SIZE at a time, so memory is bounded
+    # by the batch and the indexes rather than by the file. A row is skipped as a duplicate when it
+    # matches a transaction already on the server (same user, date, amount and name), each existing
+    # transaction matching at most one row, or when its OFX FITID already appeared in the file.
+    # Identical rows without a FITID are legitimate repeats (two equal purchases on one day):
+    # they are counted as repeated but still created.
+    def __init__(self, default_user_id=None, default_category_id=None, batch_size=IMPORT_BATCH_SIZE):
+        self.default_user_id = default_user_id
+        self.default_category_id = default_category_id
+        self.batch_size = max(1, batch_size)
+        self.users = {}
+        self.categories = {}
+        self.existing = Counter()
+        self.seen = set()
+        self.fitids = set()
+
+    def load_indexes(self):
+        self.users = {}
+        for user in reference_store.get_all("users"):
+            user_id = str(user.get("id"))
+            full_name = f"{user.get('first_name') or ''} {user.get('last_name') or ''}"
+            for name in (user_id, user.get("first_name"), full_name, user.get("email")):
+                if name and name.strip():
+                    self.users.setdefault(name.strip().casefold(), user_id)
+
+        self.categories = {}
+        for category in reference_store.get_all("categories"):
+            category_id = str(category.get("id"))
+            self.categories.setdefault(category_id.casefold(), category_id)
+            if category.get("name"):
+                name = category["name"].strip().casefold()
+                self.categories.setdefault(name, category_id)
+                self.categories[(str(category.get("user_id")), name)] = category_id
+
+        self.existing = Counter(
+            _fingerprint(transaction.get("user_id"), transaction.get("date"), transaction.get("amount") or 0,
+                         transaction.get("name"))
+            for transaction in transaction_api_client.iter_transactions(as_records=True)
+        )
+        self.seen = set()
+        self.fitids = set()
+
+    @staticmethod
+    def _resolve(index, value, default, label, scope=None):
+        if value:
+            key = value.strip().casefold()
+            resolved = index.get((scope, key)) if scope is not None else None
+            resolved = resolved or index.get(key)
+            if resolved is None:
+                raise ValueError(f"Unknown {label}: {value}")
+            return resolved
+        if default:
+            return default
+        raise ValueError(f"Missing {label}")
+
+    def build_payload(self, raw):
+        user_id = self._resolve(self.users, raw.get("user_id"), self.default_user_id, "user")
+        category_id = self._resolve(self.categories, raw.get("category_id"), self.default_category_id, "category",
+                                    scope=user_id)
+        name = raw.get("name") or raw.get("description")
+        if not name:
+            raise ValueError("Missing name")
+        return {
+            'user_id': user_id,
+            'category_id': category_id,
+            'name': name,
+            'description': raw.get('description') or '',
+            'amount': parse_amount(raw.get('amount')),
+            'date': parse_date(raw.get('date')),
+            'is_recurring': (raw.get('is_recurring') or '').strip().casefold() in TRUE_VALUES,
+        }
+
+    @staticmethod
+    def _fail(stats, line, error):
+        stats["failed"] += 1
+        if len(stats["errors"]) < IMPORT_MAX_REPORTED_ERRORS:
+            stats["errors"].append((line, str(error)))
+
+    def _is_duplicate(self, raw, payload, stats):
+        fitid = raw.get("fitid")
+        if fitid:
+            if fitid in self.fitids:
+                return True
+            self.fitids.add(fitid)
+
+        fingerprint = _fingerprint(payload['user_id'], payload['date'], payload['amount'], payload['name'])
+        if self.existing[fingerprint] > 0:
+            self.existing[fingerprint] -= 1
+            return True
+        if fingerprint in self.seen:
+            stats["repeated"] += 1
+        self.seen.add(fingerprint)
+        return False
+
+    def _create_batch(self, batch, stats, stop=None):
+        payloads = [payload for _line, payload in batch]
+        sent = 0
+        for index, result in transaction_api_client.iter_create_transactions(payloads, stop=stop):
+            sent += 1
+            line, _payload = batch[index]
+            if not isinstance(result, Exception):
+                stats["created"] += 1
+            elif APIClient.may_have_been_applied(result):
+                self._fail(stats, line, f"May have been created; check before importing again ({result})")
+            else:
+                self._fail(stats, line, result)
+        stats["not_sent"] += len(batch) - sent
+
+    def run(self, rows, stop=None):
+        # rows yields (line number, {field: raw value}); a stats dict is yielded after every batch.
+        # Once the stop event is set no further rows are read or sent and the last stats dict has
+        # "cancelled" set.
+        stats = {"read": 0, "created": 0, "duplicates": 0, "repeated": 0, "failed": 0, "not_sent": 0,
+                 "cancelled": False, "errors": []}
+        batch = []
+        for line, raw in rows:
+            stats["read"] += 1
+            try:
+                payload = self.build_payload(raw)
+            except ValueError as e:
+                self._fail(stats, line, e)
+                payload = None
+
+            if payload is not None:
+                if self._is_duplicate(raw, payload, stats):
+                    stats["duplicates"] += 1
+                else:
+                    batch.append((line, payload))
+
+            if len(batch) >= self.batch_size:
+                self._create_batch(batch, stats, stop)
+                batch = []
+                yield dict(stats)
+            elif stats["read"] % self.batch_size == 0:
+                yield dict(stats)
+
+            if stop is not None and stop.is_set():
+                stats["cancelled"] = True
+                break
+
+        if batch:
+            if stats["cancelled"]:
+                stats["not_sent"] += len(batch)
+            else:
+                self._create_batch(batch, stats, stop)
+        stats["cancelled"] = stop is not None and stop.is_set()
+        yield dict(stats)
@@ -0,0 +1,236 @@
+import os
+import threading
+from datetime import datetime, timezone
+
+from core.accounts_endpoints import account_api_client
+from core.api_client import APIClient
+from core.categories_endpoints import category_api_client
+from core.category_types_endpoints import category_type_api_client
+from core.financial_goals_endpoints import financial_goals_api_client
+from core.local_store import local_store, SCOPE_ACTIVE, SCOPE_DELETED
+from core.models import to_records
+from core.transactions_endpoints import transaction_api_client
+from core.user_accounts_endpoints import users_accounts_api_client
+from core.users_endpoints import user_api_client
+
+API_SYNC_SINCE_PARAM = os.getenv("API_SYNC_SINCE_PARAM", "updated_since")
+
+WATERMARK_KEY = "watermark"
+TIMESTAMP_FIELDS = ("updated_at", "deleted_at", "created_at")
+
+
+def _parse_timestamp(value):
+    # Always aware UTC so server values with and without an offset compare; naive ones are taken as UTC.
+    if isinstance(value, str) and value:
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _newest_timestamp(records):
+    newest = None
+    for record in records:
+        for field in TIMESTAMP_FIELDS:
+            stamp = _parse_timestamp(record.get(field))
+            if stamp is not None and (newest is None or stamp > newest):
+                newest = stamp
+    return newest
+
+
+class _SyncEntry:
+    def __init__(self, client, has_trash):
+        self.client = client
+        self.has_trash = has_trash
+        self.active = {}
+        self.deleted = {}
+        self.baseline = {SCOPE_ACTIVE: False, SCOPE_DELETED: False}
+        self.watermark = None
+        self.restored = False
+        # lock guards the fields above and is never held across a request; sync_lock keeps two
+        # syncs of the same entity from overlapping, and generation tells a sync that a seed or
+        # reset replaced the data while it was fetching.
+        self.lock = threading.Lock()
+        self.sync_lock = threading.Lock()
+        self.generation = 0
+
+
+class SyncEngine:
+    # Keeps an in-memory copy of an entity's active and trashed records plus a high-water mark (the
+    # newest created_at / updated_at / deleted_at seen), and refreshes it by asking the list endpoints
+    # only for records changed since then. A full load seeds the baseline; with LOCAL_STORE_PATH set
+    # the watermark is kept in the local store so the next session resumes from the mirror.
+    def __init__(self):
+        self._entries = {
+            "transactions": _SyncEntry(transaction_api_client, True),
+            "users": _SyncEntry(user_api_client, True),
+            "categories": _SyncEntry(category_api_client, True),
+            "accounts": _SyncEntry(account_api_client, True),
+            "category_types": _SyncEntry(category_type_api_client, False),
+            "financial_goals": _SyncEntry(financial_goals_api_client, False),
+            "users_accounts": _SyncEntry(users_accounts_api_client, False),
+        }
+        APIClient.add_mutation_listener(self._on_mutation)
+
+    def _entry(self, entity):
+        entry = self._entries.get(entity)
+        if entry is None:
+            raise ValueError(f"Unknown sync entity: {entity}")
+        return entry
+
+    @staticmethod
+    def _scope(deleted):
+        return SCOPE_DELETED if deleted else SCOPE_ACTIVE
+
+    def _restore(self, entity, entry):
+        # Called with entry.lock held: resumes from the local mirror the first time an entity is used.
+        if entry.restored:
+            return
+        entry.restored = True
+        if not local_store.enabled:
+            return
+
+        try:
+            watermark = _parse_timestamp(local_store.get_state(entity, WATERMARK_KEY))
+            if watermark is None:
+                return
+            for deleted in ((False, True) if entry.has_trash else (False,)):
+                scope = self._scope(deleted)
+                if not local_store.has_synced(entity, scope):
+                    continue
+                saved = local_store.get_all(entity, deleted=deleted)
+                if entry.client.record_type is not None:
+                    saved = to_records(entry.client.record_type, saved)
+                self._replace(entry, saved, deleted)
+            if any(entry.baseline.values()):
+                entry.watermark = watermark
+        except Exception as e:
+            print(f"Failed to restore sync state for {entity}: {e}")
+
+    def _replace(self, entry, records, deleted):
+        target, other = (entry.deleted, entry.active) if deleted else (entry.active, entry.deleted)
+        target.clear()
+        for record in records:
+            if record.get("id") is not None:
+                key = str(record["id"])
+                target[key] = record
+                other.pop(key, None)
+        entry.baseline[self._scope(deleted)] = True
+
+    def _save_watermark(self, entity, entry):
+        if not local_store.enabled or local_store.offline or entry.watermark is None:
+            return
+        try:
+            local_store.set_state(entity, WATERMARK_KEY, entry.watermark.isoformat())
+        except Exception as e:
+            print(f"Failed to save the sync watermark for {entity}: {e}")
+
+    def has_baseline(self, entity, deleted=False):
+        entry = self._entry(entity)
+        with entry.lock:
+            self._restore(entity, entry)
+            return entry.baseline[self._scope(deleted)]
+
+    def seed(self, entity, records, deleted=False):
+        # Records the result of a complete load of one scope (active or trash) as its baseline.
+        entry = self._entry(entity)
+        with entry.lock:
+            entry.restored = True
+            entry.generation += 1
+            self._replace(entry, records, deleted)
+            newest = _newest_timestamp(records)
+            if newest is not None:
+                # The other scope is only known to be complete up to the old watermark.
+                other_scope = self._scope(not deleted)
+                if entry.watermark is None or not entry.baseline[other_scope]:
+                    entry.watermark = newest
+                else:
+                    entry.watermark = min(entry.watermark, newest)
+            self._save_watermark(entity, entry)
+
+    def sync(self, entity):
+        # Fetches what changed since the watermark and merges it; returns the number of changed records.
+        entry = self._entry(entity)
+        with entry.sync_lock:
+            with entry.lock:
+                self._restore(entity, entry)
+                if entry.watermark is None:
+                    raise Exception(f"No {entity} have been loaded yet; load them in full first")
+                watermark = entry.watermark
+                generation = entry.generation
+
+            params = {API_SYNC_SINCE_PARAM: watermark.isoformat()}
+            changed = list(entry.client.iter_records(f"/{entity}/all", params=params, as_records=True))
+            trashed = []
+            if entry.has_trash:
+                trashed = list(entry.client.iter_records(f"/{entity}/deleted", params=params, as_records=True))
+
+            with entry.lock:
+                if entry.generation != generation:
+                    # Reloaded in full meanwhile; that load is at least as new as this delta.
+                    return 0
+                self._merge(entity, entry, changed, trashed)
+            return len(changed) + len(trashed)
+
+    def _merge(self, entity, entry, changed, trashed):
+        # Called with entry.lock held.
+        for record in changed:
+            if record.get("id") is not None:
+                entry.deleted.pop(str(record["id"]), None)
+                entry.active[str(record["id"])] = record
+        for record in trashed:
+            if record.get("id") is not None:
+                entry.active.pop(str(record["id"]), None)
+                entry.deleted[str(record["id"])] = record
+
+        newest = _newest_timestamp(changed + trashed)
+        if newest is not None and newest > entry.watermark:
+            entry.watermark = newest
+        self._save_watermark(entity, entry)
+
+    def get_all(self, entity, deleted=False):
+        entry = self._entry(entity)
+        with entry.lock:
+            self._restore(entity, entry)
+            return list((entry.deleted if deleted else entry.active).values())
+
+    def reset(self, entity=None):
+        entities = [entity] if entity else list(self._entries)
+        for name in entities:
+            entry = self._entry(name)
+            with entry.lock:
+                entry.generation += 1
+                entry.active.clear()
+                entry.deleted.clear()
+                entry.baseline = {SCOPE_ACTIVE: False, SCOPE_DELETED: False}
+                entry.watermark = None
+
+    def _on_mutation(self, client, method, endpoint):
+        # A force-delete never shows up in a delta, so trash moves made from this client are applied here.
+        parsed = local_store.parse_endpoint(endpoint)
+        if parsed is None or len(parsed) != 3 or parsed[2] not in ("delete", "restore", "force-delete"):
+            return
+        entry = self._entries.get(parsed[0])
+        if entry is None:
+            return
+
+        key, action = parsed[1], parsed[2]
+        with entry.lock:
+            if action == "delete":
+                record = entry.active.pop(key, None)
+                if record is not None:
+                    entry.deleted[key] = record
+            elif action == "restore":
+                record = entry.deleted.pop(key, None)
+                if record is not None:
+                    entry.active[key] = record
+            else:
+                entry.deleted.pop(key, None)
+
+
+sync_engine = SyncEngine()
@@ -0,0 +1,130 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+TASK_RUNNER_WORKERS = int(os.getenv("TASK_RUNNER_WORKERS", "4"))
+TASK_RUNNER_POLL_MS = int(os.getenv("TASK_RUNNER_POLL_MS", "30"))
+
+
+class BackgroundTask:
+    def __init__(self):
+        self.cancelled = False
+        self.partial = False
+        self.future = None
+        # Set for work that must finish even after its page is hidden (writes, bulk runs).
+        self.keep_on_hide = False
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class TaskRunner:
+    # Runs blocking work (API calls) on a worker pool and hands the results back to
+    # the Tk thread through a queue drained with after(); Tk widgets must never be
+    # touched from the workers.
+    def __init__(self, max_workers=TASK_RUNNER_WORKERS, poll_ms=TASK_RUNNER_POLL_MS):
+        self._max_workers = max_workers
+        self._poll_ms = poll_ms
+        self._executor = None
+        self._ui_queue = queue.Queue()
+        self._root = None
+        self._poll_id = None
+        self._closed = False
+
+    def attach(self, root):
+        self._root = root
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mwu-worker")
+        self._poll_id = self._root.after(self._poll_ms, self._drain_ui_queue)
+
+    def shutdown(self):
+        if self._root is not None and self._poll_id is not None:
+            try:
+                self._root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+        self._root = None
+        self._poll_id = None
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _drain_ui_queue(self):
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"UI callback failed: {e}")
+
+        if self._root is not None:
+            self._poll_id = self._root.after(self._poll_ms, self._drain_ui_queue)
+
+    def call_in_ui(self, callback, *args):
+        # Off the Tk thread callbacks are always queued: before attach() they wait for the first
+        # drain, after shutdown() there is no Tk loop left to run them and they are dropped.
+        if threading.current_thread() is threading.main_thread():
+            callback(*args)
+        elif not self._closed:
+            self._ui_queue.put((callback, args))
+
+    def _deliver(self, task, callback, value):
+        if callback is None:
+            return
+
+        def deliver():
+            if not task.cancelled:
+                callback(value)
+
+        self.call_in_ui(deliver)
+
+    def _run(self, task, func, on_success, on_error):
+        if task.cancelled:
+            return
+        try:
+            result = func()
+        except Exception as e:
+            self._deliver(task, on_error, e)
+            return
+        self._deliver(task, on_success, result)
+
+    def _run_stream(self, task, factory, on_chunk, on_done, on_error):
+        if task.cancelled:
+            return
+        try:
+            for chunk in factory():
+                if task.cancelled:
+                    return
+                self._deliver(task, on_chunk, chunk)
+        except Exception as e:
+            self._deliver(task, on_error, e)
+            return
+        self._deliver(task, on_done, None)
+
+    def stream(self, factory, on_chunk, on_done=None, on_error=None):
+        # factory() returns an iterable of chunks; each chunk is handed to on_chunk on the
+        # Tk thread as soon as it is produced, and iteration stops once the task is cancelled.
+        task = BackgroundTask()
+        if self._executor is None:
+            self._run_stream(task, factory, on_chunk, on_done, on_error)
+        else:
+            task.future = self._executor.submit(self._run_stream, task, factory, on_chunk, on_done, on_error)
+        return task
+
+    def submit(self, func, on_success=None, on_error=None):
+        task = BackgroundTask()
+        if self._executor is None:
+            self._run(task, func, on_success, on_error)
+        else:
+            task.future = self._executor.submit(self._run, task, func, on_success, on_error)
+        return task
+
+
+task_runner = TaskRunner()
@@ -1,30 +1,72 @@
 from uuid import UUID
 
-from core.api_client import APIClient
+from core.api_client import APIClient, new_idempotency_key
+from core.fan_out import fan_out_iter
+from core.models import TransactionRecord
 
 
 class TransactionAPIClient(APIClient):
+    record_type = TransactionRecord
 
-    def get_all_transactions(self):
-        return self._make_request("GET", "/transactions/all")
+    def get_all_transactions(self, stream: bool = False, as_records: bool = False):
+        transactions = self._make_request("GET", "/transactions/all", stream=stream, bulk=True)
+        return self._as_records(transactions, as_records)
 
-    def get_deleted_transactions(self):
-        return self._make_request("GET", "/transactions/deleted")
+    def iter_transactions(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/transactions/all", page_size, as_records=as_records)
 
-    def get_transaction_by_id(self, transaction_id: UUID):
-        return self._make_request("GET", f"/transactions/{transaction_id}")
+    def iter_transaction_pages(self, page_size: int = None, as_records: bool = False):
+        return self.iter_pages("/transactions/all", page_size, as_records=as_records)
 
-    def create_transaction(self, transaction_data: dict):
-        return self._make_request("POST", "/transactions/create", data=transaction_data)
+    def get_deleted_transactions(self, stream: bool = False, as_records: bool = False):
+        transactions = self._make_request("GET", "/transactions/deleted", stream=stream, bulk=True)
+        return self._as_records(transactions, as_records)
 
-    def update_transaction(self, transaction_id: UUID, transaction_data: dict):
-        return self._make_request("PATCH", f"/transactions/{transaction_id}/update", data=transaction_data)
+    def iter_deleted_transactions(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/transactions/deleted", page_size, as_records=as_records)
+
+    def iter_deleted_transaction_pages(self, page_size: int = None, as_records: bool = False):
+        return self.iter_pages("/transactions/deleted", page_size, as_records=as_records)
+
+    def get_transaction_by_id(self, transaction_id: UUID, as_records: bool = False):
+        return self._as_records(self._make_request("GET", f"/transactions/{transaction_id}"), as_records)
+
+    def create_transaction(self, transaction_data: dict, idempotency_key: str = None):
+        return self._make_request("POST", "/transactions/create", data=transaction_data,
+                                  idempotency_key=idempotency_key)
+
+    def iter_create_transactions(self, transactions: list, idempotency_keys: list = None, max_in_flight: int = None,
+                                 stop=None):
+        # There is no batch endpoint: the creates are pipelined with at most max_in_flight in flight
+        # and (index, created transaction or exception) is yielded as each one finishes. Setting the
+        # stop event sends no further creates; indexes never yielded were not sent.
+        if idempotency_keys is None:
+            idempotency_keys = [new_idempotency_key() for _ in transactions]
+        calls = {
+            index: (lambda transaction=transaction, key=key: self.create_transaction(transaction, key))
+            for index, (transaction, key) in enumerate(zip(transactions, idempotency_keys))
+        }
+        return fan_out_iter(calls, max_in_flight, stop)
+
+    def create_transactions(self, transactions: list, idempotency_keys: list = None, max_in_flight: int = None):
+        results = [None] * len(transactions)
+        for index, result in self.iter_create_transactions(transactions, idempotency_keys, max_in_flight):
+            results[index] = result
+        return results
+
+    def get_transaction_etag(self, transaction_id: UUID):
+        return self.etag_for(f"/transactions/{transaction_id}")
+
+    def update_transaction(self, transaction_id: UUID, transaction_data: dict, idempotency_key: str = None,
+                           if_match: str = None):
+        return self._make_request("PATCH", f"/transactions/{transaction_id}/update", data=transaction_data,
+                                  idempotency_key=idempotency_key, if_match=if_match)
 
     def delete_transaction(self, transaction_id: UUID):
         return self._make_request("DELETE", f"/transactions/{transaction_id}/delete")
 
-    def restore_transaction(self, transaction_id: UUID):
-        return self._make_request("POST", f"/transactions/{transaction_id}/restore")
+    def restore_transaction(self, transaction_id: UUID, idempotency_key: str = None):
+        return self._make_request("POST", f"/transactions/{transaction_id}/restore", idempotency_key=idempotency_key)
 
     def force_delete_transaction(self, transaction_id: UUID):
         return self._make_request("DELETE", f"/transactions/{transaction_id}/force-delete")
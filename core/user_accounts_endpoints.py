@@ -1,18 +1,24 @@
 from uuid import UUID
 
 from core.api_client import APIClient
+from core.models import UserAccountRecord
 
 
 class UserAccountsAPIClient(APIClient):
+    record_type = UserAccountRecord
 
     def get_all_users_accounts(self):
-        return self._make_request("GET", "/users_accounts/all")
+        return self._make_request("GET", "/users_accounts/all", bulk=True)
+
+    def iter_users_accounts(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/users_accounts/all", page_size, as_records=as_records)
 
     def get_users_accounts_by_id(self, users_accounts_id: UUID):
         return self._make_request("GET", f"/users_accounts/{users_accounts_id}")
 
-    def create_user_accounts(self, user_id: UUID, account_id: UUID):
-        return self._make_request("POST", f"/users_accounts/users/{user_id}/accounts/{account_id}")
+    def create_user_accounts(self, user_id: UUID, account_id: UUID, idempotency_key: str = None):
+        return self._make_request("POST", f"/users_accounts/users/{user_id}/accounts/{account_id}",
+                                  idempotency_key=idempotency_key)
 
     def delete_users_accounts(self, user_id: UUID, account_id: UUID):
         return self._make_request("DELETE", f"/users_accounts/users/{user_id}/accounts/{account_id}")
@@ -1,30 +1,41 @@
 from uuid import UUID
 
 from core.api_client import APIClient
+from core.models import UserRecord
 
 
 class UserAPIClient(APIClient):
+    record_type = UserRecord
 
     def get_all_users(self):
-        return self._make_request("GET", "/users/all")
+        return self._make_request("GET", "/users/all", bulk=True)
+
+    def iter_users(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/users/all", page_size, as_records=as_records)
+
+    def iter_user_pages(self, page_size: int = None, as_records: bool = False):
+        return self.iter_pages("/users/all", page_size, as_records=as_records)
 
     def get_deleted_users(self):
-        return self._make_request("GET", "/users/deleted")
+        return self._make_request("GET", "/users/deleted", bulk=True)
+
+    def iter_deleted_users(self, page_size: int = None, as_records: bool = False):
+        return self.iter_records("/users/deleted", page_size, as_records=as_records)
 
     def get_user_by_id(self, user_id: UUID):
         return self._make_request("GET", f"/users/{user_id}")
 
-    def create_user(self, user_data: dict):
-        return self._make_request("POST", "/users/create", data=user_data)
+    def create_user(self, user_data: dict, idempotency_key: str = None):
+        return self._make_request("POST", "/users/create", data=user_data, idempotency_key=idempotency_key)
 
-    def update_user(self, user_id: UUID, user_data: dict):
-        return self._make_request("PATCH", f"/users/{user_id}/update", data=user_data)
+    def update_user(self, user_id: UUID, user_data: dict, idempotency_key: str = None):
+        return self._make_request("PATCH", f"/users/{user_id}/update", data=user_data, idempotency_key=idempotency_key)
 
     def delete_user(self, user_id: UUID):
         return self._make_request("DELETE", f"/users/{user_id}/delete")
 
-    def restore_user(self, user_id: UUID):
-        return self._make_request("POST", f"/users/{user_id}/restore")
+    def restore_user(self, user_id: UUID, idempotency_key: str = None):
+        return self._make_request("POST", f"/users/{user_id}/restore", idempotency_key=idempotency_key)
 
     def force_delete_user(self, user_id: UUID):
         return self._make_request("DELETE", f"/users/{user_id}/force-delete")
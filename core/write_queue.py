@@ -0,0 +1,264 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from core.local_store import LOCAL_STORE_PATH, local_store
+
+WRITE_QUEUE_PATH = os.getenv("WRITE_QUEUE_PATH", LOCAL_STORE_PATH)
+WRITE_QUEUE_RETRY_SECONDS = float(os.getenv("WRITE_QUEUE_RETRY_SECONDS", "10"))
+
+# Placeholder ids handed out for records created while queued, replaced once the create is replayed.
+LOCAL_ID_PREFIX = "local-"
+
+STATUS_PENDING = "pending"
+STATUS_CONFLICT = "conflict"
+
+
+class WriteQueue:
+    # Durable outbox of create/update/delete/restore calls that could not reach the backend.
+    # Operations are replayed strictly in the order they were made by a single worker thread;
+    # one the backend rejects is kept as a conflict instead of being dropped.
+    # Disabled unless WRITE_QUEUE_PATH (or LOCAL_STORE_PATH) is set.
+    def __init__(self, path=WRITE_QUEUE_PATH):
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._worker = None
+        # Held while start_replay() decides whether a worker is running and while the worker
+        # decides to exit, so a wake-up sent in between cannot be lost.
+        self._worker_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def open(self, path=None):
+        if path is not None:
+            self.close()
+            self.path = path
+        return self._connect()
+
+    def close(self):
+        self._stopped = True
+        self._wake.set()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    method TEXT NOT NULL,
+                    endpoint TEXT NOT NULL,
+                    data TEXT,
+                    idempotency_key TEXT,
+                    local_id TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    if_match TEXT
+                )
+            """)
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(outbox)")}
+            if "if_match" not in columns:
+                connection.execute("ALTER TABLE outbox ADD COLUMN if_match TEXT")
+            self._connection = connection
+        return self._connection
+
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event, operation):
+        # event is "queued", "replayed", "conflict" or "discarded".
+        for listener in list(self._listeners):
+            try:
+                listener(event, operation)
+            except Exception as e:
+                print(f"Write queue listener failed: {e}")
+
+    @staticmethod
+    def _to_operation(row):
+        seq, method, endpoint, data, idempotency_key, local_id, status, error, created_at, if_match = row
+        return {
+            "seq": seq,
+            "method": method,
+            "endpoint": endpoint,
+            "data": json.loads(data) if data is not None else None,
+            "idempotency_key": idempotency_key,
+            "if_match": if_match,
+            "local_id": local_id,
+            "status": status,
+            "error": error,
+            "created_at": created_at,
+        }
+
+    def enqueue(self, method, endpoint, data=None, idempotency_key=None, local_id=None, if_match=None):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO outbox (method, endpoint, data, idempotency_key, local_id, created_at, if_match) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (method, endpoint, json.dumps(data, default=str) if data is not None else None,
+                     idempotency_key, local_id, time.time(), if_match)
+                )
+            row = connection.execute("SELECT * FROM outbox WHERE seq = ?", (cursor.lastrowid,)).fetchone()
+        operation = self._to_operation(row)
+        self._notify("queued", operation)
+        return operation
+
+    def operations(self, status=None):
+        with self._lock:
+            connection = self._connect()
+            if status is None:
+                rows = connection.execute("SELECT * FROM outbox ORDER BY seq").fetchall()
+            else:
+                rows = connection.execute("SELECT * FROM outbox WHERE status = ? ORDER BY seq", (status,)).fetchall()
+        return [self._to_operation(row) for row in rows]
+
+    def _next_pending(self):
+        # Read one at a time: replaying a create rewrites the operations queued after it.
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM outbox WHERE status = ? ORDER BY seq LIMIT 1",
+                                          (STATUS_PENDING,)).fetchone()
+        return self._to_operation(row) if row else None
+
+    def count(self, status=STATUS_PENDING):
+        if not self.enabled:
+            return 0
+        with self._lock:
+            row = self._connect().execute("SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)).fetchone()
+        return row[0]
+
+    def has_pending(self):
+        return self.count(STATUS_PENDING) > 0
+
+    def discard(self, seq):
+        operation = self._pop(seq)
+        if operation is not None:
+            self._notify("discarded", operation)
+
+    def retry(self, seq=None):
+        # Moves one conflict (or all of them) back into the replay order.
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if seq is None:
+                    connection.execute("UPDATE outbox SET status = ?, error = NULL WHERE status = ?",
+                                       (STATUS_PENDING, STATUS_CONFLICT))
+                else:
+                    connection.execute("UPDATE outbox SET status = ?, error = NULL WHERE seq = ?",
+                                       (STATUS_PENDING, seq))
+
+    def _pop(self, seq):
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT * FROM outbox WHERE seq = ?", (seq,)).fetchone()
+            with connection:
+                connection.execute("DELETE FROM outbox WHERE seq = ?", (seq,))
+        return self._to_operation(row) if row else None
+
+    def _mark_conflict(self, operation, error):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("UPDATE outbox SET status = ?, error = ? WHERE seq = ?",
+                                   (STATUS_CONFLICT, str(error), operation["seq"]))
+        operation = dict(operation, status=STATUS_CONFLICT, error=str(error))
+        self._notify("conflict", operation)
+
+    def _remap(self, local_id, real_id):
+        # Later operations on a record created while queued still refer to its placeholder id.
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "UPDATE outbox SET endpoint = replace(endpoint, ?, ?), data = replace(data, ?, ?) "
+                    "WHERE status = ?",
+                    (local_id, real_id, json.dumps(local_id), json.dumps(real_id), STATUS_PENDING)
+                )
+
+    def start_replay(self, sender, is_transient):
+        # sender(operation) performs the call; is_transient(error, operation) tells a backend that
+        # is still unreachable (stop and retry later) from one that rejected the operation, or a
+        # call that may already have been applied (conflict).
+        if not self.enabled:
+            return
+        self._stopped = False
+        with self._worker_lock:
+            self._wake.set()
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, args=(sender, is_transient), name="mwu-write-queue",
+                                            daemon=True)
+            self._worker.start()
+
+    def _run(self, sender, is_transient):
+        while not self._stopped:
+            self._wake.clear()
+            try:
+                if self.replay(sender, is_transient):
+                    with self._worker_lock:
+                        # Operations queued while the last replay was finishing set _wake; go again.
+                        if not self._wake.is_set():
+                            self._worker = None
+                            return
+                    continue
+            except Exception as e:
+                print(f"Write queue replay failed: {e}")
+            self._wake.wait(WRITE_QUEUE_RETRY_SECONDS)
+
+    def replay(self, sender, is_transient):
+        # Returns True once nothing is left pending, False if the backend is still unreachable.
+        while not self._stopped:
+            operation = self._next_pending()
+            if operation is None:
+                return True
+            if LOCAL_ID_PREFIX in operation["endpoint"]:
+                self._mark_conflict(operation, "The record it changes could not be created")
+                continue
+
+            try:
+                body = sender(operation)
+            except Exception as e:
+                if is_transient(e, operation):
+                    return False
+                self._mark_conflict(operation, e)
+                continue
+
+            if operation["local_id"]:
+                real_id = body.get("id") if isinstance(body, dict) else None
+                if real_id is not None:
+                    self._remap(operation["local_id"], str(real_id))
+                self._drop_placeholder(operation)
+            self._pop(operation["seq"])
+            self._notify("replayed", dict(operation, result=body))
+        return False
+
+    @staticmethod
+    def _drop_placeholder(operation):
+        parsed = local_store.parse_endpoint(operation["endpoint"])
+        if not local_store.enabled or parsed is None:
+            return
+        try:
+            local_store.remove(parsed[0], operation["local_id"])
+        except Exception as e:
+            print(f"Failed to drop placeholder {operation['local_id']} from the local store: {e}")
+
+
+write_queue = WriteQueue()
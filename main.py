@@ -1,38 +1,56 @@
+import importlib
+import os
 import tkinter as tk
+from tkinter import messagebox
 
 from components.base_layout_component import BaseLayout
-from pages.accounts.account_create_page import AccountCreatePage
-from pages.accounts.account_page import AccountsPage
-from pages.accounts.account_trashbin_page import AccountsTrashbinPage
-from pages.accounts.account_update_page import AccountUpdatePage
-from pages.categories.category_create_page import CategoryCreatePage
-from pages.categories.category_page import CategoryPage
-from pages.categories.category_trashbin_page import CategoryTrashbinPage
-from pages.categories.category_update_page import CategoryUpdatePage
-from pages.category_types.category_types_create_page import CategoryTypeCreatePage
-from pages.category_types.category_types_page import CategoryTypesPage
-from pages.category_types.category_types_update_page import CategoryTypeUpdatePage
-from pages.financial_goals.financial_goals_create_page import FinancialGoalsCreatePage
-from pages.financial_goals.financial_goals_page import FinancialGoalsPage
-from pages.financial_goals.financial_goals_update_page import FinancialGoalsUpdatePage
-from pages.home import HomePage
-from pages.transactions.transaction_create_page import TransactionCreatePage
-from pages.transactions.transaction_page import TransactionPage
-from pages.transactions.transaction_trashbin_page import TransactionTrashbinPage
-from pages.transactions.transaction_update_page import TransactionUpdatePage
-from pages.user.user_create_page import UserCreatePage
-from pages.user.user_page import UserPage
-from pages.user.user_trashbin_page import UserTrashBinPage
-from pages.user.user_update_page import UserUpdatePage
-from pages.user_accounts.user_accounts_create_page import UserAccountsCreatePage
-from pages.user_accounts.user_accounts_page import UserAccountsPage
-from pages.user_accounts.user_accounts_update_page import UserAccountsUpdatePage
+from core.api_client import APIClient
+from core.fan_out import shutdown_fan_out
+from core.local_store import local_store
+from core.task_runner import task_runner
+from core.write_queue import STATUS_CONFLICT, write_queue
+
+PAGE_MODULES = {
+    "HomePage": "pages.home",
+    "AccountsPage": "pages.accounts.account_page",
+    "AccountUpdatePage": "pages.accounts.account_update_page",
+    "AccountCreatePage": "pages.accounts.account_create_page",
+    "AccountsTrashbinPage": "pages.accounts.account_trashbin_page",
+    "CategoryPage": "pages.categories.category_page",
+    "CategoryUpdatePage": "pages.categories.category_update_page",
+    "CategoryCreatePage": "pages.categories.category_create_page",
+    "CategoryTrashbinPage": "pages.categories.category_trashbin_page",
+    "CategoryTypesPage": "pages.category_types.category_types_page",
+    "CategoryTypeUpdatePage": "pages.category_types.category_types_update_page",
+    "CategoryTypeCreatePage": "pages.category_types.category_types_create_page",
+    "FinancialGoalsPage": "pages.financial_goals.financial_goals_page",
+    "FinancialGoalsUpdatePage": "pages.financial_goals.financial_goals_update_page",
+    "FinancialGoalsCreatePage": "pages.financial_goals.financial_goals_create_page",
+    "UserAccountsPage": "pages.user_accounts.user_accounts_page",
+    "UserAccountsUpdatePage": "pages.user_accounts.user_accounts_update_page",
+    "UserAccountsCreatePage": "pages.user_accounts.user_accounts_create_page",
+    "TransactionPage": "pages.transactions.transaction_page",
+    "TransactionUpdatePage": "pages.transactions.transaction_update_page",
+    "TransactionCreatePage": "pages.transactions.transaction_create_page",
+    "TransactionBulkCreatePage": "pages.transactions.transaction_bulk_create_page",
+    "TransactionImportPage": "pages.transactions.transaction_import_page",
+    "TransactionTrashbinPage": "pages.transactions.transaction_trashbin_page",
+    "UserPage": "pages.user.user_page",
+    "UserUpdatePage": "pages.user.user_update_page",
+    "UserCreatePage": "pages.user.user_create_page",
+    "UserTrashBinPage": "pages.user.user_trashbin_page",
+}
+
+PREWARM_PAGES = [name.strip() for name in os.getenv("PREWARM_PAGES", "").split(",") if name.strip()]
 
 
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Money With You - GUI")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        task_runner.attach(self)
 
         self.ios_layout = BaseLayout(self)
 
@@ -41,122 +59,91 @@ class App(tk.Tk):
         self.container.grid_columnconfigure(0, weight=1)
 
         self.pages = {}
-        self._create_pages()
 
-        self.show_page("HomePage")
+        APIClient.add_circuit_listener(self._on_circuit_state_changed)
+        write_queue.add_listener(self._on_write_queue_changed)
+        if write_queue.enabled:
+            # Conflicts left from the last session get another chance before being shown again.
+            write_queue.retry()
+            self._update_pending_writes()
+            APIClient.replay_write_queue()
 
+        self.show_page("HomePage")
 
-    def _create_pages(self):
-        home_page = HomePage(self.container, self)
-        self.pages["HomePage"] = home_page
-        home_page.grid(row=0, column=0, sticky="nsew")
-
-        account_list_page = AccountsPage(self.container, self)
-        self.pages["AccountsPage"] = account_list_page
-        account_list_page.grid(row=0, column=0, sticky="nsew")
-
-        account_update_page = AccountUpdatePage(self.container, self)
-        self.pages["AccountUpdatePage"] = account_update_page
-        account_update_page.grid(row=0, column=0, sticky="nsew")
-
-        account_create_page = AccountCreatePage(self.container, self)
-        self.pages["AccountCreatePage"] = account_create_page
-        account_create_page.grid(row=0, column=0, sticky="nsew")
-
-        account_trashbin_page = AccountsTrashbinPage(self.container, self)
-        self.pages["AccountsTrashbinPage"] = account_trashbin_page
-        account_trashbin_page.grid(row=0, column=0, sticky="nsew")
-
-        category_list_page = CategoryPage(self.container, self)
-        self.pages["CategoryPage"] = category_list_page
-        category_list_page.grid(row=0, column=0, sticky="nsew")
-        
-        category_update_page = CategoryUpdatePage(self.container, self)
-        self.pages["CategoryUpdatePage"] = category_update_page
-        category_update_page.grid(row=0, column=0, sticky="nsew")
-
-        category_create_page = CategoryCreatePage(self.container, self)
-        self.pages["CategoryCreatePage"] = category_create_page
-        category_create_page.grid(row=0, column=0, sticky="nsew")
-
-        category_trashbin_page = CategoryTrashbinPage(self.container, self)
-        self.pages["CategoryTrashbinPage"] = category_trashbin_page
-        category_update_page.grid(row=0, column=0, sticky="nsew")
-
-
-        category_type_list_page = CategoryTypesPage(self.container, self)
-        self.pages["CategoryTypesPage"] = category_type_list_page
-        category_type_list_page.grid(row=0, column=0, sticky="nsew")
-
-        category_type_update_page = CategoryTypeUpdatePage(self.container, self)
-        self.pages["CategoryTypeUpdatePage"] = category_type_update_page
-        category_type_update_page.grid(row=0, column=0, sticky="nsew")
-
-        category_type_create_page = CategoryTypeCreatePage(self.container, self)
-        self.pages["CategoryTypeCreatePage"] = category_type_create_page
-        category_type_create_page.grid(row=0, column=0, sticky="nsew")
-        
-        financial_goals_list_page = FinancialGoalsPage(self.container, self)
-        self.pages["FinancialGoalsPage"] = financial_goals_list_page
-        financial_goals_list_page.grid(row=0, column=0, sticky="nsew")
-
-        financial_goals_update_page = FinancialGoalsUpdatePage(self.container, self)
-        self.pages["FinancialGoalsUpdatePage"] = financial_goals_update_page
-        financial_goals_update_page.grid(row=0, column=0, sticky="nsew")
-
-        financial_goals_create_page = FinancialGoalsCreatePage(self.container, self)
-        self.pages["FinancialGoalsCreatePage"] = financial_goals_create_page
-        financial_goals_create_page.grid(row=0, column=0, sticky="nsew")
-
-        user_accounts_list_page = UserAccountsPage(self.container, self)
-        self.pages["UserAccountsPage"] = user_accounts_list_page
-        user_accounts_list_page.grid(row=0, column=0, sticky="nsew")
-
-        user_accounts_update_page = UserAccountsUpdatePage(self.container, self)
-        self.pages["UserAccountsUpdatePage"] = user_accounts_update_page
-        user_accounts_update_page.grid(row=0, column=0, sticky="nsew")
-
-        user_accounts_create_page = UserAccountsCreatePage(self.container, self)
-        self.pages["UserAccountsCreatePage"] = user_accounts_create_page
-        user_accounts_create_page.grid(row=0, column=0, sticky="nsew")
-        
-        transaction_list_page = TransactionPage(self.container, self)
-        self.pages["TransactionPage"] = transaction_list_page
-        transaction_list_page.grid(row=0, column=0, sticky="nsew")
-
-        transaction_update_page = TransactionUpdatePage(self.container, self)
-        self.pages["TransactionUpdatePage"] = transaction_update_page
-        transaction_update_page.grid(row=0, column=0, sticky="nsew")
-
-        transaction_create_page = TransactionCreatePage(self.container, self)
-        self.pages["TransactionCreatePage"] = transaction_create_page
-        transaction_create_page.grid(row=0, column=0, sticky="nsew")
-
-        transaction_trashbin_page = TransactionTrashbinPage(self.container, self)
-        self.pages["TransactionTrashbinPage"] = transaction_trashbin_page
-        transaction_trashbin_page.grid(row=0, column=0, sticky="nsew")
-
-        user_list_page = UserPage(self.container, self)
-        self.pages["UserPage"] = user_list_page
-        user_list_page.grid(row=0, column=0, sticky="nsew")
-
-        user_update_page = UserUpdatePage(self.container, self)
-        self.pages["UserUpdatePage"] = user_update_page
-        user_update_page.grid(row=0, column=0, sticky="nsew")
-
-        user_create_page = UserCreatePage(self.container, self)
-        self.pages["UserCreatePage"] = user_create_page
-        user_create_page.grid(row=0, column=0, sticky="nsew")
-
-        user_trashbin_page = UserTrashBinPage(self.container, self)
-        self.pages["UserTrashBinPage"] = user_trashbin_page
-        user_trashbin_page.grid(row=0, column=0, sticky="nsew")
+        if PREWARM_PAGES:
+            self.prewarm_pages(PREWARM_PAGES)
+
+    def _get_page(self, page_name):
+        page = self.pages.get(page_name)
+        if page is None:
+            module_path = PAGE_MODULES.get(page_name)
+            if module_path is None:
+                raise KeyError(f"Unknown page: {page_name}")
+
+            page_class = getattr(importlib.import_module(module_path), page_name)
+            page = page_class(self.container, self)
+            self.pages[page_name] = page
+        return page
+
+    def prewarm_pages(self, page_names):
+        pending = [name for name in page_names if name not in self.pages]
+
+        def build_next():
+            while pending:
+                page_name = pending.pop(0)
+                if page_name in self.pages:
+                    continue
+                try:
+                    self._get_page(page_name)
+                except Exception as e:
+                    print(f"Failed to pre-build page {page_name}: {e}")
+                break
+            if pending:
+                self.after_idle(build_next)
+
+        self.after_idle(build_next)
+
+    def _on_circuit_state_changed(self, state):
+        retry_in = APIClient.circuit_retry_in()
+        read_only = local_store.enabled and not write_queue.enabled
+        task_runner.call_in_ui(self.ios_layout.set_connection_state, state, retry_in, read_only)
+        if state == "closed" and write_queue.has_pending():
+            APIClient.replay_write_queue()
+
+    def _on_write_queue_changed(self, event, operation):
+        task_runner.call_in_ui(self._update_pending_writes)
+        if event == "conflict":
+            task_runner.call_in_ui(self._show_write_conflict, operation)
+
+    def _update_pending_writes(self):
+        self.ios_layout.set_pending_writes(write_queue.count(), write_queue.count(STATUS_CONFLICT))
+
+    def _show_write_conflict(self, operation):
+        discard = messagebox.askyesno(
+            "Sync Conflict",
+            f"A change made while offline could not be applied:\n\n"
+            f"{operation['method']} {operation['endpoint']}\n{operation['error']}\n\n"
+            f"Discard it? Choose No to keep it and retry on the next start."
+        )
+        if discard:
+            write_queue.discard(operation["seq"])
+
+    def _on_close(self):
+        APIClient.remove_circuit_listener(self._on_circuit_state_changed)
+        write_queue.remove_listener(self._on_write_queue_changed)
+        task_runner.shutdown()
+        shutdown_fan_out()
+        APIClient.close_session()
+        write_queue.close()
+        local_store.close()
+        self.destroy()
 
     def show_page(self, page_name, **kwargs):
-        for page in self.pages.values():
-            page.hide()
+        page = self._get_page(page_name)
+
+        for other_page in self.pages.values():
+            other_page.hide()
 
-        page = self.pages[page_name]
         page.show()
         page.refresh(**kwargs)
 
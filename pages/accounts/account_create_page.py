@@ -72,9 +72,9 @@ class AccountCreatePage(BasePage):
             messagebox.showerror("Validation Error", "Name, Type, and Account Number are required.")
             return
 
-        try:
-            account_api_client.create_account(payload)
-            messagebox.showinfo("Success", "Account created successfully!")
-            self.controller.show_page("AccountsPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to create account: {e}")
+        self.submit_in_background(self.detail_form, lambda: account_api_client.create_account(payload),
+                                  self._on_account_created, "Failed to create account")
+
+    def _on_account_created(self, _result):
+        messagebox.showinfo("Success", "Account created successfully!")
+        self.return_to("AccountsPage")
@@ -4,7 +4,9 @@ from tkinter import ttk, messagebox
 from uuid import UUID
 
 from components.list_box_component import ListBoxComponent
+from components.progress_component import ProgressComponent
 from core.accounts_endpoints import account_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -42,6 +44,9 @@ class AccountsPage(BasePage):
                                            command=lambda: self.controller.show_page("AccountCreatePage"))
         create_account_button.pack(side="left")
 
+        export_button = ttk.Button(button_frame, text="Export", command=self._export_accounts)
+        export_button.pack(side="left", padx=(20, 0))
+
         self.columns = ["id", "name", "type", "account_number", "created_at", "updated_at",
                         "deleted_at"]
 
@@ -60,28 +65,41 @@ class AccountsPage(BasePage):
                                       sticky="nsew")
         self.account_list_component.on_select(self._on_account_selected)
 
-        self._load_accounts()
+        self.export_progress = ProgressComponent(self, on_cancel_callback=self.cancel_export, bg=self.cget('bg'))
+        self.export_progress.grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.export_progress.grid_remove()
 
     def _load_accounts(self):
-        try:
-            accounts_raw_data = account_api_client.get_all_accounts()
-            self.Account_data = accounts_raw_data
-            items_for_list = []
-            for account in accounts_raw_data:
-                row_values = []
-                for col in self.columns:
-                    value = account.get(col, '')
-                    if isinstance(value, UUID):
-                        row_values.append(str(value))
-                    elif isinstance(value, datetime):
-                        row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
-                    else:
-                        row_values.append(value)
-                items_for_list.append(tuple(row_values))
-            self.account_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Accounts: {e}")
-            self.account_list_component.clear_list()
+        self.run_in_background(self._fetch_accounts, self._show_accounts, self._on_accounts_load_failed)
+
+    def _fetch_accounts(self):
+        accounts_raw_data = reference_store.get_all("accounts")
+        items_for_list = [self._build_account_row(account) for account in accounts_raw_data]
+        return accounts_raw_data, items_for_list
+
+    def _build_account_row(self, account):
+        row_values = []
+        for col in self.columns:
+            value = account.get(col, '')
+            if isinstance(value, UUID):
+                row_values.append(str(value))
+            elif isinstance(value, datetime):
+                row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
+            else:
+                row_values.append(value)
+        return tuple(row_values)
+
+    def _export_accounts(self):
+        self.export_list(account_api_client.iter_account_pages, self._build_account_row, self.columns,
+                         self.display_headings, self.export_progress, "Accounts")
+
+    def _show_accounts(self, result):
+        self.Account_data, items_for_list = result
+        self.account_list_component.set_items(items_for_list)
+
+    def _on_accounts_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Accounts: {e}")
+        self.account_list_component.clear_list()
 
     def _on_account_selected(self, selected_values):
         if selected_values:
@@ -5,6 +5,7 @@ from uuid import UUID
 from typing import Optional
 
 from components.list_box_component import ListBoxComponent
+from components.progress_component import ProgressComponent
 from core.accounts_endpoints import account_api_client
 from pages.base_page import BasePage
 
@@ -14,6 +15,7 @@ class AccountsTrashbinPage(BasePage):
         super().__init__(parent, controller, *args, **kwargs)
         self.account_data = []
         self.selected_account_id: Optional[UUID] = None
+        self.selected_account_ids = []
 
     def _setup_ui(self):
         self._setup_grid_configuration()
@@ -21,7 +23,6 @@ class AccountsTrashbinPage(BasePage):
         self._create_title_label()
         self._create_action_buttons()
         self._create_list_component()
-        self._load_accounts()
 
     def _setup_grid_configuration(self):
         self.grid_rowconfigure(0, weight=0)
@@ -67,6 +68,10 @@ class AccountsTrashbinPage(BasePage):
         )
         self.force_delete_button.pack(side="left")
 
+        self.bulk_progress = ProgressComponent(self, on_cancel_callback=self.cancel_bulk_action, bg=self.cget('bg'))
+        self.bulk_progress.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.bulk_progress.grid_remove()
+
     def _create_list_component(self):
         self.columns = ["id", "name", "type", "account_number", "created_at", "updated_at", "deleted_at"]
         self.display_headings = {
@@ -82,7 +87,8 @@ class AccountsTrashbinPage(BasePage):
         self.account_list_component = ListBoxComponent(
             self,
             columns=self.columns,
-            display_headings=self.display_headings
+            display_headings=self.display_headings,
+            multi_select=True
         )
         self.account_list_component.grid(
             row=2,
@@ -98,6 +104,8 @@ class AccountsTrashbinPage(BasePage):
         if selected_values:
             try:
                 self.selected_account_id = UUID(selected_values[0])
+                selected_items = self.account_list_component.get_selected_items()
+                self.selected_account_ids = [UUID(values[0]) for values in selected_items]
                 self.restore_button.config(state="normal")
                 self.force_delete_button.config(state="normal")
             except ValueError:
@@ -107,10 +115,15 @@ class AccountsTrashbinPage(BasePage):
 
     def _clear_selection(self):
         self.selected_account_id = None
+        self.selected_account_ids = []
         self.restore_button.config(state="disabled")
         self.force_delete_button.config(state="disabled")
 
     def _restore_selected_account(self):
+        if len(self.selected_account_ids) > 1:
+            self._run_bulk_account_action(account_api_client.restore_account, "restore")
+            return
+
         if not self.selected_account_id:
             return
 
@@ -118,16 +131,16 @@ class AccountsTrashbinPage(BasePage):
             "Confirm Restore",
             f"Are you sure you want to restore account ID {self.selected_account_id}?"
         ):
-            try:
-                account_api_client.restore_account(self.selected_account_id)
-                messagebox.showinfo("Success", "Account restored successfully!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to restore account: {e}")
-            finally:
-                self._clear_selection()
+            account_id = self.selected_account_id
+            self._clear_selection()
+            self._remove_account_row(account_id, lambda: account_api_client.restore_account(account_id),
+                                     "Failed to restore account")
 
     def _force_delete_selected_account(self):
+        if len(self.selected_account_ids) > 1:
+            self._run_bulk_account_action(account_api_client.force_delete_account, "permanently delete")
+            return
+
         if not self.selected_account_id:
             return
 
@@ -136,36 +149,58 @@ class AccountsTrashbinPage(BasePage):
             f"Are you sure you want to PERMANENTLY delete account ID {self.selected_account_id}?\n"
             "This action cannot be undone!"
         ):
-            try:
-                account_api_client.force_delete_account(self.selected_account_id)
-                messagebox.showinfo("Success", "Account permanently deleted!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete account: {e}")
-            finally:
-                self._clear_selection()
+            account_id = self.selected_account_id
+            self._clear_selection()
+            self._remove_account_row(account_id, lambda: account_api_client.force_delete_account(account_id),
+                                     "Failed to delete account")
+
+    def _remove_account_row(self, account_id, mutation, error_message):
+        # The row leaves the trash bin straight away and is put back if the call fails.
+        self.run_optimistic(
+            lambda: self.account_list_component.remove_item(str(account_id)),
+            self.account_list_component.restore_item,
+            mutation,
+            on_error=lambda e: messagebox.showerror("API Error", f"{error_message}: {e}"),
+            key=f"mutation:{account_id}"
+        )
 
-    def _load_accounts(self):
-        try:
-            accounts_raw_data = account_api_client.get_deleted_accounts()
-            self.account_data = accounts_raw_data
-            items_for_list = []
-            for account in accounts_raw_data:
-                row_values = []
-                for col in self.columns:
-                    value = account.get(col, '')
-                    if isinstance(value, UUID):
-                        row_values.append(str(value))
-                    elif isinstance(value, datetime):
-                        row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
-                    else:
-                        row_values.append(value)
-                items_for_list.append(tuple(row_values))
-            self.account_list_component.set_items(items_for_list)
+    def _run_bulk_account_action(self, action, verb):
+        account_ids = list(self.selected_account_ids)
+        warning = "\nThis action cannot be undone!" if verb == "permanently delete" else ""
+        if messagebox.askyesno(f"Confirm {verb.title()}",
+                               f"Are you sure you want to {verb} {len(account_ids)} accounts?{warning}"):
             self._clear_selection()
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Accounts: {e}")
-            self.account_list_component.clear_list()
+            progress_text = "Restoring accounts" if verb == "restore" else "Deleting accounts"
+            self.run_bulk_action(account_ids, action, self.account_list_component, self.bulk_progress,
+                                 progress_text, f"Could not {verb}")
+
+    def _load_accounts(self):
+        self.run_in_background(self._fetch_accounts, self._show_accounts, self._on_accounts_load_failed)
+
+    def _fetch_accounts(self):
+        accounts_raw_data = account_api_client.get_deleted_accounts()
+        items_for_list = []
+        for account in accounts_raw_data:
+            row_values = []
+            for col in self.columns:
+                value = account.get(col, '')
+                if isinstance(value, UUID):
+                    row_values.append(str(value))
+                elif isinstance(value, datetime):
+                    row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
+                else:
+                    row_values.append(value)
+            items_for_list.append(tuple(row_values))
+        return accounts_raw_data, items_for_list
+
+    def _show_accounts(self, result):
+        self.account_data, items_for_list = result
+        self.account_list_component.set_items(items_for_list)
+        self._on_account_selected(self.account_list_component.get_selected_item())
+
+    def _on_accounts_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Accounts: {e}")
+        self.account_list_component.clear_list()
 
     def refresh(self):
         self._load_accounts()
\ No newline at end of file
@@ -52,20 +52,27 @@ class AccountUpdatePage(BasePage):
         if account_id:
             try:
                 self.current_account_id = UUID(str(account_id))
-                account_data = account_api_client.get_account_by_id(self.current_account_id)
-                self.detail_form.set_data(account_data)
-                if self.controller:
-                    self.controller.title(f"Update Account - {account_data.get('name', '')}")
             except ValueError:
                 messagebox.showerror("Error", f"Invalid Account ID format: {account_id}")
                 self._reset_form_and_navigate_back()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to load account details: {e}")
-                self._reset_form_and_navigate_back()
+                return
+
+            current_id = self.current_account_id
+            self.run_in_background(lambda: account_api_client.get_account_by_id(current_id), self._show_account,
+                                   self._on_account_load_failed)
         else:
             messagebox.showwarning("Warning", "No account selected for update. Returning to list.")
             self._reset_form_and_navigate_back()
 
+    def _show_account(self, account_data):
+        self.detail_form.set_data(account_data)
+        if self.controller:
+            self.controller.title(f"Update Account - {account_data.get('name', '')}")
+
+    def _on_account_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load account details: {e}")
+        self._reset_form_and_navigate_back()
+
     def _reset_form_and_navigate_back(self):
         self.detail_form.set_data({})
         self.current_account_id = None
@@ -87,12 +94,13 @@ class AccountUpdatePage(BasePage):
             except ValueError:
                 messagebox.showerror("Validation Error", "Manual Balance must be a number.")
                 return
-        try:
-            account_api_client.update_account(self.current_account_id, payload)
-            messagebox.showinfo("Success", "Account updated successfully!")
-            self.controller.show_page("AccountsPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to update account: {e}")
+        account_id = self.current_account_id
+        self.submit_in_background(self.detail_form, lambda: account_api_client.update_account(account_id, payload),
+                                  self._on_account_updated, "Failed to update account")
+
+    def _on_account_updated(self, _result):
+        messagebox.showinfo("Success", "Account updated successfully!")
+        self.return_to("AccountsPage")
 
     def _delete_account(self):
         if not self.current_account_id:
@@ -101,9 +109,10 @@ class AccountUpdatePage(BasePage):
 
         if messagebox.askyesno("Confirm Delete",
                                f"Are you sure you want to delete account ID {self.current_account_id}?"):
-            try:
-                account_api_client.delete_account(self.current_account_id)
-                messagebox.showinfo("Success", "Account deleted successfully (soft delete)!")
-                self.controller.show_page("AccountsPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete account: {e}")
+            account_id = self.current_account_id
+            self.submit_in_background(self.detail_form, lambda: account_api_client.delete_account(account_id),
+                                      self._on_account_deleted, "Failed to delete account")
+
+    def _on_account_deleted(self, _result):
+        messagebox.showinfo("Success", "Account deleted successfully (soft delete)!")
+        self.return_to("AccountsPage")
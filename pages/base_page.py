@@ -1,5 +1,15 @@
+import itertools
+import os
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, messagebox, ttk
+
+from core.exporter import export_filetypes, export_pages
+from core.fan_out import fan_out_iter
+from core.task_runner import task_runner
+
+BULK_PROGRESS_INTERVAL = float(os.getenv("BULK_PROGRESS_INTERVAL", "0.1"))
 
 
 class BasePage(tk.Frame):
@@ -11,6 +21,12 @@ class BasePage(tk.Frame):
         self.style = ttk.Style()
         self.style.theme_use('clam')
 
+        self._background_tasks = {}
+        self._loading_label = None
+        self._progress_bars = {}
+        self._bulk_stops = {}
+        self._mutation_ids = itertools.count(1)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -21,7 +37,277 @@ class BasePage(tk.Frame):
         self.tkraise()
 
     def hide(self):
+        self.cancel_background_tasks()
         self.grid_forget()
 
     def refresh(self):
-        pass
\ No newline at end of file
+        pass
+
+    def run_in_background(self, func, on_success=None, on_error=None, key="load", keep_on_hide=False):
+        return self._track_background_task(
+            key, lambda success, error: task_runner.submit(func, on_success=success, on_error=error),
+            on_success, on_error, keep_on_hide
+        )
+
+    def run_optimistic(self, apply, rollback, func, on_success=None, on_error=None, key="mutation"):
+        # apply() patches the UI straight away and returns what rollback() needs to undo it
+        # if func fails in the background; on success the server's answer goes to on_success.
+        # The write is not cancelled when the page is hidden, and every mutation gets its own
+        # key, so the rollback and the error always arrive.
+        undo = apply()
+
+        def failed(error):
+            rollback(undo)
+            if on_error:
+                on_error(error)
+
+        return self.run_in_background(func, on_success, failed, key=f"{key}#{next(self._mutation_ids)}",
+                                      keep_on_hide=True)
+
+    def submit_in_background(self, form, func, on_success, failure_text, key="submit"):
+        # Runs a create / update / delete off the Tk thread with the form's action buttons disabled.
+        # Like run_optimistic it is not cancelled when the page is hidden, so the outcome is always
+        # reported; on failure the error is shown as "failure_text: error".
+        if key in self._background_tasks:
+            messagebox.showinfo("Busy", "Please wait for the current operation to finish.")
+            return None
+        form.set_busy(True)
+
+        def finish():
+            if form.winfo_exists():
+                form.set_busy(False)
+
+        def succeeded(result):
+            finish()
+            on_success(result)
+
+        def failed(e):
+            finish()
+            messagebox.showerror("API Error", f"{failure_text}: {e}")
+
+        return self.run_in_background(func, succeeded, failed, key=key, keep_on_hide=True)
+
+    def return_to(self, page_name, **kwargs):
+        # Navigation after a background write, skipped if the user has already left this page.
+        if self.controller and self.winfo_manager():
+            self.controller.show_page(page_name, **kwargs)
+
+    def run_bulk(self, calls: dict, on_progress=None, on_done=None, on_error=None, key="bulk"):
+        # Runs {name: callable} pipelined on the fan-out pool.
+        return self.stream_bulk(lambda stop: fan_out_iter(calls, stop=stop), len(calls), on_progress, on_done,
+                                on_error, key=key)
+
+    def stream_bulk(self, factory, total, on_progress=None, on_done=None, on_error=None, key="bulk"):
+        # factory(stop) yields (name, result or exception) for total calls and stops starting new ones
+        # once the stop event is set. on_progress(done, total, failed) is called at most every
+        # BULK_PROGRESS_INTERVAL seconds; on_done gets {name: result or exception} for every call
+        # that was sent, which is fewer than total after cancel_bulk_action. The run keeps going
+        # when the page is hidden so its results are always reported.
+        results = {}
+        stop = threading.Event()
+        self._bulk_stops[key] = stop
+
+        def produce():
+            failed = 0
+            last_report = 0.0
+            for name, result in factory(stop):
+                results[name] = result
+                failed += isinstance(result, Exception)
+                now = time.monotonic()
+                if now - last_report >= BULK_PROGRESS_INTERVAL or len(results) == total:
+                    last_report = now
+                    yield len(results), total, failed
+
+        def finish(callback, value):
+            if self._bulk_stops.get(key) is stop:
+                del self._bulk_stops[key]
+            if callback:
+                callback(value)
+
+        return self.stream_in_background(
+            produce,
+            lambda progress: on_progress(*progress) if on_progress else None,
+            lambda _result: finish(on_done, results),
+            lambda error: finish(on_error, error),
+            key=key, keep_on_hide=True
+        )
+
+    def run_bulk_action(self, ids, action, list_component, progress, progress_text, failure_text, key="bulk"):
+        # action(id) for every id behind a progress bar; the rows that succeeded are removed from
+        # list_component in one pass at the end and all failures are reported together.
+        if key in self._background_tasks:
+            messagebox.showinfo("Busy", "Please wait for the current operation to finish.")
+            return None
+
+        self.show_progress(key, progress, len(ids), progress_text)
+
+        def done(results):
+            self.hide_progress(key)
+            failures = [(item_id, error) for item_id, error in results.items() if isinstance(error, Exception)]
+            list_component.remove_items(
+                str(item_id) for item_id, result in results.items() if not isinstance(result, Exception))
+            not_sent = len(ids) - len(results)
+            if failures:
+                details = "\n".join(f"{item_id}: {error}" for item_id, error in failures[:5])
+                if len(failures) > 5:
+                    details += f"\n... and {len(failures) - 5} more"
+                if not_sent:
+                    details += f"\n{not_sent} not sent (cancelled)."
+                messagebox.showerror("API Error", f"{failure_text} {len(failures)} of {len(results)}:\n{details}")
+            elif not_sent:
+                messagebox.showinfo("Cancelled", f"Stopped after {len(results)} of {len(ids)}; "
+                                                 f"{not_sent} not sent (cancelled).")
+
+        def failed(e):
+            self.hide_progress(key)
+            messagebox.showerror("API Error", f"{failure_text}: {e}")
+            self.refresh()
+
+        calls = {item_id: (lambda item_id=item_id: action(item_id)) for item_id in ids}
+        return self.run_bulk(calls, progress.set_progress, done, failed, key=key)
+
+    def cancel_bulk_action(self, key="bulk"):
+        # Nothing new is sent; the calls in flight finish and the run reports what it did.
+        stop = self._bulk_stops.get(key)
+        if stop is None:
+            return
+        stop.set()
+        progress = self._progress_bars.get(key)
+        if progress is not None:
+            progress.set_stopping()
+
+    def show_progress(self, key, progress, total, text):
+        self._progress_bars[key] = progress
+        progress.start(total, text)
+        progress.grid()
+
+    def hide_progress(self, key):
+        progress = self._progress_bars.pop(key, None)
+        if progress is not None:
+            progress.stop()
+            progress.grid_remove()
+
+    def export_list(self, iter_pages, build_row, columns, display_headings, progress, name, key="export"):
+        # Streams every page iter_pages() yields through build_row into a CSV / JSONL / Parquet file
+        # with the list's columns, without going through the Treeview.
+        if key in self._background_tasks:
+            messagebox.showinfo("Busy", "Please wait for the current export to finish.")
+            return None
+
+        path = filedialog.asksaveasfilename(title=f"Export {name}", defaultextension=".csv",
+                                            initialfile=f"{name.lower().replace(' ', '_')}.csv",
+                                            filetypes=export_filetypes())
+        if not path:
+            return None
+
+        headings = [display_headings.get(column, column) for column in columns]
+        written = [0]
+
+        self.show_progress(key, progress, None, f"Exporting {name}:")
+
+        def chunk(count):
+            written[0] = count
+            progress.set_status(f"{count} rows written")
+
+        def done(_result):
+            self.hide_progress(key)
+            messagebox.showinfo("Export Finished", f"Exported {written[0]} rows to {path}")
+
+        def failed(e):
+            self.hide_progress(key)
+            messagebox.showerror("Export Error", f"Failed to export {name}: {e}")
+
+        # Keeps running when the page is hidden; only the Cancel button stops it.
+        return self.stream_in_background(lambda: export_pages(path, iter_pages(), build_row, columns, headings),
+                                         chunk, done, failed, key=key, keep_on_hide=True)
+
+    def cancel_export(self, key="export"):
+        if key not in self._background_tasks:
+            return
+        self.cancel_background_task(key)
+        self.hide_progress(key)
+        messagebox.showinfo("Export Cancelled", "The export was cancelled; no file was written.")
+
+    def _track_background_task(self, key, start, on_success, on_error, keep_on_hide=False):
+        self.cancel_background_task(key)
+        task = None
+
+        def finish(callback, value):
+            if task is not None and self._background_tasks.get(key) is task:
+                del self._background_tasks[key]
+            self._update_loading_state()
+            if callback:
+                callback(value)
+
+        task = start(lambda result: finish(on_success, result), lambda error: finish(on_error, error))
+        task.keep_on_hide = keep_on_hide
+        if task.future is not None:
+            self._background_tasks[key] = task
+        self._update_loading_state()
+        return task
+
+    def stream_in_background(self, factory, on_chunk, on_done=None, on_error=None, key="load", keep_on_hide=False):
+        self.cancel_background_task(key)
+        task = None
+
+        def chunk_received(chunk):
+            if task is not None and not task.partial:
+                task.partial = True
+                self._update_loading_state()
+            on_chunk(chunk)
+
+        def finish(callback, value):
+            if task is not None and self._background_tasks.get(key) is task:
+                del self._background_tasks[key]
+            self._update_loading_state()
+            if callback:
+                callback(value)
+
+        task = task_runner.stream(
+            factory,
+            on_chunk=chunk_received,
+            on_done=lambda result: finish(on_done, result),
+            on_error=lambda error: finish(on_error, error)
+        )
+        task.keep_on_hide = keep_on_hide
+        if task.future is not None:
+            self._background_tasks[key] = task
+        self._update_loading_state()
+        return task
+
+    def post_to_ui(self, callback, *args):
+        task_runner.call_in_ui(callback, *args)
+
+    def cancel_background_task(self, key="load"):
+        task = self._background_tasks.pop(key, None)
+        if task:
+            task.cancel()
+        self._update_loading_state()
+
+    def cancel_background_tasks(self):
+        # Called when the page is hidden: loads are dropped, tasks marked keep_on_hide run on.
+        for key, task in list(self._background_tasks.items()):
+            if not task.keep_on_hide:
+                task.cancel()
+                del self._background_tasks[key]
+                self.hide_progress(key)
+        self._update_loading_state()
+
+    def is_loading(self):
+        return bool(self._background_tasks)
+
+    def _update_loading_state(self):
+        if self.is_loading():
+            if self._loading_label is None:
+                self._loading_label = tk.Label(self, text="Loading...", font=("Arial", 12, "italic"),
+                                               fg="#555555", padx=12, pady=6)
+            # Once a streamed load has shown its first rows, move the indicator out of the way.
+            if all(task.partial for task in self._background_tasks.values()):
+                self._loading_label.config(text="Loading more...")
+                self._loading_label.place(relx=1.0, rely=1.0, anchor="se")
+            else:
+                self._loading_label.config(text="Loading...")
+                self._loading_label.place(relx=0.5, rely=0.5, anchor="center")
+            self._loading_label.lift()
+        elif self._loading_label is not None:
+            self._loading_label.place_forget()
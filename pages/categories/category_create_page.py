@@ -2,8 +2,7 @@ from tkinter import messagebox, ttk
 
 from components.detail_form_component import DetailFormComponent
 from core.categories_endpoints import category_api_client
-from core.category_types_endpoints import category_type_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -35,8 +34,9 @@ class CategoryCreatePage(BasePage):
         ]
 
     def refresh(self, **kwargs):
-        self._fetch_all_users_and_category_types()
+        self.run_in_background(self._fetch_all_users_and_category_types, self._show_form)
 
+    def _show_form(self, _result=None):
         user_options = {
             user.get('first_name'): str(user.get('id'))
             for user in self.users_cache.values()
@@ -82,17 +82,11 @@ class CategoryCreatePage(BasePage):
 
     def _fetch_all_users_and_category_types(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            category_types = category_type_api_client.get_all_category_types()
-            self.category_types_cache = {
-                str(category_type["id"]): category_type
-                for category_type in category_types
-                if category_type and "id" in category_type
-            }
+            self.users_cache = reference_store.get_index("users")
+            self.category_types_cache = reference_store.get_index("category_types")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or Category Types: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or Category Types: {e}")
 
     def _create_category(self):
         category_data = self.detail_form.get_data()
@@ -110,19 +104,21 @@ class CategoryCreatePage(BasePage):
                 'name': category_data['name'],
                 'description': category_data.get('description', '')
             }
-
-            response = category_api_client.create_category(payload)
-
-            if response and isinstance(response, dict) and response.get('id'):
-                messagebox.showinfo("Success", "Category created successfully!")
-                self.controller.show_page("CategoryPage")
-            elif response and isinstance(response, dict) and response.get('message'):
-                messagebox.showerror("API Error", response.get('message'))
-            else:
-                error_message = f"Unknown Error. Unexpected API response format: {response}"
-                messagebox.showerror("API Error", error_message)
-
         except ValueError as ve:
             messagebox.showerror("Input Error", f"Please verify input formats. Error: {ve}")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to create category: {e}")
\ No newline at end of file
+            return
+
+        self.submit_in_background(
+            self.detail_form, lambda: category_api_client.create_category(payload),
+            self._on_category_created, "Failed to create category"
+        )
+
+    def _on_category_created(self, response):
+        if response and isinstance(response, dict) and response.get('id'):
+            messagebox.showinfo("Success", "Category created successfully!")
+            self.return_to("CategoryPage")
+        elif response and isinstance(response, dict) and response.get('message'):
+            messagebox.showerror("API Error", response.get('message'))
+        else:
+            error_message = f"Unknown Error. Unexpected API response format: {response}"
+            messagebox.showerror("API Error", error_message)
\ No newline at end of file
@@ -3,9 +3,9 @@ from tkinter import ttk, messagebox
 from uuid import UUID
 
 from components.list_box_component import ListBoxComponent
-from core.category_types_endpoints import category_type_api_client
+from components.progress_component import ProgressComponent
 from core.categories_endpoints import category_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -47,6 +47,9 @@ class CategoryPage(BasePage):
                                             command=lambda: self.controller.show_page("CategoryCreatePage"))
         create_category_button.pack(side="left")
 
+        export_button = ttk.Button(button_frame, text="Export", command=self._export_categories)
+        export_button.pack(side="left", padx=(20, 0))
+
         self.columns = ["id", "user_name", "category_type_name", "name", "description", "created_at"]
 
         self.display_headings = {
@@ -64,51 +67,64 @@ class CategoryPage(BasePage):
                                                sticky="nsew")
         self.category_list_component.on_select(self._on_category_selected)
 
-        self._load_categories()
+        self.export_progress = ProgressComponent(self, on_cancel_callback=self.cancel_export, bg=self.cget('bg'))
+        self.export_progress.grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.export_progress.grid_remove()
 
     def _fetch_all_users_and_category_types(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            category_types = category_type_api_client.get_all_category_types()
-            self.category_types_cache = {str(category_type["id"]): category_type for category_type in category_types if category_type and "id" in category_type}
+            self.users_cache = reference_store.get_index("users")
+            self.category_types_cache = reference_store.get_index("category_types")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or Category Types: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or Category Types: {e}")
 
 
     def _load_categories(self):
-        try:
-            self._fetch_all_users_and_category_types()
-            categories_raw_data = category_api_client.get_all_categories()
-            self.category_data = categories_raw_data
-            
-            items_for_list = []
-
-            for category in categories_raw_data:
-                user_id = category.get("user_id")
-                category_type_id = category.get("category_type_id")
-
-                category_type_name = self.category_types_cache.get(str(category_type_id), {}).get("name", "Unknown Category Type")
-                user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
-
-                row_values = []
-                for col in self.columns:
-                    if col == "user_name":
-                        row_values.append(user_name)
-                    elif col == "category_type_name":
-                        row_values.append(category_type_name)
-                    else:
-                        value = category.get(col, '')
-                        if isinstance(value, UUID):
-                            row_values.append(str(value))
-                        else:
-                            row_values.append(value)
-                items_for_list.append(tuple(row_values))
-            self.category_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Categories: {e}")
-            self.category_list_component.clear_list()
+        self.run_in_background(self._fetch_categories, self._show_categories, self._on_categories_load_failed)
+
+    def _fetch_categories(self):
+        self._fetch_all_users_and_category_types()
+        categories_raw_data = reference_store.get_all("categories")
+        items_for_list = [self._build_category_row(category) for category in categories_raw_data]
+        return categories_raw_data, items_for_list
+
+    def _build_category_row(self, category):
+        user_id = category.get("user_id")
+        category_type_id = category.get("category_type_id")
+
+        category_type_name = self.category_types_cache.get(str(category_type_id), {}).get("name", "Unknown Category Type")
+        user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
+
+        row_values = []
+        for col in self.columns:
+            if col == "user_name":
+                row_values.append(user_name)
+            elif col == "category_type_name":
+                row_values.append(category_type_name)
+            else:
+                value = category.get(col, '')
+                if isinstance(value, UUID):
+                    row_values.append(str(value))
+                else:
+                    row_values.append(value)
+        return tuple(row_values)
+
+    def _iter_category_export_pages(self):
+        self._fetch_all_users_and_category_types()
+        return category_api_client.iter_category_pages()
+
+    def _export_categories(self):
+        self.export_list(self._iter_category_export_pages, self._build_category_row, self.columns,
+                         self.display_headings, self.export_progress, "Categories")
+
+    def _show_categories(self, result):
+        self.category_data, items_for_list = result
+        self.category_list_component.set_items(items_for_list)
+
+    def _on_categories_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Categories: {e}")
+        self.category_list_component.clear_list()
 
     def _on_category_selected(self, selected_values):
         if selected_values:
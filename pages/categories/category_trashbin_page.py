@@ -4,9 +4,9 @@ from uuid import UUID
 from typing import Optional
 
 from components.list_box_component import ListBoxComponent
-from core.category_types_endpoints import category_type_api_client
+from components.progress_component import ProgressComponent
 from core.categories_endpoints import category_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -17,6 +17,7 @@ class CategoryTrashbinPage(BasePage):
         self.users_cache = {}
         self.category_types_cache = {}
         self.selected_category_id: Optional[UUID] = None
+        self.selected_category_ids = []
 
     def _setup_ui(self):
         self._setup_grid_configuration()
@@ -24,7 +25,6 @@ class CategoryTrashbinPage(BasePage):
         self._create_title_label()
         self._create_action_buttons()
         self._create_list_component()
-        self._load_categories()
 
     def _setup_grid_configuration(self):
         self.grid_rowconfigure(0, weight=0)
@@ -71,6 +71,10 @@ class CategoryTrashbinPage(BasePage):
         )
         self.force_delete_button.pack(side="left")
 
+        self.bulk_progress = ProgressComponent(self, on_cancel_callback=self.cancel_bulk_action, bg=self.cget('bg'))
+        self.bulk_progress.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.bulk_progress.grid_remove()
+
     def _create_list_component(self):
         self.columns = ["id", "user_name", "category_type_name", "name", "description", "created_at"]
 
@@ -86,7 +90,8 @@ class CategoryTrashbinPage(BasePage):
         self.category_list_component = ListBoxComponent(
             self,
             columns=self.columns,
-            display_headings=self.display_headings
+            display_headings=self.display_headings,
+            multi_select=True
         )
         self.category_list_component.grid(
             row=2,
@@ -102,6 +107,8 @@ class CategoryTrashbinPage(BasePage):
         if selected_values:
             try:
                 self.selected_category_id = UUID(selected_values[0])
+                selected_items = self.category_list_component.get_selected_items()
+                self.selected_category_ids = [UUID(values[0]) for values in selected_items]
                 self.restore_button.config(state="normal")
                 self.force_delete_button.config(state="normal")
             except ValueError:
@@ -111,10 +118,15 @@ class CategoryTrashbinPage(BasePage):
 
     def _clear_selection(self):
         self.selected_category_id = None
+        self.selected_category_ids = []
         self.restore_button.config(state="disabled")
         self.force_delete_button.config(state="disabled")
 
     def _restore_selected_category(self):
+        if len(self.selected_category_ids) > 1:
+            self._run_bulk_category_action(category_api_client.restore_category, "restore")
+            return
+
         if not self.selected_category_id:
             return
 
@@ -122,19 +134,16 @@ class CategoryTrashbinPage(BasePage):
                 "Confirm Restore",
                 f"Are you sure you want to restore category ID {self.selected_category_id}?"
         ):
-            try:
-                response = category_api_client.restore_category(self.selected_category_id)
-                if response:
-                    messagebox.showinfo("Success", "Category restored successfully!")
-                    self.refresh()
-                else:
-                    messagebox.showerror("Error", "Failed to restore category")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to restore category: {e}")
-            finally:
-                self._clear_selection()
+            category_id = self.selected_category_id
+            self._clear_selection()
+            self._remove_category_row(category_id, lambda: category_api_client.restore_category(category_id),
+                                      "Failed to restore category")
 
     def _force_delete_selected_category(self):
+        if len(self.selected_category_ids) > 1:
+            self._run_bulk_category_action(category_api_client.force_delete_category, "permanently delete")
+            return
+
         if not self.selected_category_id:
             return
 
@@ -143,66 +152,81 @@ class CategoryTrashbinPage(BasePage):
                 f"Are you sure you want to PERMANENTLY delete category ID {self.selected_category_id}?\n"
                 "This action cannot be undone!"
         ):
-            try:
-                category_api_client.force_delete_category(self.selected_category_id)
-                messagebox.showinfo("Success", "Category permanently deleted!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete category: {e}")
-            finally:
-                self._clear_selection()
+            category_id = self.selected_category_id
+            self._clear_selection()
+            self._remove_category_row(category_id, lambda: category_api_client.force_delete_category(category_id),
+                                      "Failed to delete category")
+
+    def _remove_category_row(self, category_id, mutation, error_message):
+        # The row leaves the trash bin straight away and is put back if the call fails.
+        self.run_optimistic(
+            lambda: self.category_list_component.remove_item(str(category_id)),
+            self.category_list_component.restore_item,
+            mutation,
+            on_error=lambda e: messagebox.showerror("API Error", f"{error_message}: {e}"),
+            key=f"mutation:{category_id}"
+        )
+
+    def _run_bulk_category_action(self, action, verb):
+        category_ids = list(self.selected_category_ids)
+        warning = "\nThis action cannot be undone!" if verb == "permanently delete" else ""
+        if messagebox.askyesno(f"Confirm {verb.title()}",
+                               f"Are you sure you want to {verb} {len(category_ids)} categories?{warning}"):
+            self._clear_selection()
+            progress_text = "Restoring categories" if verb == "restore" else "Deleting categories"
+            self.run_bulk_action(category_ids, action, self.category_list_component, self.bulk_progress,
+                                 progress_text, f"Could not {verb}")
 
     def _fetch_all_users_and_category_types(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            category_types = category_type_api_client.get_all_category_types()
-            self.category_types_cache = {
-                str(category_type["id"]): category_type
-                for category_type in category_types
-                if category_type and "id" in category_type
-            }
+            self.users_cache = reference_store.get_index("users")
+            self.category_types_cache = reference_store.get_index("category_types")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or Category Types: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or Category Types: {e}")
 
     def _load_categories(self):
-        try:
-            self._fetch_all_users_and_category_types()
-            categories_raw_data = category_api_client.get_deleted_categories()
-            self.category_data = categories_raw_data
-
-            items_for_list = []
-            for category in categories_raw_data:
-                user_id = category.get("user_id")
-                category_type_id = category.get("category_type_id")
-
-                category_type_name = self.category_types_cache.get(
-                    str(category_type_id), {}
-                ).get("name", "Unknown Category Type")
-
-                user_name = self.users_cache.get(
-                    str(user_id), {}
-                ).get("first_name", "Unknown User")
-
-                row_values = []
-                for col in self.columns:
-                    if col == "user_name":
-                        row_values.append(user_name)
-                    elif col == "category_type_name":
-                        row_values.append(category_type_name)
-                    else:
-                        value = category.get(col, '')
-                        row_values.append(str(value) if isinstance(value, UUID) else value)
-
-                items_for_list.append(tuple(row_values))
-
-            self.category_list_component.set_items(items_for_list)
-            self._clear_selection()
+        self.run_in_background(self._fetch_categories, self._show_categories, self._on_categories_load_failed)
+
+    def _fetch_categories(self):
+        self._fetch_all_users_and_category_types()
+        categories_raw_data = category_api_client.get_deleted_categories()
+
+        items_for_list = []
+        for category in categories_raw_data:
+            user_id = category.get("user_id")
+            category_type_id = category.get("category_type_id")
+
+            category_type_name = self.category_types_cache.get(
+                str(category_type_id), {}
+            ).get("name", "Unknown Category Type")
+
+            user_name = self.users_cache.get(
+                str(user_id), {}
+            ).get("first_name", "Unknown User")
+
+            row_values = []
+            for col in self.columns:
+                if col == "user_name":
+                    row_values.append(user_name)
+                elif col == "category_type_name":
+                    row_values.append(category_type_name)
+                else:
+                    value = category.get(col, '')
+                    row_values.append(str(value) if isinstance(value, UUID) else value)
 
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Categories: {e}")
-            self.category_list_component.clear_list()
+            items_for_list.append(tuple(row_values))
+        return categories_raw_data, items_for_list
+
+    def _show_categories(self, result):
+        self.category_data, items_for_list = result
+        self.category_list_component.set_items(items_for_list)
+        self._on_category_selected(self.category_list_component.get_selected_item())
+
+
+    def _on_categories_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Categories: {e}")
+        self.category_list_component.clear_list()
 
     def refresh(self):
         self._load_categories()
\ No newline at end of file
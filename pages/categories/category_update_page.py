@@ -3,8 +3,8 @@ from uuid import UUID
 
 from components.detail_form_component import DetailFormComponent
 from core.categories_endpoints import category_api_client
-from core.category_types_endpoints import category_type_api_client
-from core.users_endpoints import user_api_client
+from core.fan_out import fan_out
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -12,6 +12,8 @@ class CategoryUpdatePage(BasePage):
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
         self.current_category_id = None
+        self._loaded_category = None
+        self._loaded_etag = None
 
     def _setup_ui(self):
         self.grid_rowconfigure(0, weight=1)
@@ -58,8 +60,28 @@ class CategoryUpdatePage(BasePage):
 
         try:
             self.current_category_id = UUID(str(category_id))
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid ID format or data conversion error: {e}")
+            self._reset_form_and_navigate_back()
+            return
 
-            self._fetch_all_users_and_category_types()
+        current_id = self.current_category_id
+        self.run_in_background(lambda: self._fetch_category(current_id), self._show_category,
+                               self._on_category_load_failed)
+
+    def _fetch_category(self, category_id):
+        category = self._fetch_all_users_and_category_types(
+            category=lambda: category_api_client.get_category_by_id(category_id)
+        )["category"]
+        if isinstance(category, Exception):
+            raise category
+        return category
+
+    def _show_category(self, category_data):
+        # Kept to diff the form against on save; the ETag guards against saving over a newer version.
+        self._loaded_category = category_data
+        self._loaded_etag = category_api_client.get_category_etag(self.current_category_id)
+        try:
             user_options = {
                 user.get('first_name'): str(user.get('id'))
                 for user in self.users_cache.values()
@@ -78,8 +100,6 @@ class CategoryUpdatePage(BasePage):
                 if field['key'] == 'category_type_id':
                     field['options'] = category_types_options
 
-            category_data = category_api_client.get_category_by_id(self.current_category_id)
-
             if self.detail_form:
                 self.detail_form.destroy()
 
@@ -113,33 +133,43 @@ class CategoryUpdatePage(BasePage):
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid ID format or data conversion error: {e}")
             self._reset_form_and_navigate_back()
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load category details or users: {e}")
-            self._reset_form_and_navigate_back()
 
-    def _fetch_all_users_and_category_types(self):
-        try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
+    def _on_category_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load category details or users: {e}")
+        self._reset_form_and_navigate_back()
+
+    def _fetch_all_users_and_category_types(self, **other_calls):
+        results = fan_out({
+            "users": lambda: reference_store.get_index("users"),
+            "category_types": lambda: reference_store.get_index("category_types"),
+            **other_calls
+        }, return_exceptions=True)
 
-            category_types = category_type_api_client.get_all_category_types()
-            self.category_types_cache = {str(category_type["id"]): category_type for category_type in category_types if category_type and "id" in category_type}
-        except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or Category Types: {e}")
+        users, category_types = results.pop("users"), results.pop("category_types")
+        error = next((value for value in (users, category_types) if isinstance(value, Exception)), None)
+        if error is not None:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or Category Types: {error}")
+        else:
+            self.users_cache = users
+            self.category_types_cache = category_types
+        return results
 
 
     def _reset_form_and_navigate_back(self):
         self.detail_form.set_data({})
         self.current_category_id = None
+        self._loaded_category = None
+        self._loaded_etag = None
         self.controller.show_page("CategoryPage")
 
     def _update_category(self):
-        if not self.current_category_id:
+        if not self.current_category_id or self._loaded_category is None:
             messagebox.showerror("Error", "No category selected for update.")
             return
 
         try:
-            current_data = category_api_client.get_category_by_id(self.current_category_id)
+            current_data = self._loaded_category
 
             form_data = self.detail_form.get_data()
 
@@ -173,22 +203,23 @@ class CategoryUpdatePage(BasePage):
                     messagebox.showerror("Input Error", "Invalid Category Type ID format")
                     return
 
-            response = category_api_client.update_category(self.current_category_id, payload)
-
-            if response:
-                messagebox.showinfo("Success", "Category updated successfully!")
-                self.controller.show_page("CategoryPage")
-            else:
-                messagebox.showerror("Error", "Received unexpected response from server")
-
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid ID format: {e}")
-        except Exception as e:
-            messagebox.showerror(
-                "API Error",
-                f"Failed to update Category:\n{str(e)}\n"
-                f"Please check if the server is running and accessible."
-            )
+            return
+
+        category_id, etag = self.current_category_id, self._loaded_etag
+        self.submit_in_background(
+            self.detail_form, lambda: category_api_client.update_category(category_id, payload, if_match=etag),
+            self._on_category_updated,
+            "Failed to update Category. Please check if the server is running and accessible.\n"
+        )
+
+    def _on_category_updated(self, response):
+        if response:
+            messagebox.showinfo("Success", "Category updated successfully!")
+            self.return_to("CategoryPage")
+        else:
+            messagebox.showerror("Error", "Received unexpected response from server")
 
     def _delete_category(self):
         if not self.current_category_id:
@@ -197,9 +228,10 @@ class CategoryUpdatePage(BasePage):
 
         if messagebox.askyesno("Confirm Delete",
                                f"Are you sure you want to delete category ID {self.current_category_id}?"):
-            try:
-                category_api_client.delete_category(self.current_category_id)
-                messagebox.showinfo("Success", "Category deleted successfully!")
-                self.controller.show_page("CategoryPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete Category: {e}")
+            category_id = self.current_category_id
+            self.submit_in_background(self.detail_form, lambda: category_api_client.delete_category(category_id),
+                                      self._on_category_deleted, "Failed to delete Category")
+
+    def _on_category_deleted(self, _result):
+        messagebox.showinfo("Success", "Category deleted successfully!")
+        self.return_to("CategoryPage")
@@ -60,9 +60,9 @@ class CategoryTypeCreatePage(BasePage):
             messagebox.showerror("Validation Error", "Name and Is Positive are required.")
             return
 
-        try:
-            category_type_api_client.create_category_type(payload)
-            messagebox.showinfo("Success", "Category Type created successfully!")
-            self.controller.show_page("CategoryTypesPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to create category_type: {e}")
+        self.submit_in_background(self.detail_form, lambda: category_type_api_client.create_category_type(payload),
+                                  self._on_category_type_created, "Failed to create category_type")
+
+    def _on_category_type_created(self, _result):
+        messagebox.showinfo("Success", "Category Type created successfully!")
+        self.return_to("CategoryTypesPage")
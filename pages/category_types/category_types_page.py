@@ -4,7 +4,7 @@ from tkinter import ttk, messagebox
 from uuid import UUID
 
 from components.list_box_component import ListBoxComponent
-from core.category_types_endpoints import category_type_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -48,28 +48,33 @@ class CategoryTypesPage(BasePage):
                                       sticky="nsew")
         self.category_type_list_component.on_select(self._on_category_type_selected)
 
-        self._load_category_types()
-
     def _load_category_types(self):
-        try:
-            category_types_raw_data = category_type_api_client.get_all_category_types()
-            self.category_type_data = category_types_raw_data
-            items_for_list = []
-            for category_type in category_types_raw_data:
-                row_values = []
-                for col in self.columns:
-                    value = category_type.get(col, '')
-                    if isinstance(value, UUID):
-                        row_values.append(str(value))
-                    elif isinstance(value, datetime):
-                        row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
-                    else:
-                        row_values.append(value)
-                items_for_list.append(tuple(row_values))
-            self.category_type_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Category Types: {e}")
-            self.category_type_list_component.clear_list()
+        self.run_in_background(self._fetch_category_types, self._show_category_types,
+                               self._on_category_types_load_failed)
+
+    def _fetch_category_types(self):
+        category_types_raw_data = reference_store.get_all("category_types")
+        items_for_list = []
+        for category_type in category_types_raw_data:
+            row_values = []
+            for col in self.columns:
+                value = category_type.get(col, '')
+                if isinstance(value, UUID):
+                    row_values.append(str(value))
+                elif isinstance(value, datetime):
+                    row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
+                else:
+                    row_values.append(value)
+            items_for_list.append(tuple(row_values))
+        return category_types_raw_data, items_for_list
+
+    def _show_category_types(self, result):
+        self.category_type_data, items_for_list = result
+        self.category_type_list_component.set_items(items_for_list)
+
+    def _on_category_types_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Category Types: {e}")
+        self.category_type_list_component.clear_list()
 
     def _on_category_type_selected(self, selected_values):
         if selected_values:
@@ -47,20 +47,27 @@ class CategoryTypeUpdatePage(BasePage):
         if category_type_id:
             try:
                 self.current_category_type_id = UUID(str(category_type_id))
-                category_type_data = category_type_api_client.get_category_type_by_id(self.current_category_type_id)
-                self.detail_form.set_data(category_type_data)
-                if self.controller:
-                    self.controller.title(f"Update Category Type - {category_type_data.get('name', '')}")
             except ValueError:
                 messagebox.showerror("Error", f"Invalid Category Type ID format: {category_type_id}")
                 self._reset_form_and_navigate_back()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to load category_type details: {e}")
-                self._reset_form_and_navigate_back()
+                return
+
+            current_id = self.current_category_type_id
+            self.run_in_background(lambda: category_type_api_client.get_category_type_by_id(current_id),
+                                   self._show_category_type, self._on_category_type_load_failed)
         else:
             messagebox.showwarning("Warning", "No category_type selected for update. Returning to list.")
             self._reset_form_and_navigate_back()
 
+    def _show_category_type(self, category_type_data):
+        self.detail_form.set_data(category_type_data)
+        if self.controller:
+            self.controller.title(f"Update Category Type - {category_type_data.get('name', '')}")
+
+    def _on_category_type_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load category_type details: {e}")
+        self._reset_form_and_navigate_back()
+
     def _reset_form_and_navigate_back(self):
         self.detail_form.set_data({})
         self.current_category_type_id = None
@@ -84,12 +91,14 @@ class CategoryTypeUpdatePage(BasePage):
             messagebox.showerror("Validation Error", "Name and Is Positive are required.")
             return
 
-        try:
-            category_type_api_client.update_category_type(self.current_category_type_id, payload)
-            messagebox.showinfo("Success", "Category Type updated successfully!")
-            self.controller.show_page("CategoryTypesPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to update Category Type: {e}")
+        category_type_id = self.current_category_type_id
+        self.submit_in_background(self.detail_form,
+                                  lambda: category_type_api_client.update_category_type(category_type_id, payload),
+                                  self._on_category_type_updated, "Failed to update Category Type")
+
+    def _on_category_type_updated(self, _result):
+        messagebox.showinfo("Success", "Category Type updated successfully!")
+        self.return_to("CategoryTypesPage")
 
     def _delete_category_type(self):
         if not self.current_category_type_id:
@@ -98,10 +107,11 @@ class CategoryTypeUpdatePage(BasePage):
 
         if messagebox.askyesno("Confirm Delete",
                                f"Are you sure you want to delete category_type ID {self.current_category_type_id}?"):
-            try:
-                category_type_api_client.delete_category_type(self.current_category_type_id)
-                messagebox.showinfo("Success",
-                                    "Category Type deleted successfully!")
-                self.controller.show_page("CategoryTypesPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete Category Type: {e}")
+            category_type_id = self.current_category_type_id
+            self.submit_in_background(self.detail_form,
+                                      lambda: category_type_api_client.delete_category_type(category_type_id),
+                                      self._on_category_type_deleted, "Failed to delete Category Type")
+
+    def _on_category_type_deleted(self, _result):
+        messagebox.showinfo("Success", "Category Type deleted successfully!")
+        self.return_to("CategoryTypesPage")
@@ -2,7 +2,7 @@ from tkinter import messagebox, ttk
 
 from components.detail_form_component import DetailFormComponent
 from core.financial_goals_endpoints import financial_goals_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -34,8 +34,9 @@ class FinancialGoalsCreatePage(BasePage):
         ]
 
     def refresh(self, **kwargs):
-        self._fetch_all_users()
+        self.run_in_background(self._fetch_all_users, self._show_form)
 
+    def _show_form(self, _result=None):
         user_options = {
             user.get('first_name'): str(user.get('id'))
             for user in self.users_cache.values()
@@ -75,10 +76,9 @@ class FinancialGoalsCreatePage(BasePage):
 
     def _fetch_all_users(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
+            self.users_cache = reference_store.get_index("users")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Not possible to load all users: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning", f"Not possible to load all users: {e}")
 
     def _create_financial_goal(self):
         financial_goal_data = self.detail_form.get_data()
@@ -97,19 +97,21 @@ class FinancialGoalsCreatePage(BasePage):
                 'target_amount': float(financial_goal_data['target_amount']),
                 'deadline': financial_goal_data['deadline']
             }
-
-            response = financial_goals_api_client.create_financial_goals(payload)
-
-            if response and isinstance(response, dict) and response.get('id'):
-                messagebox.showinfo("Sucesso", "Sucessfully created Financial Goal!")
-                self.controller.show_page("FinancialGoalsPage")
-            elif response and isinstance(response, dict) and response.get('message'):
-                messagebox.showerror("Erro de API", response.get('message'))
-            else:
-                error_message = f"Unknown Error. Response format da API inesperado: {response}"
-                messagebox.showerror("Erro de API", error_message)
-
         except ValueError as ve:
             messagebox.showerror("Erro de Entrada", f"Please, verify entry formats. Error: {ve}")
-        except Exception as e:
-            messagebox.showerror("Erro de API", f"Failed to create financial goal: {e}")
\ No newline at end of file
+            return
+
+        self.submit_in_background(
+            self.detail_form, lambda: financial_goals_api_client.create_financial_goals(payload),
+            self._on_financial_goal_created, "Failed to create financial goal"
+        )
+
+    def _on_financial_goal_created(self, response):
+        if response and isinstance(response, dict) and response.get('id'):
+            messagebox.showinfo("Sucesso", "Sucessfully created Financial Goal!")
+            self.return_to("FinancialGoalsPage")
+        elif response and isinstance(response, dict) and response.get('message'):
+            messagebox.showerror("Erro de API", response.get('message'))
+        else:
+            error_message = f"Unknown Error. Response format da API inesperado: {response}"
+            messagebox.showerror("Erro de API", error_message)
\ No newline at end of file
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from components.list_box_component import ListBoxComponent
 from core.financial_goals_endpoints import financial_goals_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -55,42 +55,46 @@ class FinancialGoalsPage(BasePage):
                                                sticky="nsew")
         self.financial_goal_list_component.on_select(self._on_financial_goal_selected)
 
-        self._load_financial_goals()
-
     def _fetch_all_users(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
+            self.users_cache = reference_store.get_index("users")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning", f"Could not load all users: {e}")
 
 
     def _load_financial_goals(self):
-        try:
-            self._fetch_all_users()
-            financial_goals_raw_data = financial_goals_api_client.get_all_financial_goals()
-            self.financial_goal_data = financial_goals_raw_data
-            items_for_list = []
-
-            for financial_goal in financial_goals_raw_data:
-                user_id = financial_goal.get("user_id")
-                user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
-
-                row_values = []
-                for col in self.columns:
-                    if col == "user_name":
-                        row_values.append(user_name)
+        self.run_in_background(self._fetch_financial_goals, self._show_financial_goals,
+                               self._on_financial_goals_load_failed)
+
+    def _fetch_financial_goals(self):
+        self._fetch_all_users()
+        financial_goals_raw_data = financial_goals_api_client.get_all_financial_goals()
+        items_for_list = []
+
+        for financial_goal in financial_goals_raw_data:
+            user_id = financial_goal.get("user_id")
+            user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
+
+            row_values = []
+            for col in self.columns:
+                if col == "user_name":
+                    row_values.append(user_name)
+                else:
+                    value = financial_goal.get(col, '')
+                    if isinstance(value, UUID):
+                        row_values.append(str(value))
                     else:
-                        value = financial_goal.get(col, '')
-                        if isinstance(value, UUID):
-                            row_values.append(str(value))
-                        else:
-                            row_values.append(value)
-                items_for_list.append(tuple(row_values))
-            self.financial_goal_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Financial Goals: {e}")
-            self.financial_goal_list_component.clear_list()
+                        row_values.append(value)
+            items_for_list.append(tuple(row_values))
+        return financial_goals_raw_data, items_for_list
+
+    def _show_financial_goals(self, result):
+        self.financial_goal_data, items_for_list = result
+        self.financial_goal_list_component.set_items(items_for_list)
+
+    def _on_financial_goals_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Financial Goals: {e}")
+        self.financial_goal_list_component.clear_list()
 
     def _on_financial_goal_selected(self, selected_values):
         if selected_values:
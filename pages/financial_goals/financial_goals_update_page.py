@@ -3,7 +3,7 @@ from uuid import UUID
 
 from components.detail_form_component import DetailFormComponent
 from core.financial_goals_endpoints import financial_goals_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -47,8 +47,21 @@ class FinancialGoalsUpdatePage(BasePage):
 
         try:
             self.current_financial_goals_id = UUID(str(financial_goals_id))
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid ID format or data conversion error: {e}")
+            self._reset_form_and_navigate_back()
+            return
 
-            self._fetch_all_users()
+        current_id = self.current_financial_goals_id
+        self.run_in_background(lambda: self._fetch_financial_goals(current_id), self._show_financial_goals,
+                               self._on_financial_goals_load_failed)
+
+    def _fetch_financial_goals(self, financial_goals_id):
+        self._fetch_all_users()
+        return financial_goals_api_client.get_financial_goals_by_id(financial_goals_id)
+
+    def _show_financial_goals(self, financial_goals_data):
+        try:
             user_options = {
                 user.get('first_name'): str(user.get('id'))
                 for user in self.users_cache.values()
@@ -60,8 +73,6 @@ class FinancialGoalsUpdatePage(BasePage):
                     field['options'] = user_options
                     break
 
-            financial_goals_data = financial_goals_api_client.get_financial_goals_by_id(self.current_financial_goals_id)
-
             if self.detail_form:
                 self.detail_form.destroy()
 
@@ -95,16 +106,16 @@ class FinancialGoalsUpdatePage(BasePage):
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid ID format or data conversion error: {e}")
             self._reset_form_and_navigate_back()
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load financial goal details or users: {e}")
-            self._reset_form_and_navigate_back()
+
+    def _on_financial_goals_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load financial goal details or users: {e}")
+        self._reset_form_and_navigate_back()
 
     def _fetch_all_users(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
+            self.users_cache = reference_store.get_index("users")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Failed to load all Users: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning", f"Failed to load all Users: {e}")
 
     def _reset_form_and_navigate_back(self):
         self.detail_form.set_data({})
@@ -138,12 +149,14 @@ class FinancialGoalsUpdatePage(BasePage):
             messagebox.showerror("Input Error", f"Invalid Target Amount format: {e}")
             return
 
-        try:
-            financial_goals_api_client.update_financial_goals(self.current_financial_goals_id, payload)
-            messagebox.showinfo("Success", "Financial Goal updated successfully!")
-            self.controller.show_page("FinancialGoalsPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to update Financial Goal: {e}")
+        goal_id = self.current_financial_goals_id
+        self.submit_in_background(self.detail_form,
+                                  lambda: financial_goals_api_client.update_financial_goals(goal_id, payload),
+                                  self._on_financial_goals_updated, "Failed to update Financial Goal")
+
+    def _on_financial_goals_updated(self, _result):
+        messagebox.showinfo("Success", "Financial Goal updated successfully!")
+        self.return_to("FinancialGoalsPage")
 
     def _delete_financial_goals(self):
         if not self.current_financial_goals_id:
@@ -152,9 +165,11 @@ class FinancialGoalsUpdatePage(BasePage):
 
         if messagebox.askyesno("Confirm Delete",
                                f"Are you sure you want to delete financial goal ID {self.current_financial_goals_id}?"):
-            try:
-                financial_goals_api_client.delete_financial_goals(self.current_financial_goals_id)
-                messagebox.showinfo("Success", "Financial Goal deleted successfully!")
-                self.controller.show_page("FinancialGoalsPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete Financial Goal: {e}")
\ No newline at end of file
+            goal_id = self.current_financial_goals_id
+            self.submit_in_background(self.detail_form,
+                                      lambda: financial_goals_api_client.delete_financial_goals(goal_id),
+                                      self._on_financial_goals_deleted, "Failed to delete Financial Goal")
+
+    def _on_financial_goals_deleted(self, _result):
+        messagebox.showinfo("Success", "Financial Goal deleted successfully!")
+        self.return_to("FinancialGoalsPage")
\ No newline at end of file
@@ -0,0 +1,254 @@
+import os
+import tkinter as tk
+from datetime import datetime
+from tkinter import messagebox, ttk
+from uuid import UUID
+
+from components.bulk_entry_grid_component import BulkEntryGridComponent
+from components.progress_component import ProgressComponent
+from core.api_client import APIClient, new_idempotency_key
+from core.reference_store import reference_store
+from core.transactions_endpoints import transaction_api_client
+from pages.base_page import BasePage
+
+BULK_ENTRY_INITIAL_ROWS = int(os.getenv("BULK_ENTRY_INITIAL_ROWS", "10"))
+
+# Values a new row copies from the row above it.
+CARRIED_OVER_FIELDS = ('user_id', 'category_id', 'date', 'is_recurring')
+
+
+class TransactionBulkCreatePage(BasePage):
+    def __init__(self, parent, controller=None, *args, **kwargs):
+        super().__init__(parent, controller, *args, **kwargs)
+        self.users_cache = {}
+        self.categories_cache = {}
+        # Kept per row until it is created and sent again on resubmit; rows whose outcome is unknown
+        # are still flagged for the user to check, since not every backend honours the key.
+        self._idempotency_keys = {}
+        self._created_transactions = []
+
+    def _setup_ui(self):
+        self.grid_rowconfigure(0, weight=0)
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(2, weight=0)
+        self.grid_rowconfigure(3, weight=0)
+        self.grid_columnconfigure(0, weight=1)
+
+        if self.controller:
+            back_button = ttk.Button(self, text="< Back to Transactions", command=self._back_to_transactions)
+            back_button.grid(row=0, column=0, padx=10, pady=10, sticky="nw")
+
+        title_label = tk.Label(self, text="Bulk Entry - Transactions", font=("Arial", 20, "bold"), pady=10)
+        title_label.grid(row=0, column=0, pady=10, sticky="n")
+
+        self.transaction_fields_config = [
+            {'label': 'User', 'key': 'user_id', 'type': 'id_dropdown', 'options': {}, 'width': 14},
+            {'label': 'Category', 'key': 'category_id', 'type': 'id_dropdown', 'options': {}, 'width': 14},
+            {'label': 'Name', 'key': 'name', 'type': 'entry', 'width': 18},
+            {'label': 'Description', 'key': 'description', 'type': 'entry', 'width': 22},
+            {'label': 'Amount', 'key': 'amount', 'type': 'entry', 'width': 10},
+            {'label': 'Date (YYYY-MM-DD)', 'key': 'date', 'type': 'entry', 'width': 12},
+            {'label': 'Is Recurring', 'key': 'is_recurring', 'type': 'dropdown', 'options': ['True', 'False'],
+             'width': 7},
+        ]
+
+        self.entry_grid = BulkEntryGridComponent(self, fields_config=self.transaction_fields_config,
+                                                 bg=self.cget('bg'))
+        self.entry_grid.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+
+        button_frame = tk.Frame(self, bg=self.cget('bg'))
+        button_frame.grid(row=2, column=0, padx=10, pady=(0, 10), sticky="ew")
+
+        ttk.Button(button_frame, text="Add Row", command=self._add_row).pack(side="left")
+        ttk.Button(button_frame, text="Add 10 Rows",
+                   command=lambda: self._add_rows(10)).pack(side="left", padx=(10, 0))
+        ttk.Button(button_frame, text="Clear", command=self._clear_rows).pack(side="left", padx=(10, 0))
+
+        self.submit_button = ttk.Button(button_frame, text="Submit All", command=self._submit_all)
+        self.submit_button.pack(side="right")
+
+        self.bulk_progress = ProgressComponent(self, on_cancel_callback=self.cancel_bulk_action, bg=self.cget('bg'))
+        self.bulk_progress.grid(row=3, column=0, padx=10, pady=(0, 10), sticky="w")
+        self.bulk_progress.grid_remove()
+
+    def refresh(self, **kwargs):
+        # Rows already typed in are kept; only the dropdown options are reloaded.
+        self.submit_button.config(state="disabled" if "bulk" in self._background_tasks else "normal")
+        self.run_in_background(self._fetch_all_users_and_categories, self._show_grid)
+
+    def _fetch_all_users_and_categories(self):
+        try:
+            self.users_cache = reference_store.get_index("users")
+            self.categories_cache = reference_store.get_index("categories")
+        except Exception as e:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning", f"Could not load all users or categories: {e}")
+
+    def _show_grid(self, _result=None):
+        user_options = {
+            user.get('first_name'): str(user.get('id'))
+            for user in self.users_cache.values()
+            if user and user.get('id') and user.get('first_name')
+        }
+
+        category_options = {
+            category.get('name'): str(category.get('id'))
+            for category in self.categories_cache.values()
+            if category and category.get('id') and category.get('name')
+        }
+
+        self.entry_grid.set_options('user_id', user_options)
+        self.entry_grid.set_options('category_id', category_options)
+
+        if not self.entry_grid.row_ids():
+            self._add_rows(BULK_ENTRY_INITIAL_ROWS)
+
+        if self.controller:
+            self.controller.title("Bulk Entry - Transactions")
+
+    def _add_row(self):
+        row_ids = self.entry_grid.row_ids()
+        values = {'is_recurring': 'False'}
+        if row_ids:
+            last_row = self.entry_grid.get_row(row_ids[-1])
+            values.update({key: last_row[key] for key in CARRIED_OVER_FIELDS if last_row.get(key)})
+        return self.entry_grid.add_row(values)
+
+    def _add_rows(self, count):
+        for _ in range(count):
+            self._add_row()
+
+    def _clear_rows(self):
+        if "bulk" in self._background_tasks:
+            return
+        self.entry_grid.clear()
+        self._idempotency_keys.clear()
+        self._add_rows(BULK_ENTRY_INITIAL_ROWS)
+
+    def _build_payload(self, data):
+        for field in self.transaction_fields_config:
+            if field['key'] != 'description' and not data.get(field['key']):
+                raise ValueError(f"Missing {field['label']}")
+
+        try:
+            amount = float(data['amount'])
+        except ValueError:
+            raise ValueError("Amount must be a number")
+
+        try:
+            datetime.strptime(data['date'], "%Y-%m-%d")
+        except ValueError:
+            raise ValueError("Date must be YYYY-MM-DD")
+
+        return {
+            'user_id': str(UUID(data['user_id'])),
+            'category_id': str(UUID(data['category_id'])),
+            'name': data['name'],
+            'description': data.get('description', ''),
+            'amount': amount,
+            'date': data['date'],
+            'is_recurring': (data['is_recurring'] == 'True'),
+        }
+
+    def _submit_all(self):
+        if "bulk" in self._background_tasks:
+            messagebox.showinfo("Busy", "Please wait for the current operation to finish.")
+            return
+
+        row_ids, payloads, invalid = [], [], 0
+        for row_id, data in self.entry_grid.get_rows():
+            # Rows where nothing was typed only hold the carried-over dropdown values.
+            if not any(data.get(key) for key in ('name', 'description', 'amount')):
+                self.entry_grid.set_row_status(row_id, "")
+                continue
+            try:
+                payloads.append(self._build_payload(data))
+            except ValueError as e:
+                self.entry_grid.set_row_status(row_id, str(e))
+                invalid += 1
+                continue
+            self.entry_grid.set_row_status(row_id, "")
+            row_ids.append(row_id)
+
+        if invalid:
+            messagebox.showerror("Validation Error",
+                                 f"{invalid} row(s) have errors. Fix them before submitting.")
+            return
+        if not payloads:
+            messagebox.showinfo("Bulk Entry", "There are no rows to submit.")
+            return
+
+        keys = [self._idempotency_keys.setdefault(row_id, new_idempotency_key()) for row_id in row_ids]
+
+        self.show_progress("bulk", self.bulk_progress, len(payloads), "Creating transactions")
+        self.submit_button.config(state="disabled")
+
+        self.stream_bulk(
+            lambda stop: transaction_api_client.iter_create_transactions(payloads, keys, stop=stop),
+            len(payloads),
+            self.bulk_progress.set_progress,
+            lambda results: self._on_submitted(row_ids, results),
+            self._on_submit_failed
+        )
+
+    def _on_submitted(self, row_ids, results):
+        self.hide_progress("bulk")
+        self.submit_button.config(state="normal")
+
+        created_rows, failed, unknown, not_sent = [], 0, 0, 0
+        for index, row_id in enumerate(row_ids):
+            if index not in results:
+                self.entry_grid.set_row_status(row_id, "Not sent (cancelled)")
+                not_sent += 1
+                continue
+            result = results[index]
+            if isinstance(result, dict) and result.get('id'):
+                self._created_transactions.append(result)
+                created_rows.append(row_id)
+                self._idempotency_keys.pop(row_id, None)
+            elif not isinstance(result, Exception) or APIClient.may_have_been_applied(result):
+                self.entry_grid.set_row_status(row_id, f"May have been created; check before resubmitting "
+                                                       f"({str(result)[:60]})")
+                unknown += 1
+            else:
+                self.entry_grid.set_row_status(row_id, str(result)[:120])
+                failed += 1
+
+        self.entry_grid.remove_rows(created_rows)
+
+        visible = bool(self.winfo_manager())
+        if not visible:
+            # Finished after the user left the page; patch the transaction list if it is open.
+            self._hand_back_created()
+
+        if not (failed or unknown or not_sent):
+            messagebox.showinfo("Success", f"{len(created_rows)} transactions created successfully!")
+            if visible:
+                self._back_to_transactions()
+            return
+
+        summary = f"Created {len(created_rows)} of {len(row_ids)} transactions."
+        if failed:
+            summary += f"\n{failed} failed and can be fixed and resubmitted."
+        if unknown:
+            summary += f"\n{unknown} may have been created; check the transaction list before resubmitting them."
+        if not_sent:
+            summary += f"\n{not_sent} were not sent (cancelled)."
+        messagebox.showwarning("Bulk Entry", summary)
+
+    def _on_submit_failed(self, e):
+        self.hide_progress("bulk")
+        self.submit_button.config(state="normal")
+        messagebox.showerror("API Error", f"Failed to create transactions: {e}")
+
+    def _hand_back_created(self):
+        created, self._created_transactions = self._created_transactions, []
+        transaction_page = self.controller.pages.get("TransactionPage") if self.controller else None
+        if created and transaction_page is not None and transaction_page.winfo_manager():
+            transaction_page.refresh(created=created)
+
+    def _back_to_transactions(self):
+        if self._created_transactions:
+            created, self._created_transactions = self._created_transactions, []
+            self.controller.show_page("TransactionPage", created=created)
+        else:
+            self.controller.show_page("TransactionPage")
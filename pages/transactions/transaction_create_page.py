@@ -3,8 +3,7 @@ from uuid import UUID
 
 from components.detail_form_component import DetailFormComponent
 from core.transactions_endpoints import transaction_api_client
-from core.categories_endpoints import category_api_client
-from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -43,8 +42,9 @@ class TransactionCreatePage(BasePage):
         ]
 
     def refresh(self, **kwargs):
-        self._fetch_all_users_and_categories()
+        self.run_in_background(self._fetch_all_users_and_categories, self._show_form)
 
+    def _show_form(self, _result=None):
         user_options = {
             user.get('first_name'): str(user.get('id'))
             for user in self.users_cache.values()
@@ -99,17 +99,10 @@ class TransactionCreatePage(BasePage):
 
     def _fetch_all_users_and_categories(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            categories = category_api_client.get_all_categories()
-            self.categories_cache = {
-                str(category["id"]): category
-                for category in categories
-                if category and "id" in category
-            }
+            self.users_cache = reference_store.get_index("users")
+            self.categories_cache = reference_store.get_index("categories")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or categories: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning", f"Could not load all users or categories: {e}")
 
     def _create_transaction(self):
         transaction_data = self.detail_form.get_data()
@@ -130,19 +123,21 @@ class TransactionCreatePage(BasePage):
                 'date': transaction_data['date'],
                 'is_recurring': (transaction_data['is_recurring'] == 'True'),
             }
-
-            response = transaction_api_client.create_transaction(payload)
-
-            if response and isinstance(response, dict) and response.get('id'):
-                messagebox.showinfo("Success", "Transaction created successfully!")
-                self.controller.show_page("TransactionPage")
-            elif response and isinstance(response, dict) and response.get('message'):
-                messagebox.showerror("API Error", response.get('message'))
-            else:
-                error_message = f"Unknown Error. Unexpected API response format: {response}"
-                messagebox.showerror("API Error", error_message)
-
         except ValueError as ve:
             messagebox.showerror("Input Error", f"Please verify input formats (e.g., Amount, Dates). Error: {ve}")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to create transaction: {e}")
\ No newline at end of file
+            return
+
+        self.submit_in_background(
+            self.detail_form, lambda: transaction_api_client.create_transaction(payload),
+            self._on_transaction_created, "Failed to create transaction"
+        )
+
+    def _on_transaction_created(self, response):
+        if response and isinstance(response, dict) and response.get('id'):
+            messagebox.showinfo("Success", "Transaction created successfully!")
+            self.return_to("TransactionPage", created=response)
+        elif response and isinstance(response, dict) and response.get('message'):
+            messagebox.showerror("API Error", response.get('message'))
+        else:
+            error_message = f"Unknown Error. Unexpected API response format: {response}"
+            messagebox.showerror("API Error", error_message)
\ No newline at end of file
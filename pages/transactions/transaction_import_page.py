@@ -0,0 +1,243 @@
+import os
+import threading
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+
+from components.id_dropdown_component import IdDropdownComponent
+from components.progress_component import ProgressComponent
+from core.reference_store import reference_store
+from core.statement_import import IMPORT_FIELDS, StatementImporter, iter_csv_rows, iter_ofx_rows, read_csv_header
+from pages.base_page import BasePage
+
+NOT_IN_FILE = "(not in file)"
+NO_DEFAULT = "(none)"
+
+FIELD_LABELS = {
+    'user_id': 'User',
+    'category_id': 'Category',
+    'name': 'Name',
+    'description': 'Description',
+    'amount': 'Amount',
+    'date': 'Date',
+    'is_recurring': 'Is Recurring',
+}
+
+# Header names picked automatically for a field when a CSV file is chosen.
+COLUMN_GUESSES = {
+    'user_id': ('user', 'user_id', 'usuario'),
+    'category_id': ('category', 'category_id', 'categoria'),
+    'name': ('name', 'payee', 'title', 'nome'),
+    'description': ('description', 'memo', 'details', 'descricao'),
+    'amount': ('amount', 'value', 'valor'),
+    'date': ('date', 'posted', 'data'),
+    'is_recurring': ('is_recurring', 'recurring'),
+}
+
+
+class TransactionImportPage(BasePage):
+    def __init__(self, parent, controller=None, *args, **kwargs):
+        super().__init__(parent, controller, *args, **kwargs)
+        self.users_cache = {}
+        self.categories_cache = {}
+        self.file_path = None
+        self._import_stop = None
+
+    def _setup_ui(self):
+        self.grid_rowconfigure(0, weight=0)
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(2, weight=0)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=0)
+        self.grid_columnconfigure(2, weight=1)
+
+        if self.controller:
+            back_button = ttk.Button(self, text="< Back to Transactions", command=self._back_to_transactions)
+            back_button.grid(row=0, column=0, padx=10, pady=10, sticky="nw")
+
+        title_label = tk.Label(self, text="Import Statement", font=("Arial", 20, "bold"), pady=10)
+        title_label.grid(row=0, column=0, columnspan=3, pady=10, sticky="n")
+
+        form = tk.Frame(self, bg=self.cget('bg'))
+        form.grid(row=1, column=1, padx=20, pady=20, sticky="n")
+
+        ttk.Button(form, text="Choose File...", command=self._choose_file).grid(row=0, column=0, pady=(0, 10),
+                                                                                 sticky="w")
+        self.file_label = ttk.Label(form, text="CSV or OFX statement")
+        self.file_label.grid(row=0, column=1, padx=(10, 0), pady=(0, 10), sticky="w")
+
+        ttk.Label(form, text="Columns", font=("Arial", 11, "bold")).grid(row=1, column=0, columnspan=2,
+                                                                          pady=(0, 5), sticky="w")
+        self.column_dropdowns = {}
+        for row, field in enumerate(IMPORT_FIELDS, start=2):
+            ttk.Label(form, text=FIELD_LABELS[field]).grid(row=row, column=0, pady=2, sticky="w")
+            dropdown = ttk.Combobox(form, state="disabled", values=[NOT_IN_FILE], width=30)
+            dropdown.set(NOT_IN_FILE)
+            dropdown.grid(row=row, column=1, padx=(10, 0), pady=2, sticky="w")
+            self.column_dropdowns[field] = dropdown
+
+        defaults_row = len(IMPORT_FIELDS) + 2
+        ttk.Label(form, text="Used when a row has no user or category", font=("Arial", 11, "bold")).grid(
+            row=defaults_row, column=0, columnspan=2, pady=(15, 5), sticky="w")
+        ttk.Label(form, text="Default User").grid(row=defaults_row + 1, column=0, pady=2, sticky="w")
+        self.default_user_dropdown = IdDropdownComponent(form, width=30)
+        self.default_user_dropdown.grid(row=defaults_row + 1, column=1, padx=(10, 0), pady=2, sticky="w")
+        ttk.Label(form, text="Default Category").grid(row=defaults_row + 2, column=0, pady=2, sticky="w")
+        self.default_category_dropdown = IdDropdownComponent(form, width=30)
+        self.default_category_dropdown.grid(row=defaults_row + 2, column=1, padx=(10, 0), pady=2, sticky="w")
+
+        self.import_button = ttk.Button(form, text="Import", command=self._start_import, state="disabled")
+        self.import_button.grid(row=defaults_row + 3, column=1, pady=(15, 0), sticky="e")
+
+        self.import_progress = ProgressComponent(self, on_cancel_callback=self._cancel_import, bg=self.cget('bg'))
+        self.import_progress.grid(row=2, column=0, columnspan=3, padx=10, pady=(0, 10), sticky="w")
+        self.import_progress.grid_remove()
+
+    def refresh(self, **kwargs):
+        self.run_in_background(self._fetch_all_users_and_categories, self._show_defaults)
+
+    def _fetch_all_users_and_categories(self):
+        try:
+            self.users_cache = reference_store.get_index("users")
+            self.categories_cache = reference_store.get_index("categories")
+        except Exception as e:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning", f"Could not load all users or categories: {e}")
+
+    def _show_defaults(self, _result=None):
+        user_options = {NO_DEFAULT: ''}
+        user_options.update({
+            user.get('first_name'): str(user.get('id'))
+            for user in self.users_cache.values()
+            if user and user.get('id') and user.get('first_name')
+        })
+
+        category_options = {NO_DEFAULT: ''}
+        category_options.update({
+            category.get('name'): str(category.get('id'))
+            for category in self.categories_cache.values()
+            if category and category.get('id') and category.get('name')
+        })
+
+        selected_user = self.default_user_dropdown.get_selected_id()
+        selected_category = self.default_category_dropdown.get_selected_id()
+        self.default_user_dropdown.set_options(user_options)
+        self.default_category_dropdown.set_options(category_options)
+        self.default_user_dropdown.set_selected_id(selected_user or '')
+        self.default_category_dropdown.set_selected_id(selected_category or '')
+
+        if self.controller:
+            self.controller.title("Import Statement")
+
+    def _is_ofx(self):
+        return bool(self.file_path) and os.path.splitext(self.file_path)[1].lower() in (".ofx", ".qfx")
+
+    def _choose_file(self):
+        path = filedialog.askopenfilename(
+            title="Choose a statement",
+            filetypes=[("Statements", "*.csv *.ofx *.qfx"), ("CSV", "*.csv"), ("OFX", "*.ofx *.qfx"),
+                       ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        self.file_path = path
+        self.file_label.config(text=os.path.basename(path))
+        self.import_button.config(state="normal")
+
+        if self._is_ofx():
+            # OFX has fixed fields; user and category come from the defaults.
+            for dropdown in self.column_dropdowns.values():
+                dropdown.config(state="disabled", values=[NOT_IN_FILE])
+                dropdown.set(NOT_IN_FILE)
+            return
+
+        try:
+            header = read_csv_header(path)
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Could not read the file: {e}")
+            return
+
+        for field, dropdown in self.column_dropdowns.items():
+            dropdown.config(state="readonly", values=[NOT_IN_FILE] + header)
+            guesses = COLUMN_GUESSES[field]
+            dropdown.set(next((column for column in header if column.strip().casefold() in guesses), NOT_IN_FILE))
+
+    def _start_import(self):
+        if not self.file_path or "import" in self._background_tasks:
+            return
+
+        importer = StatementImporter(default_user_id=self.default_user_dropdown.get_selected_id() or None,
+                                     default_category_id=self.default_category_dropdown.get_selected_id() or None)
+        path = self.file_path
+        if self._is_ofx():
+            def rows():
+                return iter_ofx_rows(path)
+        else:
+            column_map = {field: dropdown.get() for field, dropdown in self.column_dropdowns.items()
+                          if dropdown.get() != NOT_IN_FILE}
+            if 'amount' not in column_map or 'date' not in column_map:
+                messagebox.showerror("Validation Error", "Please choose the Amount and Date columns.")
+                return
+
+            def rows():
+                return iter_csv_rows(path, column_map)
+
+        stop = threading.Event()
+
+        def produce():
+            importer.load_indexes()
+            yield from importer.run(rows(), stop)
+
+        self._import_stop = stop
+        self.import_button.config(state="disabled")
+        self.show_progress("import", self.import_progress, None, "Importing")
+
+        stats = {}
+
+        def progress(current):
+            stats.update(current)
+            self.import_progress.set_status(
+                f"{current['read']} rows read, {current['created']} created, "
+                f"{current['duplicates']} duplicates, {current['failed']} failed")
+
+        # Keeps running when the page is hidden; the summary is shown whenever it ends.
+        self.stream_in_background(produce, progress, lambda _result: self._on_import_done(stats),
+                                  self._on_import_failed, key="import", keep_on_hide=True)
+
+    def _finish_import(self):
+        self._import_stop = None
+        self.hide_progress("import")
+        self.import_button.config(state="normal" if self.file_path else "disabled")
+
+    def _on_import_done(self, stats):
+        self._finish_import()
+
+        summary = (f"Rows read: {stats.get('read', 0)}\nCreated: {stats.get('created', 0)}\n"
+                   f"Skipped as duplicates: {stats.get('duplicates', 0)}\nFailed: {stats.get('failed', 0)}")
+        if stats.get("repeated"):
+            summary += f"\nRepeated within the file (created): {stats['repeated']}"
+        if stats.get("not_sent"):
+            summary += f"\nNot sent (cancelled): {stats['not_sent']}"
+        errors = stats.get("errors") or []
+        if errors:
+            summary += "\n\n" + "\n".join(f"Line {line}: {error}" for line, error in errors[:10])
+            if stats["failed"] > 10:
+                summary += f"\n... and {stats['failed'] - 10} more"
+
+        title = "Import Cancelled" if stats.get("cancelled") else "Import Finished"
+        if errors or stats.get("cancelled"):
+            messagebox.showwarning(title, summary)
+        else:
+            messagebox.showinfo(title, summary)
+
+    def _on_import_failed(self, e):
+        self._finish_import()
+        messagebox.showerror("Import Error", f"Failed to import the statement: {e}")
+
+    def _cancel_import(self):
+        # The rows in flight finish first; created rows stay and are skipped as duplicates on a re-import.
+        if self._import_stop is not None:
+            self._import_stop.set()
+            self.import_progress.set_stopping()
+
+    def _back_to_transactions(self):
+        self.controller.show_page("TransactionPage")
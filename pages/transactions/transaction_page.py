@@ -1,13 +1,21 @@
+import itertools
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 from uuid import UUID
 
 from components.list_box_component import ListBoxComponent
+from components.progress_component import ProgressComponent
 from core.transactions_endpoints import transaction_api_client
-from core.categories_endpoints import category_api_client
-from core.users_endpoints import user_api_client
+from core.fan_out import fan_out
+from core.local_store import local_store
+from core.models import TransactionRecord
+from core.reference_store import reference_store
+from core.sync_engine import sync_engine
 from pages.base_page import BasePage
 
+TRANSACTIONS_REFRESH_SECONDS = float(os.getenv("TRANSACTIONS_REFRESH_SECONDS", "0"))
+
 
 class TransactionPage(BasePage):
     def __init__(self, parent, controller=None, *args, **kwargs):
@@ -15,6 +23,11 @@ class TransactionPage(BasePage):
         self.Transaction_data = []
         self.users_cache = {}
         self.categories_cache = {}
+        self._streamed_transactions = None
+        self._streamed_rows = None
+        self._showing_saved_data = False
+        self._refresh_job = None
+        self._loaded = False
 
     def _setup_ui(self):
         self.grid_rowconfigure(0, weight=0)
@@ -46,6 +59,17 @@ class TransactionPage(BasePage):
                                             command=lambda: self.controller.show_page("TransactionCreatePage"))
         create_transaction_button.pack(side="left")
 
+        bulk_entry_button = ttk.Button(button_frame, text="Bulk Entry",
+                                       command=lambda: self.controller.show_page("TransactionBulkCreatePage"))
+        bulk_entry_button.pack(side="left", padx=(20, 0))
+
+        import_button = ttk.Button(button_frame, text="Import Statement",
+                                   command=lambda: self.controller.show_page("TransactionImportPage"))
+        import_button.pack(side="left", padx=(20, 0))
+
+        export_button = ttk.Button(button_frame, text="Export", command=self._export_transactions)
+        export_button.pack(side="left", padx=(20, 0))
+
         self.columns = ["id", "user_name", "category_name", "name", "amount", "date", "is_recurring"]
 
         self.display_headings = {
@@ -59,56 +83,163 @@ class TransactionPage(BasePage):
         }
 
         self.transaction_list_component = ListBoxComponent(self, columns=self.columns,
-                                                             display_headings=self.display_headings)
+                                                             display_headings=self.display_headings,
+                                                             virtual=True)
         self.transaction_list_component.grid(row=1, column=0, columnspan=2, padx=10, pady=10,
                                                sticky="nsew")
         self.transaction_list_component.on_select(self._on_transaction_selected)
 
-        self._load_transactions()
+        self.export_progress = ProgressComponent(self, on_cancel_callback=self.cancel_export, bg=self.cget('bg'))
+        self.export_progress.grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.export_progress.grid_remove()
 
-    def _fetch_all_users_and_categories(self):
-        try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
+    def _fetch_all_users_and_categories(self, **other_calls):
+        results = fan_out({
+            "users": lambda: reference_store.get_index("users"),
+            "categories": lambda: reference_store.get_index("categories"),
+            **other_calls
+        }, return_exceptions=True)
 
-            categories = category_api_client.get_all_categories()
-            self.categories_cache = {str(category["id"]): category for category in categories if category and "id" in category}
-        except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or categories: {e}")
+        users, categories = results.pop("users"), results.pop("categories")
+        error = next((value for value in (users, categories) if isinstance(value, Exception)), None)
+        if error is not None:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or categories: {error}")
+        else:
+            self.users_cache = users
+            self.categories_cache = categories
+        return results
 
 
     def _load_transactions(self):
-        try:
-            self._fetch_all_users_and_categories()
-            transations_raw_data = transaction_api_client.get_all_transactions()
+        self._cancel_scheduled_refresh()
+        self._loaded = False
+        self._streamed_transactions = None
+        self._streamed_rows = None
+        self._showing_saved_data = False
+        self.stream_in_background(self._fetch_transaction_pages, self._show_transactions_page,
+                                  self._on_transactions_loaded, self._on_transactions_load_failed)
+
+    def _fetch_transaction_pages(self):
+        if local_store.enabled and local_store.has_synced("transactions"):
+            yield self._fetch_saved_transactions()
+
+        if sync_engine.has_baseline("transactions"):
+            yield self._fetch_transaction_changes()
+            return
+
+        transaction_pages = transaction_api_client.iter_transaction_pages(as_records=True)
+        first_page = self._fetch_all_users_and_categories(
+            transactions=lambda: next(transaction_pages, None))["transactions"]
+        if isinstance(first_page, Exception):
+            raise first_page
+        if first_page is None:
+            return
+
+        loaded = []
+        for transations_raw_data in itertools.chain([first_page], transaction_pages):
+            loaded.extend(transations_raw_data)
+            yield transations_raw_data, [self._build_transaction_row(t) for t in transations_raw_data], False
+        sync_engine.seed("transactions", loaded)
+
+    def _fetch_transaction_changes(self):
+        # After the first full load only the records changed since then are fetched and merged.
+        changed = self._fetch_all_users_and_categories(
+            transactions=lambda: sync_engine.sync("transactions"))["transactions"]
+        if isinstance(changed, Exception):
+            raise changed
+        transactions = sync_engine.get_all("transactions")
+        return transactions, [self._build_transaction_row(t) for t in transactions], False
+
+    def _fetch_saved_transactions(self):
+        # Warm start from the local mirror; the network pages then replace it in one diff.
+        if not self.users_cache:
+            self.users_cache = local_store.get_index("users")
+        if not self.categories_cache:
+            self.categories_cache = local_store.get_index("categories")
+        saved = [TransactionRecord.from_dict(t) for t in local_store.get_all("transactions")]
+        return saved, [self._build_transaction_row(t) for t in saved], True
+
+    def _build_transaction_row(self, Transaction):
+        user_id = Transaction.get("user_id")
+        category_id = Transaction.get("category_id")
+
+        category_name = self.categories_cache.get(str(category_id), {}).get("name", "Unknown Category")
+        user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
+
+        row_values = []
+        for col in self.columns:
+            if col == "user_name":
+                row_values.append(user_name)
+            elif col == "category_name":
+                row_values.append(category_name)
+            else:
+                value = Transaction.get(col, '')
+                if isinstance(value, UUID):
+                    row_values.append(str(value))
+                else:
+                    row_values.append(value)
+        return tuple(row_values)
+
+    def _iter_transaction_export_pages(self):
+        self._fetch_all_users_and_categories()
+        return transaction_api_client.iter_transaction_pages(as_records=True)
+
+    def _export_transactions(self):
+        self.export_list(self._iter_transaction_export_pages, self._build_transaction_row, self.columns,
+                         self.display_headings, self.export_progress, "Transactions")
+
+    def _show_transactions_page(self, result):
+        transations_raw_data, items_for_list, saved = result
+        if saved:
+            self._showing_saved_data = True
             self.Transaction_data = transations_raw_data
-            
-            items_for_list = []
-
-            for Transaction in transations_raw_data:
-                user_id = Transaction.get("user_id")
-                category_id = Transaction.get("category_id")
-
-                category_name = self.categories_cache.get(str(category_id), {}).get("name", "Unknown Category")
-                user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
-
-                row_values = []
-                for col in self.columns:
-                    if col == "user_name":
-                        row_values.append(user_name)
-                    elif col == "category_name":
-                        row_values.append(category_name)
-                    else:
-                        value = Transaction.get(col, '')
-                        if isinstance(value, UUID):
-                            row_values.append(str(value))
-                        else:
-                            row_values.append(value)
-                items_for_list.append(tuple(row_values))
             self.transaction_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Transactions: {e}")
-            self.transaction_list_component.clear_list()
+            return
+
+        if self._streamed_transactions is None:
+            self._streamed_transactions = list(transations_raw_data)
+            if self._showing_saved_data:
+                self._streamed_rows = list(items_for_list)
+            else:
+                self.transaction_list_component.set_items(items_for_list)
+        else:
+            self._streamed_transactions.extend(transations_raw_data)
+            if self._showing_saved_data:
+                self._streamed_rows.extend(items_for_list)
+            else:
+                self.transaction_list_component.append_items(items_for_list)
+
+        if not self._showing_saved_data:
+            self.Transaction_data = self._streamed_transactions
+
+    def _on_transactions_loaded(self, _result=None):
+        self._loaded = True
+        if self._showing_saved_data:
+            self.Transaction_data = self._streamed_transactions or []
+            self.transaction_list_component.set_items(self._streamed_rows or [])
+            self._streamed_rows = None
+            self._showing_saved_data = False
+        elif self._streamed_transactions is None:
+            self.Transaction_data = []
+            self.transaction_list_component.set_items([])
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        self._cancel_scheduled_refresh()
+        if TRANSACTIONS_REFRESH_SECONDS > 0:
+            self._refresh_job = self.after(int(TRANSACTIONS_REFRESH_SECONDS * 1000), self._load_transactions)
+
+    def _cancel_scheduled_refresh(self):
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+
+    def _on_transactions_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Transactions: {e}")
+        if self._showing_saved_data:
+            return
+        self.transaction_list_component.clear_list()
 
     def _on_transaction_selected(self, selected_values):
         if selected_values:
@@ -120,5 +251,106 @@ class TransactionPage(BasePage):
         else:
             pass
 
-    def refresh(self):
-        self._load_transactions()
+    def _find_transaction(self, key):
+        # Transaction_data and the list rows are kept in the same order, so the list's id index is
+        # also the position in Transaction_data.
+        index = self.transaction_list_component.index_of(key)
+        if index is None or index >= len(self.Transaction_data):
+            return None
+        return index if str(self.Transaction_data[index].get("id")) == key else None
+
+    def _replace_transaction(self, key, transaction):
+        # Swaps one record and its row in place; returns the previous record for a rollback.
+        index = self._find_transaction(key) if transaction is not None else None
+        if index is None:
+            return None
+        previous = self.Transaction_data[index]
+        self.Transaction_data[index] = transaction
+        self.transaction_list_component.update_item(self._build_transaction_row(transaction))
+        return previous
+
+    def _remove_transaction(self, key):
+        index = self._find_transaction(key)
+        if index is None:
+            return None
+        transaction = self.Transaction_data.pop(index)
+        self.transaction_list_component.remove_item(key)
+        return index, transaction
+
+    def _reinsert_transaction(self, removed):
+        if removed is None:
+            return
+        index, transaction = removed
+        self.Transaction_data.insert(index, transaction)
+        self.transaction_list_component.insert_item(self._build_transaction_row(transaction), index)
+
+    @staticmethod
+    def _to_record(transaction):
+        if isinstance(transaction, TransactionRecord) or not isinstance(transaction, dict):
+            return transaction
+        return TransactionRecord.from_dict(transaction) if transaction.get("id") is not None else None
+
+    def _apply_update(self, transaction_id, changes, if_match=None):
+        key = str(transaction_id)
+
+        def patch():
+            index = self._find_transaction(key)
+            if index is None:
+                return None
+            current = self.Transaction_data[index]
+            current = current.to_dict() if isinstance(current, TransactionRecord) else dict(current)
+            return self._replace_transaction(key, TransactionRecord.from_dict({**current, **changes}))
+
+        self.run_optimistic(
+            patch, lambda previous: self._replace_transaction(key, previous),
+            lambda: transaction_api_client.update_transaction(transaction_id, changes, if_match=if_match),
+            on_success=lambda response: self._after_mutation(
+                lambda: self._replace_transaction(key, self._to_record(response))),
+            on_error=lambda e: self._on_mutation_failed("Failed to update Transaction", e),
+            key=f"update:{key}"
+        )
+
+    def _apply_delete(self, transaction_id):
+        key = str(transaction_id)
+        self.run_optimistic(
+            lambda: self._remove_transaction(key), self._reinsert_transaction,
+            lambda: transaction_api_client.delete_transaction(transaction_id),
+            on_success=lambda _response: self._after_mutation(),
+            on_error=lambda e: self._on_mutation_failed("Failed to delete Transaction", e),
+            key=f"delete:{key}"
+        )
+
+    def _apply_create(self, transaction):
+        transaction = self._to_record(transaction)
+        if transaction is None or self._find_transaction(str(transaction.get("id"))) is not None:
+            return
+        self.Transaction_data.append(transaction)
+        self.transaction_list_component.add_item(self._build_transaction_row(transaction))
+
+    def _after_mutation(self, reconcile=None):
+        # With nothing loaded yet there is no row to patch; load the list instead.
+        if not self._loaded:
+            self._load_transactions()
+        elif reconcile:
+            reconcile()
+
+    def _on_mutation_failed(self, message, e):
+        messagebox.showerror("API Error", f"{message}: {e}")
+        self._after_mutation()
+
+    def hide(self):
+        self._cancel_scheduled_refresh()
+        super().hide()
+
+    def refresh(self, updated=None, deleted=None, created=None):
+        # Coming back from a detail page with a change patches the list instead of reloading it.
+        if updated is not None:
+            self._apply_update(*updated)
+        elif deleted is not None:
+            self._apply_delete(deleted)
+        elif created is not None and self._loaded:
+            # The bulk-entry page hands back every transaction it created.
+            for transaction in (created if isinstance(created, list) else [created]):
+                self._apply_create(transaction)
+        else:
+            self._load_transactions()
@@ -1,12 +1,15 @@
+import itertools
 import tkinter as tk
 from tkinter import ttk, messagebox
 from uuid import UUID
 from typing import Optional
 
 from components.list_box_component import ListBoxComponent
+from components.progress_component import ProgressComponent
 from core.transactions_endpoints import transaction_api_client
-from core.categories_endpoints import category_api_client
-from core.users_endpoints import user_api_client
+from core.fan_out import fan_out
+from core.reference_store import reference_store
+from core.sync_engine import sync_engine
 from pages.base_page import BasePage
 
 
@@ -16,7 +19,9 @@ class TransactionTrashbinPage(BasePage):
         self.Transaction_data = []
         self.users_cache = {}
         self.categories_cache = {}
+        self._streamed_transactions = None
         self.selected_transaction_id: Optional[UUID] = None
+        self.selected_transaction_ids = []
 
     def _setup_ui(self):
         self.grid_rowconfigure(0, weight=0)
@@ -59,6 +64,10 @@ class TransactionTrashbinPage(BasePage):
         )
         self.force_delete_button.pack(side="left")
 
+        self.bulk_progress = ProgressComponent(self, on_cancel_callback=self.cancel_bulk_action, bg=self.cget('bg'))
+        self.bulk_progress.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.bulk_progress.grid_remove()
+
         self.columns = ["id", "user_name", "category_name", "name", "amount", "date", "is_recurring"]
         self.display_headings = {
             "id": "ID",
@@ -73,7 +82,9 @@ class TransactionTrashbinPage(BasePage):
         self.transaction_list_component = ListBoxComponent(
             self,
             columns=self.columns,
-            display_headings=self.display_headings
+            display_headings=self.display_headings,
+            virtual=True,
+            multi_select=True
         )
         self.transaction_list_component.grid(
             row=2,
@@ -84,12 +95,13 @@ class TransactionTrashbinPage(BasePage):
             sticky="nsew"
         )
         self.transaction_list_component.on_select(self._on_transaction_selected)
-        self._load_transactions()
 
     def _on_transaction_selected(self, selected_values):
         if selected_values:
             try:
                 self.selected_transaction_id = UUID(selected_values[0])
+                selected_items = self.transaction_list_component.get_selected_items()
+                self.selected_transaction_ids = [UUID(values[0]) for values in selected_items]
                 self.restore_button.config(state="normal")
                 self.force_delete_button.config(state="normal")
             except ValueError:
@@ -99,10 +111,15 @@ class TransactionTrashbinPage(BasePage):
 
     def _clear_selection(self):
         self.selected_transaction_id = None
+        self.selected_transaction_ids = []
         self.restore_button.config(state="disabled")
         self.force_delete_button.config(state="disabled")
 
     def _restore_selected_transaction(self):
+        if len(self.selected_transaction_ids) > 1:
+            self._run_bulk_transaction_action(transaction_api_client.restore_transaction, "restore")
+            return
+
         if not self.selected_transaction_id:
             return
 
@@ -110,16 +127,17 @@ class TransactionTrashbinPage(BasePage):
                 "Confirm Restore",
                 f"Are you sure you want to restore transaction ID {self.selected_transaction_id}?"
         ):
-            try:
-                transaction_api_client.restore_transaction(self.selected_transaction_id)
-                messagebox.showinfo("Success", "Transaction restored successfully!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to restore transaction: {e}")
-            finally:
-                self._clear_selection()
+            transaction_id = self.selected_transaction_id
+            self._clear_selection()
+            self._remove_transaction_row(transaction_id,
+                                         lambda: transaction_api_client.restore_transaction(transaction_id),
+                                         "Failed to restore transaction")
 
     def _force_delete_selected_transaction(self):
+        if len(self.selected_transaction_ids) > 1:
+            self._run_bulk_transaction_action(transaction_api_client.force_delete_transaction, "permanently delete")
+            return
+
         if not self.selected_transaction_id:
             return
 
@@ -128,56 +146,119 @@ class TransactionTrashbinPage(BasePage):
                 f"Are you sure you want to PERMANENTLY delete transaction ID {self.selected_transaction_id}?\n"
                 "This action cannot be undone!"
         ):
-            try:
-                transaction_api_client.force_delete_transaction(self.selected_transaction_id)
-                messagebox.showinfo("Success", "Transaction permanently deleted!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete transaction: {e}")
-            finally:
-                self._clear_selection()
+            transaction_id = self.selected_transaction_id
+            self._clear_selection()
+            self._remove_transaction_row(transaction_id,
+                                         lambda: transaction_api_client.force_delete_transaction(transaction_id),
+                                         "Failed to delete transaction")
+
+    def _remove_transaction_row(self, transaction_id, mutation, error_message):
+        # The row leaves the trash bin straight away and is put back if the call fails.
+        self.run_optimistic(
+            lambda: self.transaction_list_component.remove_item(str(transaction_id)),
+            self.transaction_list_component.restore_item,
+            mutation,
+            on_error=lambda e: messagebox.showerror("API Error", f"{error_message}: {e}"),
+            key=f"mutation:{transaction_id}"
+        )
+
+    def _run_bulk_transaction_action(self, action, verb):
+        transaction_ids = list(self.selected_transaction_ids)
+        warning = "\nThis action cannot be undone!" if verb == "permanently delete" else ""
+        if messagebox.askyesno(f"Confirm {verb.title()}",
+                               f"Are you sure you want to {verb} {len(transaction_ids)} transactions?{warning}"):
+            self._clear_selection()
+            progress_text = "Restoring transactions" if verb == "restore" else "Deleting transactions"
+            self.run_bulk_action(transaction_ids, action, self.transaction_list_component, self.bulk_progress,
+                                 progress_text, f"Could not {verb}")
 
-    def _fetch_all_users_and_categories(self):
-        try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
+    def _fetch_all_users_and_categories(self, **other_calls):
+        results = fan_out({
+            "users": lambda: reference_store.get_index("users"),
+            "categories": lambda: reference_store.get_index("categories"),
+            **other_calls
+        }, return_exceptions=True)
 
-            categories = category_api_client.get_all_categories()
-            self.categories_cache = {str(category["id"]): category for category in categories if
-                                     category and "id" in category}
-        except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or categories: {e}")
+        users, categories = results.pop("users"), results.pop("categories")
+        error = next((value for value in (users, categories) if isinstance(value, Exception)), None)
+        if error is not None:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or categories: {error}")
+        else:
+            self.users_cache = users
+            self.categories_cache = categories
+        return results
 
     def _load_transactions(self):
-        try:
-            self._fetch_all_users_and_categories()
-            transactions_raw_data = transaction_api_client.get_deleted_transactions()
-            self.Transaction_data = transactions_raw_data
-
-            items_for_list = []
-            for transaction in transactions_raw_data:
-                user_id = transaction.get("user_id")
-                category_id = transaction.get("category_id")
-
-                category_name = self.categories_cache.get(str(category_id), {}).get("name", "Unknown Category")
-                user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
-
-                row_values = []
-                for col in self.columns:
-                    if col == "user_name":
-                        row_values.append(user_name)
-                    elif col == "category_name":
-                        row_values.append(category_name)
-                    else:
-                        value = transaction.get(col, '')
-                        row_values.append(str(value) if isinstance(value, UUID) else value)
-                items_for_list.append(tuple(row_values))
+        self._streamed_transactions = None
+        self.stream_in_background(self._fetch_transaction_pages, self._show_transactions_page,
+                                  self._on_transactions_loaded, self._on_transactions_load_failed)
+
+    def _fetch_transaction_pages(self):
+        if sync_engine.has_baseline("transactions", deleted=True):
+            yield self._fetch_transaction_changes()
+            return
+
+        transaction_pages = transaction_api_client.iter_deleted_transaction_pages(as_records=True)
+        first_page = self._fetch_all_users_and_categories(
+            transactions=lambda: next(transaction_pages, None))["transactions"]
+        if isinstance(first_page, Exception):
+            raise first_page
+        if first_page is None:
+            return
+
+        loaded = []
+        for transactions_raw_data in itertools.chain([first_page], transaction_pages):
+            loaded.extend(transactions_raw_data)
+            yield transactions_raw_data, [self._build_transaction_row(t) for t in transactions_raw_data]
+        sync_engine.seed("transactions", loaded, deleted=True)
 
+    def _fetch_transaction_changes(self):
+        changed = self._fetch_all_users_and_categories(
+            transactions=lambda: sync_engine.sync("transactions"))["transactions"]
+        if isinstance(changed, Exception):
+            raise changed
+        transactions = sync_engine.get_all("transactions", deleted=True)
+        return transactions, [self._build_transaction_row(t) for t in transactions]
+
+    def _build_transaction_row(self, transaction):
+        user_id = transaction.get("user_id")
+        category_id = transaction.get("category_id")
+
+        category_name = self.categories_cache.get(str(category_id), {}).get("name", "Unknown Category")
+        user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
+
+        row_values = []
+        for col in self.columns:
+            if col == "user_name":
+                row_values.append(user_name)
+            elif col == "category_name":
+                row_values.append(category_name)
+            else:
+                value = transaction.get(col, '')
+                row_values.append(str(value) if isinstance(value, UUID) else value)
+        return tuple(row_values)
+
+    def _show_transactions_page(self, result):
+        transactions_raw_data, items_for_list = result
+        if self._streamed_transactions is None:
+            self._streamed_transactions = list(transactions_raw_data)
             self.transaction_list_component.set_items(items_for_list)
+        else:
+            self._streamed_transactions.extend(transactions_raw_data)
+            self.transaction_list_component.append_items(items_for_list)
+        self.Transaction_data = self._streamed_transactions
+        self._on_transaction_selected(self.transaction_list_component.get_selected_item())
+
+    def _on_transactions_loaded(self, _result=None):
+        if self._streamed_transactions is None:
+            self.Transaction_data = []
+            self.transaction_list_component.set_items([])
             self._clear_selection()
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load Transactions: {e}")
-            self.transaction_list_component.clear_list()
+
+    def _on_transactions_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load Transactions: {e}")
+        self.transaction_list_component.clear_list()
 
     def refresh(self):
         self._load_transactions()
\ No newline at end of file
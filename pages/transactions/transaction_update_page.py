@@ -3,8 +3,8 @@ from uuid import UUID
 
 from components.detail_form_component import DetailFormComponent
 from core.transactions_endpoints import transaction_api_client
-from core.categories_endpoints import category_api_client
-from core.users_endpoints import user_api_client
+from core.fan_out import fan_out
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -12,6 +12,8 @@ class TransactionUpdatePage(BasePage):
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
         self.current_transaction_id = None
+        self._loaded_transaction = None
+        self._loaded_etag = None
         self.users_cache = {}
         self.categories_cache = {}
         self.detail_form = None
@@ -54,9 +56,28 @@ class TransactionUpdatePage(BasePage):
 
         try:
             self.current_transaction_id = UUID(str(transaction_id))
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid ID format or data conversion error: {e}")
+            self._reset_form_and_navigate_back()
+            return
 
-            self._fetch_all_users_and_categories()
-
+        current_id = self.current_transaction_id
+        self.run_in_background(lambda: self._fetch_transaction(current_id), self._show_transaction,
+                               self._on_transaction_load_failed)
+
+    def _fetch_transaction(self, transaction_id):
+        transaction = self._fetch_all_users_and_categories(
+            transaction=lambda: transaction_api_client.get_transaction_by_id(transaction_id, as_records=True)
+        )["transaction"]
+        if isinstance(transaction, Exception):
+            raise transaction
+        return transaction
+
+    def _show_transaction(self, transaction_data):
+        # Kept to diff the form against on save; the ETag guards against saving over a newer version.
+        self._loaded_transaction = transaction_data
+        self._loaded_etag = transaction_api_client.get_transaction_etag(self.current_transaction_id)
+        try:
             user_options = {
                 user.get('first_name'): str(user.get('id'))
                 for user in self.users_cache.values()
@@ -77,8 +98,6 @@ class TransactionUpdatePage(BasePage):
                 elif field['key'] == 'is_recurring':
                     field['options'] = ['True', 'False']
 
-            transaction_data = transaction_api_client.get_transaction_by_id(self.current_transaction_id)
-
             if self.detail_form:
                 self.detail_form.destroy()
 
@@ -116,33 +135,42 @@ class TransactionUpdatePage(BasePage):
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid ID format or data conversion error: {e}")
             self._reset_form_and_navigate_back()
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load category details or users: {e}")
-            self._reset_form_and_navigate_back()
 
-    def _fetch_all_users_and_categories(self):
-        try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            categories = category_api_client.get_all_categories()
-            self.categories_cache = {str(category["id"]): category for category in categories if
-                                     category and "id" in category}
-        except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or Transaction Types: {e}")
+    def _on_transaction_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load category details or users: {e}")
+        self._reset_form_and_navigate_back()
+
+    def _fetch_all_users_and_categories(self, **other_calls):
+        results = fan_out({
+            "users": lambda: reference_store.get_index("users"),
+            "categories": lambda: reference_store.get_index("categories"),
+            **other_calls
+        }, return_exceptions=True)
+
+        users, categories = results.pop("users"), results.pop("categories")
+        error = next((value for value in (users, categories) if isinstance(value, Exception)), None)
+        if error is not None:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or Transaction Types: {error}")
+        else:
+            self.users_cache = users
+            self.categories_cache = categories
+        return results
 
     def _reset_form_and_navigate_back(self):
         self.detail_form.set_data({})
         self.current_transaction_id = None
+        self._loaded_transaction = None
+        self._loaded_etag = None
         self.controller.show_page("TransactionPage")
 
     def _update_transaction(self):
-        if not self.current_transaction_id:
+        if not self.current_transaction_id or self._loaded_transaction is None:
             messagebox.showerror("Error", "No category selected for update.")
             return
 
         try:
-            current_data = transaction_api_client.get_transaction_by_id(self.current_transaction_id)
+            current_data = self._loaded_transaction
 
             form_data = self.detail_form.get_data()
 
@@ -173,7 +201,7 @@ class TransactionUpdatePage(BasePage):
                 if field == 'amount':
                     try:
                         form_value_float = float(form_value)
-                        if form_value_float != current_value:
+                        if current_value is None or form_value_float != float(current_value):
                             modified_fields[field] = form_value_float
                     except ValueError:
                         messagebox.showerror("Amount Error", "Amount value must be numeric.")
@@ -195,13 +223,9 @@ class TransactionUpdatePage(BasePage):
                 messagebox.showinfo("Info", "There are no fields to update.")
                 return
 
-            response = transaction_api_client.update_transaction(self.current_transaction_id, modified_fields)
-
-            if response:
-                messagebox.showinfo("Success", "Transaction updated successfully!")
-                self.controller.show_page("TransactionPage")
-            else:
-                messagebox.showerror("Error", "Received unexpected response from server")
+            # The list page shows the change right away and sends it in the background.
+            self.controller.show_page("TransactionPage",
+                                      updated=(self.current_transaction_id, modified_fields, self._loaded_etag))
 
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid ID format: {e}")
@@ -221,9 +245,4 @@ class TransactionUpdatePage(BasePage):
                 "Confirm Delete",
                 f"Are you sure you want to delete category ID {self.current_transaction_id}?"
         ):
-            try:
-                transaction_api_client.delete_transaction(self.current_transaction_id)
-                messagebox.showinfo("Success", "Transaction deleted successfully (soft delete)!")
-                self.controller.show_page("TransactionPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete Transaction: {e}")
\ No newline at end of file
+            self.controller.show_page("TransactionPage", deleted=self.current_transaction_id)
\ No newline at end of file
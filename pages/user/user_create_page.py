@@ -67,9 +67,9 @@ class UserCreatePage(BasePage):
             messagebox.showerror("Validation Error", "First Name, CPF, Email, and Password are required.")
             return
 
-        try:
-            user_api_client.create_user(payload)
-            messagebox.showinfo("Success", "User created successfully!")
-            self.controller.show_page("UserPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to create user: {e}")
+        self.submit_in_background(self.detail_form, lambda: user_api_client.create_user(payload),
+                                  self._on_user_created, "Failed to create user")
+
+    def _on_user_created(self, _result):
+        messagebox.showinfo("Success", "User created successfully!")
+        self.return_to("UserPage")
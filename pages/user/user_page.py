@@ -4,7 +4,9 @@ from tkinter import ttk, messagebox
 from uuid import UUID
 
 from components.list_box_component import ListBoxComponent
+from components.progress_component import ProgressComponent
 from core.users_endpoints import user_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -42,6 +44,9 @@ class UserPage(BasePage):
                                         command=lambda: self.controller.show_page("UserCreatePage"))
         create_user_button.pack(side="left")
 
+        export_button = ttk.Button(button_frame, text="Export", command=self._export_users)
+        export_button.pack(side="left", padx=(20, 0))
+
         self.columns = ["id", "first_name", "last_name", "cpf", "email",
                         "manual_balance", "created_at", "updated_at", "deleted_at"]
 
@@ -62,28 +67,41 @@ class UserPage(BasePage):
                                       sticky="nsew")
         self.user_list_component.on_select(self._on_user_selected)
 
-        self._load_users()
+        self.export_progress = ProgressComponent(self, on_cancel_callback=self.cancel_export, bg=self.cget('bg'))
+        self.export_progress.grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.export_progress.grid_remove()
 
     def _load_users(self):
-        try:
-            users_raw_data = user_api_client.get_all_users()
-            self.user_data = users_raw_data
-            items_for_list = []
-            for user in users_raw_data:
-                row_values = []
-                for col in self.columns:
-                    value = user.get(col, '')  # U
-                    if isinstance(value, UUID):
-                        row_values.append(str(value))
-                    elif isinstance(value, datetime):
-                        row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
-                    else:
-                        row_values.append(value)
-                items_for_list.append(tuple(row_values))
-            self.user_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load users: {e}")
-            self.user_list_component.clear_list()
+        self.run_in_background(self._fetch_users, self._show_users, self._on_users_load_failed)
+
+    def _fetch_users(self):
+        users_raw_data = reference_store.get_all("users")
+        items_for_list = [self._build_user_row(user) for user in users_raw_data]
+        return users_raw_data, items_for_list
+
+    def _build_user_row(self, user):
+        row_values = []
+        for col in self.columns:
+            value = user.get(col, '')  # U
+            if isinstance(value, UUID):
+                row_values.append(str(value))
+            elif isinstance(value, datetime):
+                row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
+            else:
+                row_values.append(value)
+        return tuple(row_values)
+
+    def _export_users(self):
+        self.export_list(user_api_client.iter_user_pages, self._build_user_row, self.columns, self.display_headings,
+                         self.export_progress, "Users")
+
+    def _show_users(self, result):
+        self.user_data, items_for_list = result
+        self.user_list_component.set_items(items_for_list)
+
+    def _on_users_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load users: {e}")
+        self.user_list_component.clear_list()
 
     def _on_user_selected(self, selected_values):
         if selected_values:
@@ -5,6 +5,7 @@ from uuid import UUID
 from typing import Optional
 
 from components.list_box_component import ListBoxComponent
+from components.progress_component import ProgressComponent
 from core.users_endpoints import user_api_client
 from pages.base_page import BasePage
 
@@ -14,6 +15,7 @@ class UserTrashBinPage(BasePage):
         super().__init__(parent, controller, *args, **kwargs)
         self.user_data = []
         self.selected_user_id: Optional[UUID] = None
+        self.selected_user_ids = []
 
     def _setup_ui(self):
         self._setup_grid_configuration()
@@ -21,7 +23,6 @@ class UserTrashBinPage(BasePage):
         self._create_title_label()
         self._create_action_buttons()
         self._create_list_component()
-        self._load_users()
 
     def _setup_grid_configuration(self):
         self.grid_rowconfigure(0, weight=0)
@@ -68,6 +69,10 @@ class UserTrashBinPage(BasePage):
         )
         self.force_delete_button.pack(side="left")
 
+        self.bulk_progress = ProgressComponent(self, on_cancel_callback=self.cancel_bulk_action, bg=self.cget('bg'))
+        self.bulk_progress.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="w")
+        self.bulk_progress.grid_remove()
+
     def _create_list_component(self):
         self.columns = [
             "id", "first_name", "last_name", "cpf", "email",
@@ -89,7 +94,8 @@ class UserTrashBinPage(BasePage):
         self.user_list_component = ListBoxComponent(
             self,
             columns=self.columns,
-            display_headings=self.display_headings
+            display_headings=self.display_headings,
+            multi_select=True
         )
         self.user_list_component.grid(
             row=2,
@@ -105,6 +111,8 @@ class UserTrashBinPage(BasePage):
         if selected_values:
             try:
                 self.selected_user_id = UUID(selected_values[0])
+                selected_items = self.user_list_component.get_selected_items()
+                self.selected_user_ids = [UUID(values[0]) for values in selected_items]
                 self.restore_button.config(state="normal")
                 self.force_delete_button.config(state="normal")
             except ValueError:
@@ -114,10 +122,15 @@ class UserTrashBinPage(BasePage):
 
     def _clear_selection(self):
         self.selected_user_id = None
+        self.selected_user_ids = []
         self.restore_button.config(state="disabled")
         self.force_delete_button.config(state="disabled")
 
     def _restore_selected_user(self):
+        if len(self.selected_user_ids) > 1:
+            self._run_bulk_user_action(user_api_client.restore_user, "restore")
+            return
+
         if not self.selected_user_id:
             return
 
@@ -125,16 +138,16 @@ class UserTrashBinPage(BasePage):
                 "Confirm Restore",
                 f"Are you sure you want to restore user ID {self.selected_user_id}?"
         ):
-            try:
-                user_api_client.restore_user(self.selected_user_id)
-                messagebox.showinfo("Success", "User restored successfully!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to restore user: {e}")
-            finally:
-                self._clear_selection()
+            user_id = self.selected_user_id
+            self._clear_selection()
+            self._remove_user_row(user_id, lambda: user_api_client.restore_user(user_id),
+                                  "Failed to restore user")
 
     def _force_delete_selected_user(self):
+        if len(self.selected_user_ids) > 1:
+            self._run_bulk_user_action(user_api_client.force_delete_user, "permanently delete")
+            return
+
         if not self.selected_user_id:
             return
 
@@ -143,40 +156,61 @@ class UserTrashBinPage(BasePage):
                 f"Are you sure you want to PERMANENTLY delete user ID {self.selected_user_id}?\n"
                 "This action cannot be undone!"
         ):
-            try:
-                user_api_client.force_delete_user(self.selected_user_id)
-                messagebox.showinfo("Success", "User permanently deleted!")
-                self.refresh()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete user: {e}")
-            finally:
-                self._clear_selection()
+            user_id = self.selected_user_id
+            self._clear_selection()
+            self._remove_user_row(user_id, lambda: user_api_client.force_delete_user(user_id),
+                                  "Failed to delete user")
+
+    def _remove_user_row(self, user_id, mutation, error_message):
+        # The row leaves the trash bin straight away and is put back if the call fails.
+        self.run_optimistic(
+            lambda: self.user_list_component.remove_item(str(user_id)),
+            self.user_list_component.restore_item,
+            mutation,
+            on_error=lambda e: messagebox.showerror("API Error", f"{error_message}: {e}"),
+            key=f"mutation:{user_id}"
+        )
 
-    def _load_users(self):
-        try:
-            users_raw_data = user_api_client.get_deleted_users()
-            self.user_data = users_raw_data
-
-            items_for_list = []
-            for user in users_raw_data:
-                row_values = []
-                for col in self.columns:
-                    value = user.get(col, '')
-                    if isinstance(value, UUID):
-                        row_values.append(str(value))
-                    elif isinstance(value, datetime):
-                        row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
-                    else:
-                        row_values.append(value)
-
-                items_for_list.append(tuple(row_values))
-
-            self.user_list_component.set_items(items_for_list)
+    def _run_bulk_user_action(self, action, verb):
+        user_ids = list(self.selected_user_ids)
+        warning = "\nThis action cannot be undone!" if verb == "permanently delete" else ""
+        if messagebox.askyesno(f"Confirm {verb.title()}",
+                               f"Are you sure you want to {verb} {len(user_ids)} users?{warning}"):
             self._clear_selection()
+            progress_text = "Restoring users" if verb == "restore" else "Deleting users"
+            self.run_bulk_action(user_ids, action, self.user_list_component, self.bulk_progress,
+                                 progress_text, f"Could not {verb}")
 
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load users: {e}")
-            self.user_list_component.clear_list()
+    def _load_users(self):
+        self.run_in_background(self._fetch_users, self._show_users, self._on_users_load_failed)
+
+    def _fetch_users(self):
+        users_raw_data = user_api_client.get_deleted_users()
+
+        items_for_list = []
+        for user in users_raw_data:
+            row_values = []
+            for col in self.columns:
+                value = user.get(col, '')
+                if isinstance(value, UUID):
+                    row_values.append(str(value))
+                elif isinstance(value, datetime):
+                    row_values.append(value.strftime("%Y-%m-%d %H:%M:%S"))
+                else:
+                    row_values.append(value)
+
+            items_for_list.append(tuple(row_values))
+        return users_raw_data, items_for_list
+
+    def _show_users(self, result):
+        self.user_data, items_for_list = result
+        self.user_list_component.set_items(items_for_list)
+        self._on_user_selected(self.user_list_component.get_selected_item())
+
+
+    def _on_users_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load users: {e}")
+        self.user_list_component.clear_list()
 
     def refresh(self):
         self._load_users()
\ No newline at end of file
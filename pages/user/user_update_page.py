@@ -52,20 +52,27 @@ class UserUpdatePage(BasePage):
         if user_id:
             try:
                 self.current_user_id = UUID(str(user_id))
-                user_data = user_api_client.get_user_by_id(self.current_user_id)
-                self.detail_form.set_data(user_data)
-                if self.controller:
-                    self.controller.title(f"Update User - {user_data.get('first_name', '')}")
             except ValueError:
                 messagebox.showerror("Error", f"Invalid User ID format: {user_id}")
                 self._reset_form_and_navigate_back()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to load user details: {e}")
-                self._reset_form_and_navigate_back()
+                return
+
+            current_id = self.current_user_id
+            self.run_in_background(lambda: user_api_client.get_user_by_id(current_id), self._show_user,
+                                   self._on_user_load_failed)
         else:
             messagebox.showwarning("Warning", "No user selected for update. Returning to list.")
             self._reset_form_and_navigate_back()  # Always expect an ID for update page
 
+    def _show_user(self, user_data):
+        self.detail_form.set_data(user_data)
+        if self.controller:
+            self.controller.title(f"Update User - {user_data.get('first_name', '')}")
+
+    def _on_user_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load user details: {e}")
+        self._reset_form_and_navigate_back()
+
     def _reset_form_and_navigate_back(self):
         self.detail_form.set_data({})
         self.current_user_id = None
@@ -92,12 +99,13 @@ class UserUpdatePage(BasePage):
             messagebox.showerror("Validation Error", "First Name, CPF, and Email are required.")
             return
 
-        try:
-            user_api_client.update_user(self.current_user_id, payload)
-            messagebox.showinfo("Success", "User updated successfully!")
-            self.controller.show_page("UserPage")
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to update user: {e}")
+        user_id = self.current_user_id
+        self.submit_in_background(self.detail_form, lambda: user_api_client.update_user(user_id, payload),
+                                  self._on_user_updated, "Failed to update user")
+
+    def _on_user_updated(self, _result):
+        messagebox.showinfo("Success", "User updated successfully!")
+        self.return_to("UserPage")
 
     def _delete_user(self):
         if not self.current_user_id:
@@ -105,9 +113,10 @@ class UserUpdatePage(BasePage):
             return
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete user ID {self.current_user_id}?"):
-            try:
-                user_api_client.delete_user(self.current_user_id)
-                messagebox.showinfo("Success", "User deleted successfully (soft delete)!")
-                self.controller.show_page("UserPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete user: {e}")
+            user_id = self.current_user_id
+            self.submit_in_background(self.detail_form, lambda: user_api_client.delete_user(user_id),
+                                      self._on_user_deleted, "Failed to delete user")
+
+    def _on_user_deleted(self, _result):
+        messagebox.showinfo("Success", "User deleted successfully (soft delete)!")
+        self.return_to("UserPage")
@@ -2,9 +2,8 @@ from tkinter import messagebox, ttk
 from uuid import UUID
 
 from components.detail_form_component import DetailFormComponent
-from core.accounts_endpoints import account_api_client
-from core.users_endpoints import user_api_client
 from core.user_accounts_endpoints import users_accounts_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -34,8 +33,9 @@ class UserAccountsCreatePage(BasePage):
         ]
 
     def refresh(self, **kwargs):
-        self._fetch_all_users_and_accounts()
+        self.run_in_background(self._fetch_all_users_and_accounts, self._show_form)
 
+    def _show_form(self, _result=None):
         user_options = {user.get('first_name'): str(user.get('id')) for user in self.users_cache.values() if user and user.get('id') and user.get('first_name')}
         account_options = {account.get('name'): str(account.get('id')) for account in self.accounts_cache.values() if account and account.get('id') and account.get('name')}
 
@@ -66,13 +66,11 @@ class UserAccountsCreatePage(BasePage):
 
     def _fetch_all_users_and_accounts(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            accounts = account_api_client.get_all_accounts()
-            self.accounts_cache = {str(account["id"]): account for account in accounts if account and "id" in account}
+            self.users_cache = reference_store.get_index("users")
+            self.accounts_cache = reference_store.get_index("accounts")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or accounts for dropdowns: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or accounts for dropdowns: {e}")
 
     def _create_user_account(self):
         try:
@@ -92,22 +90,25 @@ class UserAccountsCreatePage(BasePage):
             user_uuid = UUID(user_id_val)
             account_uuid = UUID(account_id_val)
 
-            response = users_accounts_api_client.create_user_accounts(
-                user_id=user_uuid,
-                account_id=account_uuid
-            )
-
-            if response and isinstance(response, dict) and response.get('id'):
-                messagebox.showinfo("Success", "Relationship created successfully!")
-                self.controller.show_page("UserAccountsPage")
-            elif response and isinstance(response, dict) and response.get('message'):
-                messagebox.showerror("API Error", response.get('message'))
-            else:
-                error_message = f"Unknown error occurred. Unexpected API response format: {response}"
-                messagebox.showerror("API Error", error_message)
-
         except Exception as e:
             messagebox.showerror(
                 "Operation Failed",
                 f"Could not create relationship:\n{str(e)}"
-            )
\ No newline at end of file
+            )
+            return
+
+        self.submit_in_background(
+            self.detail_form,
+            lambda: users_accounts_api_client.create_user_accounts(user_id=user_uuid, account_id=account_uuid),
+            self._on_user_account_created, "Could not create relationship"
+        )
+
+    def _on_user_account_created(self, response):
+        if response and isinstance(response, dict) and response.get('id'):
+            messagebox.showinfo("Success", "Relationship created successfully!")
+            self.return_to("UserAccountsPage")
+        elif response and isinstance(response, dict) and response.get('message'):
+            messagebox.showerror("API Error", response.get('message'))
+        else:
+            error_message = f"Unknown error occurred. Unexpected API response format: {response}"
+            messagebox.showerror("API Error", error_message)
\ No newline at end of file
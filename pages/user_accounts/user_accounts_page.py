@@ -3,8 +3,8 @@ from tkinter import ttk, messagebox
 
 from components.list_box_component import ListBoxComponent
 from core.user_accounts_endpoints import users_accounts_api_client
-from core.users_endpoints import user_api_client
-from core.accounts_endpoints import account_api_client
+from core.fan_out import fan_out
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -52,44 +52,58 @@ class UserAccountsPage(BasePage):
                                                sticky="nsew")
         self.user_accounts_list_component.on_select(self._on_user_accounts_selected)
 
-        self._load_user_accounts()
-
     def _load_user_accounts(self):
-        try:
-            self._fetch_all_users_and_accounts()
-            user_accounts_raw_data = users_accounts_api_client.get_all_users_accounts()
-            self.user_accounts_data = user_accounts_raw_data
-
-            items_for_list = []
-            for user_account in user_accounts_raw_data:
-                user_id = user_account.get("user_id")
-                account_id = user_account.get("account_id")
-
-                user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
-                account_name = self.accounts_cache.get(str(account_id), {}).get("name", "Unknown Account")
-
-                row_values = [
-                    str(user_account.get("id", '')),
-                    user_name,
-                    account_name,
-                    user_account.get("created_at", '').split('T')[0] if isinstance(user_account.get("created_at"),
-                                                                                   str) else ''
-                ]
-                items_for_list.append(tuple(row_values))
-            self.user_accounts_list_component.set_items(items_for_list)
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to load User Accounts: {e}")
-            self.user_accounts_list_component.clear_list()
-
-    def _fetch_all_users_and_accounts(self):
-        try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            accounts = account_api_client.get_all_accounts()
-            self.accounts_cache = {str(account["id"]): account for account in accounts if account and "id" in account}
-        except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or accounts: {e}")
+        self.run_in_background(self._fetch_user_accounts, self._show_user_accounts, self._on_user_accounts_load_failed)
+
+    def _fetch_user_accounts(self):
+        user_accounts_raw_data = self._fetch_all_users_and_accounts(
+            user_accounts=users_accounts_api_client.get_all_users_accounts
+        )["user_accounts"]
+        if isinstance(user_accounts_raw_data, Exception):
+            raise user_accounts_raw_data
+
+        items_for_list = []
+        for user_account in user_accounts_raw_data:
+            user_id = user_account.get("user_id")
+            account_id = user_account.get("account_id")
+
+            user_name = self.users_cache.get(str(user_id), {}).get("first_name", "Unknown User")
+            account_name = self.accounts_cache.get(str(account_id), {}).get("name", "Unknown Account")
+
+            row_values = [
+                str(user_account.get("id", '')),
+                user_name,
+                account_name,
+                user_account.get("created_at", '').split('T')[0] if isinstance(user_account.get("created_at"),
+                                                                               str) else ''
+            ]
+            items_for_list.append(tuple(row_values))
+        return user_accounts_raw_data, items_for_list
+
+    def _show_user_accounts(self, result):
+        self.user_accounts_data, items_for_list = result
+        self.user_accounts_list_component.set_items(items_for_list)
+
+    def _on_user_accounts_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load User Accounts: {e}")
+        self.user_accounts_list_component.clear_list()
+
+    def _fetch_all_users_and_accounts(self, **other_calls):
+        results = fan_out({
+            "users": lambda: reference_store.get_index("users"),
+            "accounts": lambda: reference_store.get_index("accounts"),
+            **other_calls
+        }, return_exceptions=True)
+
+        users, accounts = results.pop("users"), results.pop("accounts")
+        error = next((value for value in (users, accounts) if isinstance(value, Exception)), None)
+        if error is not None:
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or accounts: {error}")
+        else:
+            self.users_cache = users
+            self.accounts_cache = accounts
+        return results
 
     def _on_user_accounts_selected(self, selected_values):
         if selected_values:
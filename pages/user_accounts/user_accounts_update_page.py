@@ -3,8 +3,7 @@ from uuid import UUID
 
 from components.detail_form_component import DetailFormComponent
 from core.user_accounts_endpoints import users_accounts_api_client
-from core.users_endpoints import user_api_client
-from core.accounts_endpoints import account_api_client
+from core.reference_store import reference_store
 from pages.base_page import BasePage
 
 
@@ -12,6 +11,7 @@ class UserAccountsUpdatePage(BasePage):
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, controller, *args, **kwargs)
         self.current_user_account_id = None
+        self._loaded_user_account = None
         self.users_cache = {}
         self.accounts_cache = {}
         self.detail_form = None
@@ -52,79 +52,82 @@ class UserAccountsUpdatePage(BasePage):
         self.detail_form.grid(row=1, column=1, padx=20, pady=20, sticky="nsew")
 
     def refresh(self, user_account_id=None):
-        self._fetch_all_users_and_accounts()
-
         if user_account_id:
             try:
                 self.current_user_account_id = UUID(str(user_account_id))
-                user_account_data = users_accounts_api_client.get_users_accounts_by_id(self.current_user_account_id)
+            except ValueError:
+                messagebox.showerror("Error", f"Invalid User Account ID format: {user_account_id}")
+                self._reset_form_and_navigate_back()
+                return
 
-                if user_account_data is None:
-                    messagebox.showerror("Error", f"User Account with ID {user_account_id} not found.")
-                    self._reset_form_and_navigate_back()
-                    return
+            current_id = self.current_user_account_id
+            self.run_in_background(lambda: self._fetch_user_account(current_id), self._show_user_account,
+                                   self._on_user_account_load_failed)
+        else:
+            messagebox.showwarning("Warning", "No user account selected for deletion. Returning to list.")
+            self._reset_form_and_navigate_back()
 
-                user_id = user_account_data.get('user_id')
-                account_id = user_account_data.get('account_id')
+    def _fetch_user_account(self, user_account_id):
+        self._fetch_all_users_and_accounts()
+        return users_accounts_api_client.get_users_accounts_by_id(user_account_id)
 
-                user_name = self.users_cache.get(str(user_id), {}).get('first_name', 'Unknown User')
-                account_name = self.accounts_cache.get(str(account_id), {}).get('name', 'Unknown Account')
+    def _show_user_account(self, user_account_data):
+        if user_account_data is None:
+            messagebox.showerror("Error", f"User Account with ID {self.current_user_account_id} not found.")
+            self._reset_form_and_navigate_back()
+            return
 
-                created_at_val = user_account_data.get('created_at', '')
-                if isinstance(created_at_val, str) and 'T' in created_at_val:
-                    created_at_val = created_at_val.split('T')[0]  # Only date part
+        self._loaded_user_account = user_account_data
+        user_id = user_account_data.get('user_id')
+        account_id = user_account_data.get('account_id')
 
-                display_data = {
-                    'id': str(user_account_data.get('id', '')),
-                    'user_name': user_name,
-                    'account_name': account_name,
-                    'user_id': str(user_id) if user_id else '',
-                    'account_id': str(account_id) if account_id else '',
-                    'created_at': created_at_val
-                }
+        user_name = self.users_cache.get(str(user_id), {}).get('first_name', 'Unknown User')
+        account_name = self.accounts_cache.get(str(account_id), {}).get('name', 'Unknown Account')
 
-                self.detail_form.set_data(display_data)
+        created_at_val = user_account_data.get('created_at', '')
+        if isinstance(created_at_val, str) and 'T' in created_at_val:
+            created_at_val = created_at_val.split('T')[0]  # Only date part
 
-                if self.controller:
-                    self.controller.title(f"Delete User Account - {user_name} - {account_name}")
-            except ValueError:
-                messagebox.showerror("Error", f"Invalid User Account ID format: {user_account_id}")
-                self._reset_form_and_navigate_back()
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to load user account details: {e}")
-                self._reset_form_and_navigate_back()
-        else:
-            messagebox.showwarning("Warning", "No user account selected for deletion. Returning to list.")
-            self._reset_form_and_navigate_back()
+        display_data = {
+            'id': str(user_account_data.get('id', '')),
+            'user_name': user_name,
+            'account_name': account_name,
+            'user_id': str(user_id) if user_id else '',
+            'account_id': str(account_id) if account_id else '',
+            'created_at': created_at_val
+        }
+
+        self.detail_form.set_data(display_data)
+
+        if self.controller:
+            self.controller.title(f"Delete User Account - {user_name} - {account_name}")
+
+    def _on_user_account_load_failed(self, e):
+        messagebox.showerror("API Error", f"Failed to load user account details: {e}")
+        self._reset_form_and_navigate_back()
 
     def _fetch_all_users_and_accounts(self):
         try:
-            users = user_api_client.get_all_users()
-            self.users_cache = {str(user["id"]): user for user in users if user and "id" in user}
-
-            accounts = account_api_client.get_all_accounts()
-            self.accounts_cache = {str(account["id"]): account for account in accounts if account and "id" in account}
+            self.users_cache = reference_store.get_index("users")
+            self.accounts_cache = reference_store.get_index("accounts")
         except Exception as e:
-            messagebox.showwarning("Data Load Warning", f"Could not load all users or accounts for display: {e}")
+            self.post_to_ui(messagebox.showwarning, "Data Load Warning",
+                            f"Could not load all users or accounts for display: {e}")
 
     def _reset_form_and_navigate_back(self):
         if self.detail_form:  
             self.detail_form.set_data({})
         self.current_user_account_id = None
+        self._loaded_user_account = None
         self.controller.show_page("UserAccountsPage")
 
     def _delete_user_account_relationship(self):
-        if not self.current_user_account_id:
+        if not self.current_user_account_id or self._loaded_user_account is None:
             messagebox.showerror("Error", "No User Account relationship selected for deletion.")
             return
 
-        try:
-            current_data = users_accounts_api_client.get_users_accounts_by_id(self.current_user_account_id)
-            user_id = current_data.get('user_id')
-            account_id = current_data.get('account_id')
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to retrieve User ID and Account ID for deletion: {e}")
-            return  
+        user_id = self._loaded_user_account.get('user_id')
+        account_id = self._loaded_user_account.get('account_id')
 
         if not user_id or not account_id:
             messagebox.showerror("Error", "Could not retrieve User ID or Account ID for deletion.")
@@ -133,9 +136,12 @@ class UserAccountsUpdatePage(BasePage):
         if messagebox.askyesno("Confirm Delete",
                                f"Are you sure you want to delete the relationship between User '{self.users_cache.get(str(user_id), {}).get('first_name', 'Unknown')}' "
                                f"and Account '{self.accounts_cache.get(str(account_id), {}).get('name', 'Unknown')}'?"):
-            try:
-                users_accounts_api_client.delete_users_accounts(UUID(str(user_id)), UUID(str(account_id)))
-                messagebox.showinfo("Success", "User Account relationship deleted successfully!")
-                self.controller.show_page("UserAccountsPage")
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to delete User Account relationship: {e}")
\ No newline at end of file
+            self.submit_in_background(
+                self.detail_form,
+                lambda: users_accounts_api_client.delete_users_accounts(UUID(str(user_id)), UUID(str(account_id))),
+                self._on_user_account_deleted, "Failed to delete User Account relationship"
+            )
+
+    def _on_user_account_deleted(self, _result):
+        messagebox.showinfo("Success", "User Account relationship deleted successfully!")
+        self.return_to("UserAccountsPage")
\ No newline at end of file